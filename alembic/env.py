@@ -9,6 +9,7 @@ from app.common.database.models.base import Base
 from app.common.database.models.reservation import Reservation  # noqa
 from app.common.database.models.slot import Slot  # noqa
 from app.common.database.models.user import User  # noqa
+from app.common.database.models.waitlist import WaitlistEntry  # noqa
 from app.config import settings
 
 sys.path.append(os.getcwd())
@@ -0,0 +1,31 @@
+"""reservation keyset pagination indexes
+
+Revision ID: 3f2c8a1d9b47
+Revises: 1961a54ab7e1
+Create Date: 2026-10-17 10:12:43.218305
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3f2c8a1d9b47"
+down_revision: Union[str, None] = "1961a54ab7e1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("idx_reservations_exam_date_id", "reservations", ["exam_date", "id"], unique=False)
+    op.create_index(
+        "idx_reservations_user_id_exam_date_id", "reservations", ["user_id", "exam_date", "id"], unique=False
+    )
+    op.drop_index("idx_reservations_exam_date", table_name="reservations")
+
+
+def downgrade() -> None:
+    op.create_index("idx_reservations_exam_date", "reservations", ["exam_date"], unique=False)
+    op.drop_index("idx_reservations_user_id_exam_date_id", table_name="reservations")
+    op.drop_index("idx_reservations_exam_date_id", table_name="reservations")
@@ -0,0 +1,60 @@
+"""waitlist entries
+
+Revision ID: 7b1e4c2d8f63
+Revises: 3f2c8a1d9b47
+Create Date: 2026-10-17 15:40:12.583921
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7b1e4c2d8f63"
+down_revision: Union[str, None] = "3f2c8a1d9b47"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "waitlist_entries",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("exam_date", sa.Date(), nullable=False),
+        sa.Column("exam_start_time", sa.Time(), nullable=False),
+        sa.Column("exam_end_time", sa.Time(), nullable=False),
+        sa.Column("applicants", sa.Integer(), nullable=False),
+        sa.Column("status", postgresql.ENUM("WAITING", "PROMOTED", name="waitlist_status"), nullable=False),
+        sa.Column("reservation_id", sa.Integer(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.current_timestamp(),
+            nullable=False,
+        ),
+        sa.CheckConstraint("exam_end_time > exam_start_time", name="check_waitlist_exam_time_valid"),
+        sa.ForeignKeyConstraint(["reservation_id"], ["reservations.id"], ondelete="SET NULL"),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_waitlist_entries_id"), "waitlist_entries", ["id"], unique=False)
+    op.create_index(
+        "idx_waitlist_entries_waiting",
+        "waitlist_entries",
+        ["exam_date", "id"],
+        unique=False,
+        postgresql_where=sa.text("status = 'WAITING'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_waitlist_entries_waiting", table_name="waitlist_entries")
+    op.drop_index(op.f("ix_waitlist_entries_id"), table_name="waitlist_entries")
+    op.drop_table("waitlist_entries")
+    postgresql.ENUM(name="waitlist_status").drop(op.get_bind(), checkfirst=True)
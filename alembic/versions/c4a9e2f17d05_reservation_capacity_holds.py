@@ -0,0 +1,35 @@
+"""reservation capacity holds
+
+Revision ID: c4a9e2f17d05
+Revises: 7b1e4c2d8f63
+Create Date: 2026-10-17 17:05:31.904217
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c4a9e2f17d05"
+down_revision: Union[str, None] = "7b1e4c2d8f63"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("reservations", sa.Column("hold_expires_at", sa.DateTime(timezone=True), nullable=True))
+    op.create_index(
+        "idx_reservations_hold_expires_at",
+        "reservations",
+        ["hold_expires_at"],
+        unique=False,
+        postgresql_where=sa.text("hold_expires_at IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_reservations_hold_expires_at", table_name="reservations")
+    op.drop_column("reservations", "hold_expires_at")
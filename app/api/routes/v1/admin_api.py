@@ -1,12 +1,27 @@
 import logging
+from typing import Annotated
 
 from dependency_injector.wiring import Provide, inject
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 
 from app.common.auth.get_current_user import get_current_user
+from app.common.constants import ExportFormat
+from app.common.responses import FastJSONResponse
 from app.container import Container
-from app.schemas.reservation_schema import ConfirmReservationResponse, ReservationListResponse
+from app.schemas.metrics_schema import CacheStatsResponse, DatabasePoolStatsResponse
+from app.schemas.reservation_schema import (
+    BatchConfirmReservationRequest,
+    BatchConfirmReservationResponse,
+    ConfirmReservationResponse,
+    ReservationExportQuery,
+    ReservationListQuery,
+    ReservationListResponse,
+)
+from app.schemas.slot_schema import SlotGenerateRequest, SlotGenerateResponse
+from app.services.metrics_service import MetricsService
 from app.services.reservation_service import ReservationService
+from app.services.slot_service import SlotService
 
 logger = logging.getLogger(__name__)
 
@@ -33,15 +48,111 @@ async def confirm_reservation(
         raise HTTPException(status_code=400, detail=str(e))
 
 
+@router.post(
+    "/reservations/confirm",
+    response_model=BatchConfirmReservationResponse,
+    response_class=FastJSONResponse,
+    status_code=status.HTTP_200_OK,
+)
+@inject
+async def confirm_reservations_batch(
+    body: BatchConfirmReservationRequest,
+    user_info: dict = Depends(get_current_user),
+    reservation_service: ReservationService = Depends(Provide[Container.reservation_service]),
+) -> FastJSONResponse:
+    try:
+        response = await reservation_service.confirm_reservations_batch(body.reservation_ids, user_info["type"])
+        logger.info(f"Batch confirmed {response.confirmed_count}/{len(response.results)} reservations.")
+        return FastJSONResponse(response)
+    except Exception as e:
+        logger.error(f"Error confirming reservations in batch: {str(e)}")
+        raise HTTPException(status_code=400, detail=str(e))
+
+
 @router.get(
     "/reservations",
     response_model=ReservationListResponse,
+    response_class=FastJSONResponse,
     status_code=status.HTTP_200_OK,
 )
 @inject
 async def get_reservations_by_admin(
+    query: Annotated[ReservationListQuery, Query()],
     user_info: dict = Depends(get_current_user),
     reservation_service: ReservationService = Depends(Provide[Container.reservation_service]),
-) -> ReservationListResponse:
+) -> FastJSONResponse:
     user_type = user_info["type"]
-    return await reservation_service.get_reservations_by_admin(user_type)
+    try:
+        return FastJSONResponse(await reservation_service.get_reservations_by_admin(user_type, query))
+    except ValueError as e:
+        logger.error(f"Error listing reservations: {str(e)}")
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@router.get(
+    "/reservations/export",
+    status_code=status.HTTP_200_OK,
+)
+@inject
+async def export_reservations(
+    query: Annotated[ReservationExportQuery, Query()],
+    user_info: dict = Depends(get_current_user),
+    reservation_service: ReservationService = Depends(Provide[Container.reservation_service]),
+) -> StreamingResponse:
+    try:
+        chunks = await reservation_service.export_reservations(user_info["type"], query)
+    except Exception as e:
+        logger.error(f"Error exporting reservations: {str(e)}")
+        raise HTTPException(status_code=400, detail=str(e))
+    media_type = "text/csv" if query.format == ExportFormat.CSV else "application/x-ndjson"
+    return StreamingResponse(
+        chunks,
+        media_type=media_type,
+        headers={"Content-Disposition": f"attachment; filename=reservations.{query.format.value}"},
+    )
+
+
+@router.post(
+    "/slots/generate",
+    response_model=SlotGenerateResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+@inject
+async def generate_slots(
+    body: SlotGenerateRequest,
+    user_info: dict = Depends(get_current_user),
+    slot_service: SlotService = Depends(Provide[Container.slot_service]),
+) -> SlotGenerateResponse:
+    try:
+        response = await slot_service.generate_slots(body, user_info["type"])
+        logger.info(f"Slots generated: {response.created_count} created, {response.skipped_count} skipped.")
+        return response
+    except Exception as e:
+        logger.error(f"Error generating slots: {str(e)}")
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.get(
+    "/metrics/availability-cache",
+    response_model=CacheStatsResponse,
+    status_code=status.HTTP_200_OK,
+)
+@inject
+async def get_availability_cache_stats(
+    user_info: dict = Depends(get_current_user),
+    reservation_service: ReservationService = Depends(Provide[Container.reservation_service]),
+) -> CacheStatsResponse:
+    return await reservation_service.get_availability_cache_stats(user_info["type"])
+
+
+@router.get(
+    "/metrics/db-pool",
+    response_model=DatabasePoolStatsResponse,
+    status_code=status.HTTP_200_OK,
+)
+@inject
+async def get_db_pool_stats(
+    user_info: dict = Depends(get_current_user),
+    metrics_service: MetricsService = Depends(Provide[Container.metrics_service]),
+) -> DatabasePoolStatsResponse:
+    return await metrics_service.get_db_pool_stats(user_info["type"])
@@ -1,19 +1,28 @@
 import datetime
 import logging
+from typing import Annotated
 
 from dependency_injector.wiring import Provide, inject
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 
 from app.common.auth.get_current_user import get_current_user
+from app.common.responses import FastJSONResponse
 from app.container import Container
 from app.schemas.reservation_schema import (
+    AvailabilityCalendarResponse,
     AvailableReservationResponse,
     DeleteReservationResponse,
+    FeasibilityCheckRequest,
+    FeasibilityCheckResponse,
+    ReservationBulkCreateRequest,
+    ReservationBulkCreateResponse,
     ReservationCreateRequest,
+    ReservationListQuery,
     ReservationListResponse,
     ReservationResponse,
     ReservationUpdateRequest,
     ReservationUpdateResponse,
+    WaitlistEntryResponse,
 )
 from app.services.reservation_service import ReservationService
 
@@ -36,31 +45,136 @@ async def create_reservation(
     return await reservation_service.create_reservation(body, user_id)
 
 
+@router.post(
+    "/bulk",
+    response_model=ReservationBulkCreateResponse,
+    response_class=FastJSONResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+@inject
+async def create_reservations_bulk(
+    body: ReservationBulkCreateRequest,
+    user_info: dict = Depends(get_current_user),
+    reservation_service: ReservationService = Depends(Provide[Container.reservation_service]),
+) -> FastJSONResponse:
+    try:
+        user_id = user_info["user_id"]
+        return FastJSONResponse(
+            await reservation_service.create_reservations_bulk(body, user_id), status_code=status.HTTP_201_CREATED
+        )
+    except Exception as e:
+        logger.error(f"[api/reservation_api] create_reservations_bulk error: {e}")
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@router.post(
+    "/waitlist",
+    response_model=WaitlistEntryResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+@inject
+async def join_waitlist(
+    body: ReservationCreateRequest,
+    user_info: dict = Depends(get_current_user),
+    reservation_service: ReservationService = Depends(Provide[Container.reservation_service]),
+) -> WaitlistEntryResponse:
+    try:
+        user_id = user_info["user_id"]
+        return await reservation_service.join_waitlist(body, user_id)
+    except Exception as e:
+        logger.error(f"[api/reservation_api] join_waitlist error: {e}")
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@router.get(
+    "/waitlist/{waitlist_id}",
+    response_model=WaitlistEntryResponse,
+    status_code=status.HTTP_200_OK,
+)
+@inject
+async def get_waitlist_entry(
+    waitlist_id: int,
+    user_info: dict = Depends(get_current_user),
+    reservation_service: ReservationService = Depends(Provide[Container.reservation_service]),
+) -> WaitlistEntryResponse:
+    try:
+        user_id = user_info["user_id"]
+        user_type = user_info["type"]
+        return await reservation_service.get_waitlist_entry(waitlist_id, user_id, user_type)
+    except Exception as e:
+        logger.error(f"[api/reservation_api] get_waitlist_entry error: {e}")
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
 @router.get(
     "/available",
     response_model=AvailableReservationResponse,
+    response_class=FastJSONResponse,
     status_code=status.HTTP_200_OK,
 )
 @inject
 async def get_available_reservation(
     date: datetime.date,
     reservation_service: ReservationService = Depends(Provide[Container.reservation_service]),
-) -> AvailableReservationResponse:
-    return await reservation_service.get_available_reservation(date)
+) -> FastJSONResponse:
+    return FastJSONResponse(await reservation_service.get_available_reservation(date))
+
+
+@router.get(
+    "/calendar",
+    response_model=AvailabilityCalendarResponse,
+    response_class=FastJSONResponse,
+    status_code=status.HTTP_200_OK,
+)
+@inject
+async def get_availability_calendar(
+    start_date: datetime.date,
+    end_date: datetime.date,
+    reservation_service: ReservationService = Depends(Provide[Container.reservation_service]),
+) -> FastJSONResponse:
+    try:
+        return FastJSONResponse(await reservation_service.get_availability_calendar(start_date, end_date))
+    except ValueError as e:
+        logger.error(f"[api/reservation_api] get_availability_calendar error: {e}")
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@router.post(
+    "/feasibility",
+    response_model=FeasibilityCheckResponse,
+    response_class=FastJSONResponse,
+    status_code=status.HTTP_200_OK,
+)
+@inject
+async def check_feasibility(
+    body: FeasibilityCheckRequest,
+    reservation_service: ReservationService = Depends(Provide[Container.reservation_service]),
+) -> FastJSONResponse:
+    try:
+        return FastJSONResponse(await reservation_service.check_feasibility(body))
+    except Exception as e:
+        logger.error(f"[api/reservation_api] check_feasibility error: {e}")
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
 @router.get(
     "/",
     response_model=ReservationListResponse,
+    response_class=FastJSONResponse,
     status_code=status.HTTP_200_OK,
 )
 @inject
 async def get_reservations(
+    query: Annotated[ReservationListQuery, Query()],
     user_info: dict = Depends(get_current_user),
     reservation_service: ReservationService = Depends(Provide[Container.reservation_service]),
-) -> ReservationListResponse:
+) -> FastJSONResponse:
     user_id = user_info["user_id"]
-    return await reservation_service.get_reservations_by_user(user_id)
+    try:
+        return FastJSONResponse(await reservation_service.get_reservations_by_user(user_id, query))
+    except ValueError as e:
+        logger.error(f"[api/reservation_api] get_reservations error: {e}")
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
 @router.patch(
@@ -0,0 +1,47 @@
+# 슬롯 일괄 생성 커맨드
+# 사용법: python -m app.commands.generate_slots --start-date 2024-12-01 --end-date 2024-12-31 --interval 30
+import argparse
+import asyncio
+from datetime import date, time
+
+from app.common.constants import UserType
+from app.container import Container
+from app.schemas.slot_schema import SlotGenerateRequest
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="기간 및 간격 단위로 예약 슬롯을 생성합니다.")
+    parser.add_argument("--start-date", type=date.fromisoformat, required=True, help="시작 날짜 (YYYY-MM-DD)")
+    parser.add_argument("--end-date", type=date.fromisoformat, required=True, help="종료 날짜 (YYYY-MM-DD)")
+    parser.add_argument("--start-time", type=time.fromisoformat, default=time(9, 0), help="하루 시작 시간 (UTC, HH:MM)")
+    parser.add_argument("--end-time", type=time.fromisoformat, default=time(18, 0), help="하루 종료 시간 (UTC, HH:MM)")
+    parser.add_argument("--interval", type=int, default=30, help="슬롯 간격 (분)")
+    parser.add_argument("--capacity", type=int, default=None, help="슬롯 수용 인원 (기본값: MAX_APPLICANTS)")
+    return parser.parse_args()
+
+
+async def main() -> None:
+    args = parse_args()
+    container = Container()
+    await container.db().connect()
+    slot_service = container.slot_service()
+
+    response = await slot_service.generate_slots(
+        SlotGenerateRequest(
+            start_date=args.start_date,
+            end_date=args.end_date,
+            start_time=args.start_time,
+            end_time=args.end_time,
+            interval_minutes=args.interval,
+            capacity=args.capacity,
+        ),
+        UserType.ADMIN,
+    )
+    print(
+        f"requested: {response.requested_count}, created: {response.created_count}, skipped: {response.skipped_count}"
+    )
+    await container.db().disconnect()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,99 @@
+import asyncio
+import base64
+import hashlib
+import hmac
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+SCRYPT_PREFIX = "scrypt"
+SCRYPT_SALT_BYTES = 16
+SCRYPT_KEY_BYTES = 32
+
+
+class PasswordHasher:
+    """
+    scrypt 기반 비밀번호 해시
+    - scrypt 는 CPU/메모리를 많이 쓰므로 이벤트 루프가 아닌 전용 스레드 풀에서 실행한다.
+      (hashlib.scrypt 는 실행 중 GIL 을 놓는다)
+    - 동시 실행 수를 max_workers 로 제한하여 로그인이 몰려도 예약 요청 처리에 쓸 CPU 를 남겨둔다.
+      초과 요청은 세마포어에서 대기한다.
+    - 저장 형식: `scrypt$n$r$p$salt$hash` (salt, hash 는 base64)
+    - 이전 버전의 sha256 hex 해시도 검증하며, needs_rehash 로 재해시 대상을 확인한다.
+    """
+
+    def __init__(self, max_workers: int = 2, n: int = 2**14, r: int = 8, p: int = 1) -> None:
+        self.n = n
+        self.r = r
+        self.p = p
+        self.max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._semaphore = asyncio.Semaphore(max_workers)
+
+    async def hash(self, password: str) -> str:
+        salt = os.urandom(SCRYPT_SALT_BYTES)
+        derived_key = await self._run_scrypt(password, salt, self.n, self.r, self.p)
+        return "$".join(
+            [
+                SCRYPT_PREFIX,
+                str(self.n),
+                str(self.r),
+                str(self.p),
+                base64.b64encode(salt).decode(),
+                base64.b64encode(derived_key).decode(),
+            ]
+        )
+
+    async def verify(self, password: str, hashed_password: Optional[str]) -> bool:
+        if not hashed_password:
+            return False
+        if self._is_legacy(hashed_password):
+            legacy_hash = hashlib.sha256(password.encode()).hexdigest()
+            return hmac.compare_digest(legacy_hash, hashed_password)
+
+        try:
+            _, n, r, p, salt, expected_key = hashed_password.split("$")
+            salt, expected_key = base64.b64decode(salt), base64.b64decode(expected_key)
+            n, r, p = int(n), int(r), int(p)
+        except ValueError:
+            return False
+        derived_key = await self._run_scrypt(password, salt, n, r, p, len(expected_key))
+        return hmac.compare_digest(derived_key, expected_key)
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        if self._is_legacy(hashed_password):
+            return True
+        return not hashed_password.startswith(f"{SCRYPT_PREFIX}${self.n}${self.r}${self.p}$")
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    async def _run_scrypt(
+        self, password: str, salt: bytes, n: int, r: int, p: int, key_bytes: int = SCRYPT_KEY_BYTES
+    ) -> bytes:
+        async with self._semaphore:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._get_executor(),
+                lambda: hashlib.scrypt(
+                    password.encode(),
+                    salt=salt,
+                    n=n,
+                    r=r,
+                    p=p,
+                    # 필요 메모리(128 * n * r * p)보다 여유 있게 지정한다 (기본값 32MB)
+                    maxmem=256 * n * r * p,
+                    dklen=key_bytes,
+                ),
+            )
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="password-hasher")
+        return self._executor
+
+    @staticmethod
+    def _is_legacy(hashed_password: str) -> bool:
+        return not hashed_password.startswith(f"{SCRYPT_PREFIX}$")
@@ -1,17 +1,29 @@
+import hashlib
 import logging
+import time
+from typing import Callable, Optional
 
 from fastapi import Request
 
 from app.common.auth.jwt_service import JWTService
 from app.common.auth.strategies.base_strategy import AuthStrategy
+from app.common.cache.ttl_cache import TTLCache
 from app.common.exceptions import JwtError
 
 logger = logging.getLogger(__name__)
 
 
 class JWTAuthStrategy(AuthStrategy):
-    def __init__(self, jwt_service: JWTService):
+    def __init__(
+        self,
+        jwt_service: JWTService,
+        token_cache: Optional[TTLCache] = None,
+        clock: Callable[[], float] = time.time,
+    ):
         self.jwt_service = jwt_service
+        # 검증된 토큰의 claims 캐시 (key: 토큰의 sha256 digest, 토큰의 exp 까지만 보관)
+        self.token_cache = token_cache
+        self.clock = clock
 
     async def authenticate(self, request: Request) -> dict:
         auth_header = request.headers.get("Authorization") or request.headers.get("authorization")
@@ -19,12 +31,24 @@ class JWTAuthStrategy(AuthStrategy):
             raise JwtError("Authorization 헤더가 없습니다.")
 
         token = auth_header.split(" ")[1]
+        token_digest = hashlib.sha256(token.encode()).digest() if self.token_cache is not None else None
+        if token_digest is not None:
+            cached_auth_data = self.token_cache.get(token_digest)
+            if cached_auth_data is not None:
+                return dict(cached_auth_data)
+
         try:
             decoded_data = self.jwt_service.verify_token(token)
-            return {
+            auth_data = {
                 "user_id": decoded_data.get("user_id"),
                 "type": decoded_data.get("type"),
             }
         except Exception as e:
             logger.error(f"JWT 인증 실패: {e}")
             raise JwtError(str(e))
+
+        if token_digest is not None and decoded_data.get("exp") is not None:
+            # 캐시 ttl 과 토큰 만료까지 남은 시간 중 짧은 쪽만큼 보관한다 (검증에 실패한 토큰은 캐시하지 않는다)
+            ttl_seconds = min(self.token_cache.ttl_seconds, decoded_data["exp"] - self.clock())
+            self.token_cache.set(token_digest, auth_data, ttl_seconds=ttl_seconds)
+        return dict(auth_data)
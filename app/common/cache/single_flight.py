@@ -0,0 +1,33 @@
+import asyncio
+from typing import Awaitable, Callable, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    동일한 키로 동시에 들어온 요청이 하나의 실행 결과를 공유하도록 한다.
+    - 처음 요청한 코루틴이 작업(Task)을 생성하고, 이후 요청은 같은 작업이 끝나기를 기다린다.
+    - 작업은 별도 Task 로 실행되므로 먼저 요청한 클라이언트가 취소되어도 나머지 요청은 결과를 받는다.
+    - 작업이 끝나면 키를 제거하므로 결과를 캐시하지는 않는다.
+    """
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.coalesced = 0
+        self._tasks: dict[Hashable, asyncio.Task] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        task = self._tasks.get(key)
+        if task is None:
+            self.calls += 1
+            task = asyncio.ensure_future(fn())
+            self._tasks[key] = task
+            task.add_done_callback(lambda done_task: self._forget(key, done_task))
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
@@ -0,0 +1,182 @@
+import time
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from datetime import date
+from datetime import time as dt_time
+from typing import Callable, Iterable, Optional
+
+
+class _MinSegmentTree:
+    """구간 최소값 조회 O(log n), 값 갱신 O(log n) 세그먼트 트리"""
+
+    def __init__(self, values: list[int]) -> None:
+        self.size = len(values)
+        self.tree = [0] * self.size + list(values)
+        for i in range(self.size - 1, 0, -1):
+            self.tree[i] = min(self.tree[2 * i], self.tree[2 * i + 1])
+
+    def update(self, position: int, value: int) -> None:
+        i = position + self.size
+        self.tree[i] = value
+        i //= 2
+        while i >= 1:
+            self.tree[i] = min(self.tree[2 * i], self.tree[2 * i + 1])
+            i //= 2
+
+    def query(self, lo: int, hi: int) -> int:
+        """[lo, hi) 구간의 최소값"""
+        result = None
+        lo += self.size
+        hi += self.size
+        while lo < hi:
+            if lo & 1:
+                result = self.tree[lo] if result is None else min(result, self.tree[lo])
+                lo += 1
+            if hi & 1:
+                hi -= 1
+                result = self.tree[hi] if result is None else min(result, self.tree[hi])
+            lo //= 2
+            hi //= 2
+        return result
+
+
+class _DateSlots:
+    """하루치 슬롯을 시작 시간 기준으로 정렬하여 보관한다"""
+
+    def __init__(self, expires_at: float) -> None:
+        self.expires_at = expires_at
+        self.keys: list[tuple[dt_time, dt_time, int]] = []
+        self.starts: list[dt_time] = []
+        self.ends: list[dt_time] = []
+        self.positions: dict[int, int] = {}
+        self.capacities = _MinSegmentTree([])
+        # 슬롯끼리 겹치지 않으면(종료 시간도 정렬되어 있으면) 겹치는 슬롯은 연속된 구간이 된다
+        self.ends_sorted = True
+
+    def put(self, slots: Iterable[tuple[int, dt_time, dt_time, int]]) -> None:
+        """
+        (slot_id, start_time, end_time, remaining_capacity) 목록을 반영한다.
+        이미 있는 슬롯은 남은 인원만 갱신하고, 새 슬롯은 모아서 한 번만 정렬/재구성한다 (호출당 O(n log n)).
+        """
+        new_slots = {}
+        for slot_id, start_time, end_time, remaining_capacity in slots:
+            if slot_id in self.positions:
+                self.capacities.update(self.positions[slot_id], remaining_capacity)
+            else:
+                new_slots[slot_id] = (start_time, end_time, remaining_capacity)
+        if not new_slots:
+            return
+
+        values = {key[2]: self.capacity(key[2]) for key in self.keys}
+        values.update((slot_id, new_slot[2]) for slot_id, new_slot in new_slots.items())
+        self.keys = sorted(
+            self.keys + [(start_time, end_time, slot_id) for slot_id, (start_time, end_time, _) in new_slots.items()]
+        )
+        self.starts = [key[0] for key in self.keys]
+        self.ends = [key[1] for key in self.keys]
+        self.positions = {key[2]: position for position, key in enumerate(self.keys)}
+        self.capacities = _MinSegmentTree([values[key[2]] for key in self.keys])
+        self.ends_sorted = all(self.ends[i] <= self.ends[i + 1] for i in range(len(self.ends) - 1))
+
+    def capacity(self, slot_id: int) -> int:
+        return self.capacities.tree[self.positions[slot_id] + self.capacities.size]
+
+    def add_capacity(self, slot_id: int, delta: int) -> None:
+        if slot_id in self.positions:
+            self.capacities.update(self.positions[slot_id], self.capacity(slot_id) + delta)
+
+    def min_capacity(self, start_time: dt_time, end_time: dt_time) -> Optional[int]:
+        if self.ends_sorted:
+            lo, hi = self._overlapping_range(start_time, end_time)
+            return self.capacities.query(lo, hi) if lo < hi else None
+        capacities = [self.capacity(slot_id) for slot_id in self.overlapping_slot_ids(start_time, end_time)]
+        return min(capacities) if capacities else None
+
+    def overlapping_slot_ids(self, start_time: dt_time, end_time: dt_time) -> list[int]:
+        if self.ends_sorted:
+            lo, hi = self._overlapping_range(start_time, end_time)
+            return [key[2] for key in self.keys[lo:hi]]
+        return [key[2] for key in self.keys if key[0] <= end_time and key[1] >= start_time]
+
+    def _overlapping_range(self, start_time: dt_time, end_time: dt_time) -> tuple[int, int]:
+        # 슬롯과 조회 구간 모두 '[]' 범위이므로 slot.start <= end_time and slot.end >= start_time 이면 겹친다
+        return bisect_left(self.ends, start_time), bisect_right(self.starts, end_time)
+
+
+class SlotIndex:
+    """
+    날짜별 슬롯 시간대와 남은 인원을 보관하는 인메모리 인덱스
+    - 슬롯은 시작/종료 시간으로 정렬되며, 남은 인원은 세그먼트 트리로 보관하여 구간 최소값을 O(log n) 에 조회한다.
+    - DB 조회 결과와 확정/삭제로 인한 차감/복구 결과로 갱신된다.
+    - 알고 있는 슬롯만으로 판단하므로 예약 불가능한 요청을 DB 조회 없이 거절하는 사전 검사에만 사용한다.
+    - 실제 차감은 항상 DB 에서 수행하며, 다른 프로세스의 변경은 ttl_seconds 이후 다시 조회하여 반영한다.
+    """
+
+    MAX_DATES = 366
+
+    def __init__(self, ttl_seconds: float, clock: Callable[[], float] = time.monotonic) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.clock = clock
+        self._dates: dict[date, _DateSlots] = {}
+
+    def put_slots(self, slots: Iterable) -> None:
+        slots_by_date = defaultdict(list)
+        for slot in slots:
+            slots_by_date[slot.date].append((slot.id, slot.start_time, slot.end_time, slot.remaining_capacity))
+        for slot_date, date_slots in slots_by_date.items():
+            self._get_or_create(slot_date).put(date_slots)
+
+    def apply_capacity_delta(self, exam_date: date, slot_ids: Iterable[int], delta: int) -> None:
+        date_slots = self._get(exam_date)
+        if date_slots is None:
+            return
+        for slot_id in slot_ids:
+            date_slots.add_capacity(slot_id, delta)
+
+    def get_min_remaining_capacity(self, exam_date: date, start_time: dt_time, end_time: dt_time) -> Optional[int]:
+        """알고 있는 겹치는 슬롯 중 최소 남은 인원을 반환한다. 알 수 없으면 None 을 반환한다"""
+        date_slots = self._get(exam_date)
+        if date_slots is None:
+            return None
+        return date_slots.min_capacity(start_time, end_time)
+
+    def get_overlapping_slot_ids(self, exam_date: date, start_time: dt_time, end_time: dt_time) -> list[int]:
+        date_slots = self._get(exam_date)
+        if date_slots is None:
+            return []
+        return date_slots.overlapping_slot_ids(start_time, end_time)
+
+    def get_remaining_capacity(self, exam_date: date, slot_id: int) -> Optional[int]:
+        date_slots = self._get(exam_date)
+        if date_slots is None or slot_id not in date_slots.positions:
+            return None
+        return date_slots.capacity(slot_id)
+
+    def invalidate(self, exam_date: Optional[date] = None) -> None:
+        if exam_date is None:
+            self._dates.clear()
+        else:
+            self._dates.pop(exam_date, None)
+
+    def _get(self, exam_date: date) -> Optional[_DateSlots]:
+        date_slots = self._dates.get(exam_date)
+        if date_slots is not None and date_slots.expires_at <= self.clock():
+            del self._dates[exam_date]
+            return None
+        return date_slots
+
+    def _get_or_create(self, exam_date: date) -> _DateSlots:
+        date_slots = self._get(exam_date)
+        if date_slots is None:
+            if len(self._dates) >= self.MAX_DATES:
+                self._purge_expired()
+            date_slots = _DateSlots(self.clock() + self.ttl_seconds)
+            self._dates[exam_date] = date_slots
+        return date_slots
+
+    def _purge_expired(self) -> None:
+        now = self.clock()
+        for exam_date in [d for d, date_slots in self._dates.items() if date_slots.expires_at <= now]:
+            del self._dates[exam_date]
+        if len(self._dates) >= self.MAX_DATES:
+            del self._dates[min(self._dates, key=lambda d: self._dates[d].expires_at)]
@@ -1,7 +1,7 @@
 from enum import Enum
 
 
-class UserType(Enum):
+class UserType(str, Enum):
     USER = "USER"
     ADMIN = "ADMIN"
 
@@ -15,3 +15,19 @@ class ReservationStatus(Enum):
 
     def __str__(self):
         return self.value
+
+
+class ExportFormat(str, Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+    def __str__(self):
+        return self.value
+
+
+class WaitlistStatus(Enum):
+    WAITING = "WAITING"
+    PROMOTED = "PROMOTED"
+
+    def __str__(self):
+        return self.value
@@ -1,4 +1,4 @@
-from sqlalchemy import CheckConstraint, Column, Date, ForeignKey, Index, Integer, Table, Time
+from sqlalchemy import CheckConstraint, Column, Date, DateTime, ForeignKey, Index, Integer, Table, Time, text
 from sqlalchemy.dialects.postgresql import ENUM
 from sqlalchemy.orm import relationship
 
@@ -25,11 +25,29 @@ class Reservation(Base):
     exam_end_time = Column(Time, nullable=False)
     applicants = Column(Integer, nullable=False)
     status = Column(ENUM(ReservationStatus, name="reservation_status"), default=ReservationStatus.PENDING.value)
+    # 인원 홀드 만료 시각 (RESERVATION_HOLD_ENABLED): 값이 있으면 PENDING 예약이 슬롯 인원을 차감하여 잡아두고 있다
+    hold_expires_at = Column(DateTime(timezone=True), nullable=True)
 
     user = relationship("User", back_populates="reservations")
-    slots = relationship("Slot", secondary=reservation_slots, back_populates="reservations", lazy="selectin")
+    # 연관 슬롯은 쿼리에서 명시적으로 요청할 때만 로딩한다 (app/common/respository/loader_options.py)
+    # reservation_slots 는 ON DELETE CASCADE 이므로 삭제 시 연관 슬롯을 로딩하지 않는다
+    slots = relationship(
+        "Slot",
+        secondary=reservation_slots,
+        back_populates="reservations",
+        lazy="raise_on_sql",
+        passive_deletes=True,
+    )
 
     __table_args__ = (
-        Index("idx_reservations_exam_date", "exam_date"),
+        # (exam_date, id) keyset 페이지네이션용 인덱스 (exam_date 단독 조회도 이 인덱스의 prefix 로 처리된다)
+        Index("idx_reservations_exam_date_id", "exam_date", "id"),
+        Index("idx_reservations_user_id_exam_date_id", "user_id", "exam_date", "id"),
+        # 만료된 홀드 조회용 (홀드 중인 예약만 색인)
+        Index(
+            "idx_reservations_hold_expires_at",
+            "hold_expires_at",
+            postgresql_where=text("hold_expires_at IS NOT NULL"),
+        ),
         CheckConstraint("exam_end_time > exam_start_time", name="check_exam_time_valid"),
     )
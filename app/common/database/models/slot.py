@@ -16,7 +16,14 @@ class Slot(Base):
     time_range = Column(TSTZRANGE, nullable=False)
     remaining_capacity = Column(Integer, nullable=False, default=settings.MAX_APPLICANTS)
 
-    reservations = relationship("Reservation", secondary="reservation_slots", back_populates="slots", lazy="selectin")
+    # 연관 예약은 쿼리에서 명시적으로 요청할 때만 로딩한다 (app/common/respository/loader_options.py)
+    reservations = relationship(
+        "Reservation",
+        secondary="reservation_slots",
+        back_populates="slots",
+        lazy="raise_on_sql",
+        passive_deletes=True,
+    )
 
     __table_args__ = (
         UniqueConstraint("date", "start_time", "end_time", name="unique_slot"),
@@ -0,0 +1,31 @@
+from sqlalchemy import CheckConstraint, Column, Date, DateTime, ForeignKey, Index, Integer, Time, func, text
+from sqlalchemy.dialects.postgresql import ENUM
+
+from app.common.constants import WaitlistStatus
+from app.common.database.models.base import Base
+
+
+class WaitlistEntry(Base):
+    """
+    예약 대기열
+    - 인원이 부족한 시간대의 예약 요청을 등록 순서(id)대로 보관한다.
+    - 확정된 예약이 삭제되어 인원이 반환되면 같은 트랜잭션에서 PENDING 예약으로 승격되고 reservation_id 가 채워진다.
+    """
+
+    __tablename__ = "waitlist_entries"
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    exam_date = Column(Date, nullable=False)
+    exam_start_time = Column(Time, nullable=False)
+    exam_end_time = Column(Time, nullable=False)
+    applicants = Column(Integer, nullable=False)
+    status = Column(ENUM(WaitlistStatus, name="waitlist_status"), nullable=False, default=WaitlistStatus.WAITING.value)
+    reservation_id = Column(Integer, ForeignKey("reservations.id", ondelete="SET NULL"), nullable=True)
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+
+    __table_args__ = (
+        # 승격 대상 조회용 (대기 중인 항목만 색인)
+        Index("idx_waitlist_entries_waiting", "exam_date", "id", postgresql_where=text("status = 'WAITING'")),
+        CheckConstraint("exam_end_time > exam_start_time", name="check_waitlist_exam_time_valid"),
+    )
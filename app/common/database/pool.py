@@ -0,0 +1,87 @@
+# about pool : https://docs.sqlalchemy.org/en/20/core/pooling.html
+# psycopg pool : https://www.psycopg.org/psycopg3/docs/advanced/pool.html
+import threading
+import time
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """
+    커넥션 획득 대기 통계를 수집하는 QueuePool
+    - waiting: 현재 커넥션을 기다리는 요청 수
+    - checkouts / total_wait_seconds / max_wait_seconds: 커넥션 획득 횟수와 획득까지 걸린 시간
+    - timeouts: pool_timeout 내에 커넥션을 얻지 못한 횟수
+    - connect_errors: 새 커넥션 연결 실패(연결 거부, 인증 실패 등) 횟수
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._stats_lock = threading.Lock()
+        self.waiting = 0
+        self.checkouts = 0
+        self.timeouts = 0
+        self.connect_errors = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    def _do_get(self):
+        with self._stats_lock:
+            self.waiting += 1
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            with self._stats_lock:
+                self.timeouts += 1
+            raise
+        except Exception:
+            with self._stats_lock:
+                self.connect_errors += 1
+            raise
+        finally:
+            elapsed = time.perf_counter() - started
+            with self._stats_lock:
+                self.waiting -= 1
+        with self._stats_lock:
+            self.checkouts += 1
+            self.total_wait_seconds += elapsed
+            self.max_wait_seconds = max(self.max_wait_seconds, elapsed)
+        return connection
+
+    def stats(self) -> dict:
+        with self._stats_lock:
+            return {
+                "backend": "sqlalchemy",
+                "size": self.size(),
+                "max_size": self.size() + self._max_overflow,
+                "checked_out": self.checkedout(),
+                "idle": self.checkedin(),
+                "waiting": self.waiting,
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "connect_errors": self.connect_errors,
+                "total_wait_ms": self.total_wait_seconds * 1000,
+                "max_wait_ms": self.max_wait_seconds * 1000,
+            }
+
+
+def psycopg_pool_stats(pool) -> dict:
+    """psycopg AsyncConnectionPool.get_stats() 를 InstrumentedAsyncQueuePool.stats() 와 같은 형태로 변환한다"""
+    stats = pool.get_stats()
+    size = 0 if pool.closed else stats.get("pool_size", 0)
+    idle = 0 if pool.closed else stats.get("pool_available", 0)
+    return {
+        "backend": "psycopg",
+        "size": size,
+        "max_size": stats.get("pool_max", pool.max_size),
+        "checked_out": size - idle,
+        "idle": idle,
+        "waiting": stats.get("requests_waiting", 0),
+        "checkouts": stats.get("requests_num", 0),
+        "timeouts": stats.get("requests_errors", 0),
+        "connect_errors": stats.get("connections_errors", 0),
+        "total_wait_ms": float(stats.get("requests_wait_ms", 0)),
+        "max_wait_ms": None,
+    }
@@ -1,40 +1,76 @@
-import re
+import math
+from typing import Iterable, Optional
 
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
 from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from app.common.auth.auth_guard import AuthGuard
 from app.common.constants import UserType
 from app.common.exceptions import AuthorizationError
+from app.common.middleware.rate_limiter import RateLimiter
+from app.common.middleware.route_matcher import PathPrefixTrie
 
+# Swagger 및 기타 제외 경로
+DEFAULT_EXCLUDED_PATHS = (
+    "/openapi.json",
+    "/docs",
+    "/docs/oauth2-redirect",
+    "/redoc",
+    "/api/v1/users/login",
+    "/api/v1/users/",
+)
+# 관리자만 접근 가능한 경로 prefix (admin_api 라우터)
+DEFAULT_ADMIN_PREFIXES = ("/api/v1/admin",)
 
-class AuthMiddleware(BaseHTTPMiddleware):
-    def __init__(self, app, guard: AuthGuard):
-        super().__init__(app)
+
+class AuthMiddleware:
+    """
+    인증 미들웨어 (pure ASGI)
+    - BaseHTTPMiddleware 와 달리 요청마다 task 나 body stream 을 만들지 않고 다음 앱을 그대로 호출한다.
+    - 제외 경로는 frozenset, 관리자 경로는 prefix trie 로 생성 시 한 번만 구성한다.
+    - rate_limiter 가 있으면 인증된 사용자별로 요청 수를 제한하고, 초과 시 DB 작업 전에 429 를 반환한다.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        guard: AuthGuard,
+        excluded_paths: Iterable[str] = DEFAULT_EXCLUDED_PATHS,
+        admin_prefixes: Iterable[str] = DEFAULT_ADMIN_PREFIXES,
+        rate_limiter: Optional[RateLimiter] = None,
+    ) -> None:
+        self.app = app
         self.guard = guard
-        # Swagger 및 기타 제외 경로 추가
-        self.excluded_paths = [
-            "/openapi.json",
-            "/docs",
-            "/docs/oauth2-redirect",
-            "/redoc",
-            "/api/v1/users/login",
-            "/api/v1/users/",
-        ]
-
-    async def dispatch(self, request, call_next):
-        admin_only_pattern = re.compile(r"/api/v1/.+/admin")
-        if any(route == request.url.path for route in self.excluded_paths):
-            return await call_next(request)
+        self.excluded_paths = frozenset(excluded_paths)
+        self.admin_paths = PathPrefixTrie(admin_prefixes)
+        self.rate_limiter = rate_limiter
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in self.excluded_paths:
+            await self.app(scope, receive, send)
+            return
 
         try:
-            auth_data = await self.guard.authenticate(request)
-            if admin_only_pattern.match(request.url.path):
+            auth_data = await self.guard.authenticate(Request(scope))
+            if self.admin_paths.matches(scope["path"]):
                 if auth_data["type"] != UserType.ADMIN.value:
                     raise AuthorizationError("권한이 없습니다.")
-
-            request.state.auth = auth_data
         except Exception as e:
-            return JSONResponse(status_code=401, content={"detail": str(e)})
+            response = JSONResponse(status_code=401, content={"detail": str(e)})
+            await response(scope, receive, send)
+            return
+
+        if self.rate_limiter is not None:
+            retry_after = self.rate_limiter.acquire(auth_data["user_id"], scope["method"], scope["path"])
+            if retry_after:
+                response = JSONResponse(
+                    status_code=429,
+                    content={"detail": "요청이 너무 많습니다. 잠시 후 다시 시도해주세요."},
+                    headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+                )
+                await response(scope, receive, send)
+                return
 
-        return await call_next(request)
+        scope.setdefault("state", {})["auth"] = auth_data
+        await self.app(scope, receive, send)
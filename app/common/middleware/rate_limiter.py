@@ -0,0 +1,105 @@
+import time
+from collections import OrderedDict
+from typing import Callable, Hashable, Optional
+
+
+class TokenBucketLimiter:
+    """
+    key 별 토큰 버킷 (프로세스 내 메모리)
+    - 초당 rate_per_second 개씩 최대 burst 개까지 토큰이 채워지며, 요청마다 토큰 1개를 사용한다.
+    - 버킷은 최근 사용 순서로 보관하고, 요청 시 가장 오래 사용하지 않은 버킷부터 가득 찬(새 버킷과 같은) 버킷을 제거한다.
+      max_buckets 를 넘으면 가장 오래 사용하지 않은 버킷을 제거한다.
+    """
+
+    def __init__(
+        self,
+        rate_per_second: float,
+        burst: int,
+        max_buckets: int = 100_000,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.rate_per_second = rate_per_second
+        self.burst = burst
+        self.max_buckets = max_buckets
+        self.clock = clock
+        # key -> (남은 토큰, 마지막 갱신 시각)
+        self._buckets: OrderedDict[Hashable, tuple[float, float]] = OrderedDict()
+
+    def acquire(self, key: Hashable) -> float:
+        """토큰을 사용할 수 있으면 0 을, 없으면 다음 토큰까지 남은 시간(초)을 반환한다."""
+        now = self.clock()
+        self._sweep(now)
+
+        tokens = self._tokens(self._buckets.get(key), now)
+        if tokens < 1:
+            self._buckets[key] = (tokens, now)
+            self._buckets.move_to_end(key)
+            return (1 - tokens) / self.rate_per_second
+
+        self._buckets[key] = (tokens - 1, now)
+        self._buckets.move_to_end(key)
+        return 0.0
+
+    def retry_after(self, key: Hashable) -> float:
+        """토큰을 사용하지 않고, 지금 요청하면 기다려야 하는 시간(초)을 반환한다 (사용할 수 있으면 0)."""
+        tokens = self._tokens(self._buckets.get(key), self.clock())
+        return 0.0 if tokens >= 1 else (1 - tokens) / self.rate_per_second
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    def _tokens(self, bucket: Optional[tuple[float, float]], now: float) -> float:
+        if bucket is None:
+            return self.burst
+        tokens, updated_at = bucket
+        return min(self.burst, tokens + (now - updated_at) * self.rate_per_second)
+
+    def _sweep(self, now: float) -> None:
+        while self._buckets:
+            key, bucket = next(iter(self._buckets.items()))
+            if len(self._buckets) < self.max_buckets and self._tokens(bucket, now) < self.burst:
+                return
+            del self._buckets[key]
+
+
+class RateLimiter:
+    """
+    사용자별 요청 제한
+    - 모든 인증된 요청은 사용자별 기본 버킷(default_limit)을 사용한다.
+    - route_limits 의 "METHOD /path" 와 정확히 일치하는 요청은 (사용자, 규칙)별 버킷도 함께 사용한다.
+      경로 끝의 "/" 는 구분하지 않으며, 하위 경로(예: POST /api/v1/reservations/feasibility)에는 적용하지 않는다.
+    - 모든 버킷에 토큰이 있을 때만 토큰을 사용하므로, 거절된 요청은 어느 버킷의 토큰도 사용하지 않는다.
+    """
+
+    def __init__(
+        self,
+        default_limit: tuple[float, int],
+        route_limits: Optional[dict[str, tuple[float, int]]] = None,
+        max_buckets: int = 100_000,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.default_limiter = TokenBucketLimiter(*default_limit, max_buckets=max_buckets, clock=clock)
+        self.route_limiters: dict[tuple[str, str], TokenBucketLimiter] = {}
+        for route, (rate_per_second, burst) in (route_limits or {}).items():
+            method, path = route.split(" ", 1)
+            self.route_limiters[self._route_key(method, path)] = TokenBucketLimiter(
+                rate_per_second, burst, max_buckets=max_buckets, clock=clock
+            )
+
+    def acquire(self, user_id, method: str, path: str) -> float:
+        """요청을 처리할 수 있으면 0 을, 제한되면 Retry-After 로 안내할 시간(초)을 반환한다."""
+        limiters = [self.default_limiter]
+        route_limiter = self.route_limiters.get(self._route_key(method, path))
+        if route_limiter is not None:
+            limiters.append(route_limiter)
+
+        retry_after = max(limiter.retry_after(user_id) for limiter in limiters)
+        if retry_after:
+            return retry_after
+        for limiter in limiters:
+            limiter.acquire(user_id)
+        return 0.0
+
+    @staticmethod
+    def _route_key(method: str, path: str) -> tuple[str, str]:
+        return method.upper(), path.rstrip("/") or "/"
@@ -0,0 +1,39 @@
+from typing import Iterable
+
+
+class PathPrefixTrie:
+    """
+    경로 세그먼트 단위 prefix trie
+    - 등록된 prefix 와 세그먼트 경계까지 일치하는 경로를 찾는다. (`/api/v1/admin` 은 `/api/v1/admin/slots` 와 일치하고
+      `/api/v1/administrators` 와는 일치하지 않는다)
+    - 요청마다 정규식을 컴파일하거나 prefix 목록을 순회하지 않고 경로 깊이만큼만 탐색한다.
+    """
+
+    _TERMINAL = ""
+
+    def __init__(self, prefixes: Iterable[str] = ()) -> None:
+        self._root: dict = {}
+        for prefix in prefixes:
+            self.add(prefix)
+
+    def add(self, prefix: str) -> None:
+        node = self._root
+        for segment in self._segments(prefix):
+            node = node.setdefault(segment, {})
+        node[self._TERMINAL] = True
+
+    def matches(self, path: str) -> bool:
+        node = self._root
+        if self._TERMINAL in node:
+            return True
+        for segment in self._segments(path):
+            node = node.get(segment)
+            if node is None:
+                return False
+            if self._TERMINAL in node:
+                return True
+        return False
+
+    @staticmethod
+    def _segments(path: str) -> list[str]:
+        return [segment for segment in path.split("/") if segment]
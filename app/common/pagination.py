@@ -0,0 +1,21 @@
+import base64
+import binascii
+from datetime import date
+from typing import Optional
+
+
+# keyset 페이지네이션 커서 (exam_date, id) 를 불투명한 문자열로 인코딩/디코딩한다
+def encode_cursor(exam_date: date, reservation_id: int) -> str:
+    raw = f"{exam_date.isoformat()}:{reservation_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[tuple[date, int]]:
+    if not cursor:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        exam_date, reservation_id = raw.split(":")
+        return date.fromisoformat(exam_date), int(reservation_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise ValueError("유효하지 않은 커서입니다.")
@@ -0,0 +1,29 @@
+# https://fastapi.tiangolo.com/advanced/custom-response/
+import json
+from typing import Any
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson 은 선택 의존성
+    orjson = None
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    이미 검증된 응답을 그대로 직렬화하는 응답 클래스
+    - 라우트에서 이 응답을 직접 반환하면 FastAPI 의 response_model 재검증 및 jsonable_encoder 변환을 거치지 않는다.
+    - pydantic 모델은 pydantic-core 의 JSON 직렬화를, 그 외 값은 orjson(설치된 경우)을 사용한다.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, BaseModel):
+            return content.model_dump_json().encode("utf-8")
+        if orjson is not None:
+            return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+        return json.dumps(
+            jsonable_encoder(content), ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")
+        ).encode("utf-8")
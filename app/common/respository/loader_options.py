@@ -0,0 +1,8 @@
+from sqlalchemy.orm import raiseload, selectinload
+
+
+# 관계 로딩 전략을 쿼리마다 선택한다
+# - 기본값은 raiseload: 핫 패스에서 연관 객체를 읽지 않으며, 실수로 접근하면 추가 쿼리 대신 예외가 발생한다
+# - eager=True 일 때만 selectinload 로 한 번에 로딩한다
+def relationship_loader(attribute, eager: bool = False):
+    return selectinload(attribute) if eager else raiseload(attribute)
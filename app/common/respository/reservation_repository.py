@@ -1,13 +1,64 @@
 import logging
-from typing import List
+from datetime import date, datetime
+from functools import cache
+from typing import AsyncIterator, List, Optional
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, func
+from sqlalchemy import insert as sa_insert
+from sqlalchemy import lambda_stmt, select, tuple_, types, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.dialects.postgresql import psycopg as psycopg_dialect
 from sqlalchemy.ext.asyncio import AsyncSession, async_scoped_session
+from sqlalchemy.orm import raiseload, selectinload
 
-from app.common.database.models.reservation import Reservation
+from app.common.constants import ReservationStatus
+from app.common.database.models.reservation import Reservation, reservation_slots
+from app.common.database.models.slot import Slot
+from app.common.respository.loader_options import relationship_loader
 
 logger = logging.getLogger(__name__)
 
+# 한 INSERT 문에 담을 최대 row 수 (postgresql 바인드 파라미터 최대 개수 65535 이하로 유지)
+BULK_INSERT_CHUNK_SIZE = 1000
+
+
+# 예약 확정 파이프라인 구문 (psycopg pipeline mode 로 한 번의 네트워크 왕복에 전송한다)
+# 1. 겹치는 슬롯 수 조회  2. 남은 인원이 충분한 겹치는 슬롯 차감  3. reservation_slots 생성  4. 예약 상태 변경
+# 2 에서 차감된 슬롯 수가 1 보다 적으면 호출자가 트랜잭션을 롤백한다
+def _overlapping_slots_condition():
+    time_range = func.tstzrange(
+        func.cast(bindparam("start_time", type_=types.DateTime()), types.TIMESTAMP(timezone=True)),
+        func.cast(bindparam("end_time", type_=types.DateTime()), types.TIMESTAMP(timezone=True)),
+        bindparam("range_type", type_=types.String()),
+    )
+    return Slot.__table__.c.time_range.op("&&")(time_range)
+
+
+@cache
+def _confirm_pipeline_sql() -> tuple[str, str, str, str]:
+    slots = Slot.__table__
+    applicants = bindparam("applicants", type_=types.Integer())
+    statements = (
+        select(func.count()).select_from(slots).where(_overlapping_slots_condition()),
+        update(slots)
+        .where(_overlapping_slots_condition(), slots.c.remaining_capacity >= applicants)
+        .values(remaining_capacity=slots.c.remaining_capacity - applicants)
+        .returning(slots.c.id),
+        insert(reservation_slots)
+        .from_select(
+            ["reservation_id", "slot_id"],
+            select(bindparam("reservation_id", type_=types.Integer()), slots.c.id).where(
+                _overlapping_slots_condition()
+            ),
+        )
+        .on_conflict_do_nothing(),
+        update(Reservation.__table__)
+        .where(Reservation.__table__.c.id == bindparam("reservation_id", type_=types.Integer()))
+        .values(status=bindparam("status", type_=Reservation.__table__.c.status.type)),
+    )
+    dialect = psycopg_dialect.dialect()
+    return tuple(str(statement.compile(dialect=dialect)) for statement in statements)
+
 
 class ReservationRepository:
     def __init__(self, session_factory: async_scoped_session) -> None:
@@ -27,31 +78,282 @@ class ReservationRepository:
             logger.error(f"[repository/reservation_repository] _create_reservation error: {e}")
             raise e
 
-    async def get_reservations_by_user_id(self, user_id: int) -> List[Reservation]:
+    async def bulk_create_reservations_with_external_session(
+        self, reservations: List[dict], session: AsyncSession
+    ) -> List:
+        """
+        예약을 multi-row INSERT 로 일괄 생성하고, 입력 순서대로 생성된 예약의 컬럼을 반환한다.
+        (executemany + RETURNING 은 insertmanyvalues 로 묶여 페이지 단위 multi-row INSERT 로 실행된다)
+        """
+        if not reservations:
+            return []
+        try:
+            table = Reservation.__table__
+            stmt = sa_insert(table).returning(
+                table.c.id,
+                table.c.user_id,
+                table.c.exam_date,
+                table.c.exam_start_time,
+                table.c.exam_end_time,
+                table.c.applicants,
+                table.c.status,
+                sort_by_parameter_order=True,
+            )
+            result = await session.execute(stmt, reservations)
+            return result.all()
+        except Exception as e:
+            logger.error(
+                f"[repository/reservation_repository] bulk_create_reservations_with_external_session error: {e}"
+            )
+            raise e
+
+    async def get_reservations_by_user_id(
+        self,
+        user_id: int,
+        limit: Optional[int] = None,
+        after: Optional[tuple[date, int]] = None,
+        status: Optional[ReservationStatus] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> List:
         async with self.session_factory() as session:
-            query = select(Reservation).where(Reservation.user_id == user_id)
+            query = self._build_reservation_page_query(limit, after, status, start_date, end_date).where(
+                Reservation.user_id == user_id
+            )
             reservations = await session.execute(query)
-            return reservations.scalars().all()
+            return reservations.all()
 
-    async def get_reservations(self) -> List[Reservation]:
+    async def get_reservations(
+        self,
+        limit: Optional[int] = None,
+        after: Optional[tuple[date, int]] = None,
+        status: Optional[ReservationStatus] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> List:
         async with self.session_factory() as session:
-            query = select(Reservation)
+            query = self._build_reservation_page_query(limit, after, status, start_date, end_date)
             reservations = await session.execute(query)
-            return reservations.scalars().all()
+            return reservations.all()
+
+    async def stream_reservations(
+        self,
+        chunk_size: int,
+        status: Optional[ReservationStatus] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> AsyncIterator[List]:
+        """
+        서버 사이드 커서로 예약을 chunk_size 개씩 읽어 chunk 단위로 반환한다
+        (전체 결과를 메모리에 올리지 않으므로 조회 건수와 관계없이 메모리 사용량이 일정하다)
+        """
+        async with self.session_factory() as session:
+            query = self._build_reservation_page_query(None, None, status, start_date, end_date)
+            result = await session.stream(query.execution_options(yield_per=chunk_size))
+            async for partition in result.partitions():
+                yield partition
+
+    def _build_reservation_page_query(
+        self,
+        limit: Optional[int],
+        after: Optional[tuple[date, int]],
+        status: Optional[ReservationStatus],
+        start_date: Optional[date],
+        end_date: Optional[date],
+    ):
+        """
+        (exam_date, id) 기준 keyset 페이지네이션 쿼리
+        - offset 대신 마지막으로 조회한 (exam_date, id) 이후의 행부터 읽으므로 페이지 위치와 관계없이 인덱스 범위 스캔으로 처리된다
+        - ORM 엔티티 대신 응답에 필요한 컬럼만 조회한다
+        """
+        query = select(
+            Reservation.id,
+            Reservation.user_id,
+            Reservation.exam_date,
+            Reservation.exam_start_time,
+            Reservation.exam_end_time,
+            Reservation.applicants,
+            Reservation.status,
+        ).order_by(Reservation.exam_date, Reservation.id)
+        if after is not None:
+            query = query.where(tuple_(Reservation.exam_date, Reservation.id) > tuple_(*after))
+        if status is not None:
+            query = query.where(Reservation.status == status)
+        if start_date is not None:
+            query = query.where(Reservation.exam_date >= start_date)
+        if end_date is not None:
+            query = query.where(Reservation.exam_date <= end_date)
+        if limit is not None:
+            query = query.limit(limit)
+        return query
 
     async def get_reservation_by_id_with_external_session(
-        self, reservation_id: int, session: AsyncSession
+        self, reservation_id: int, session: AsyncSession, for_update: bool = False, with_slots: bool = False
     ) -> Reservation:
-        query = await session.execute(select(Reservation).where(Reservation.id == reservation_id))
+        # lambda statement: 구문은 첫 호출 때만 생성되고 이후에는 캐시 키 계산 없이 재사용된다
+        stmt = lambda_stmt(lambda: select(Reservation).where(Reservation.id == reservation_id))
+        if with_slots:
+            stmt += lambda s: s.options(selectinload(Reservation.slots))
+        else:
+            stmt += lambda s: s.options(raiseload(Reservation.slots))
+        if for_update:
+            stmt += lambda s: s.with_for_update()
+        query = await session.execute(stmt)
         return query.scalar_one_or_none()
 
+    async def get_reservations_by_ids_with_external_session(
+        self, reservation_ids: List[int], session: AsyncSession, for_update: bool = False
+    ) -> List:
+        """
+        여러 예약을 한 번의 쿼리로 조회한다.
+        관계(slots)는 불러오지 않도록 필요한 컬럼만 조회하며, for_update 이면 id 순서로 잠금을 건다.
+        """
+        stmt = lambda_stmt(
+            lambda: select(
+                Reservation.id,
+                Reservation.user_id,
+                Reservation.exam_date,
+                Reservation.exam_start_time,
+                Reservation.exam_end_time,
+                Reservation.applicants,
+                Reservation.status,
+                Reservation.hold_expires_at,
+            )
+            .where(Reservation.id.in_(reservation_ids))
+            .order_by(Reservation.id)
+        )
+        if for_update:
+            stmt += lambda s: s.with_for_update()
+        result = await session.execute(stmt)
+        return result.all()
+
+    async def confirm_reservations_with_external_session(self, reservation_ids: List[int], session: AsyncSession):
+        if not reservation_ids:
+            return
+        await session.execute(
+            update(Reservation)
+            .where(Reservation.id.in_(reservation_ids))
+            .values(status=ReservationStatus.CONFIRMED, hold_expires_at=None)
+            .execution_options(synchronize_session=False)
+        )
+
+    async def get_expired_holds_with_external_session(self, now: datetime, limit: int, session: AsyncSession) -> List:
+        """
+        홀드가 만료된 예약을 만료 시각 순서로 잠금 조회한다 (idx_reservations_hold_expires_at 부분 인덱스 사용).
+        다른 트랜잭션이 확정/삭제 중인 예약은 건너뛴다.
+        """
+        try:
+            result = await session.execute(
+                select(
+                    Reservation.id,
+                    Reservation.exam_date,
+                    Reservation.exam_start_time,
+                    Reservation.exam_end_time,
+                    Reservation.applicants,
+                )
+                .where(Reservation.hold_expires_at.is_not(None), Reservation.hold_expires_at <= now)
+                .order_by(Reservation.hold_expires_at)
+                .limit(limit)
+                .with_for_update(skip_locked=True)
+            )
+            return result.all()
+        except Exception as e:
+            logger.error(f"[repository/reservation_repository] get_expired_holds_with_external_session error: {e}")
+            raise e
+
+    async def release_holds_with_external_session(self, reservation_ids: List[int], session: AsyncSession) -> List:
+        """
+        예약의 홀드를 해제한다 (reservation_slots 삭제, hold_expires_at 초기화).
+        삭제된 (reservation_id, slot_id) 목록을 반환하며, 슬롯 인원 반환은 호출자가 처리한다.
+        확정된 예약도 reservation_slots 로 차감한 슬롯을 기록하므로, 확정 예약 삭제 시에도 같은 방식으로 인원을 반환한다.
+        """
+        if not reservation_ids:
+            return []
+        try:
+            result = await session.execute(
+                reservation_slots.delete()
+                .where(reservation_slots.c.reservation_id.in_(reservation_ids))
+                .returning(reservation_slots.c.reservation_id, reservation_slots.c.slot_id)
+            )
+            released_slots = result.all()
+            await session.execute(
+                update(Reservation)
+                .where(Reservation.id.in_(reservation_ids))
+                .values(hold_expires_at=None)
+                .execution_options(synchronize_session=False)
+            )
+            return released_slots
+        except Exception as e:
+            logger.error(f"[repository/reservation_repository] release_holds_with_external_session error: {e}")
+            raise e
+
     async def update_reservation_with_external_session(self, reservation: Reservation, session: AsyncSession):
         session.add(reservation)
         await session.flush()
         return reservation
 
+    async def create_reservation_slots_with_external_session(
+        self, reservation_id: int, slot_ids: List[int], session: AsyncSession
+    ) -> None:
+        await self.bulk_create_reservation_slots_with_external_session(
+            [{"reservation_id": reservation_id, "slot_id": slot_id} for slot_id in slot_ids], session
+        )
+
+    async def bulk_create_reservation_slots_with_external_session(
+        self, reservation_slot_rows: List[dict], session: AsyncSession
+    ) -> None:
+        for offset in range(0, len(reservation_slot_rows), BULK_INSERT_CHUNK_SIZE):
+            chunk = reservation_slot_rows[offset : offset + BULK_INSERT_CHUNK_SIZE]
+            await session.execute(insert(reservation_slots).values(chunk).on_conflict_do_nothing())
+
+    async def confirm_reservation_pipelined_with_external_session(
+        self,
+        reservation_id: int,
+        start_time: datetime,
+        end_time: datetime,
+        range_type: str,
+        applicants: int,
+        session: AsyncSession,
+    ) -> tuple[int, List[int]]:
+        """
+        예약 확정에 필요한 슬롯 차감, reservation_slots 생성, 예약 상태 변경을 psycopg pipeline mode 로 한 번에 전송한다.
+        세션의 트랜잭션과 같은 커넥션에서 실행되며, (겹치는 슬롯 수, 차감된 슬롯 id 목록)을 반환한다.
+        https://www.psycopg.org/psycopg3/docs/advanced/pipeline.html
+        """
+        try:
+            count_sql, decrement_sql, link_sql, confirm_sql = _confirm_pipeline_sql()
+            params = {
+                "reservation_id": reservation_id,
+                "start_time": start_time,
+                "end_time": end_time,
+                "range_type": range_type,
+                "applicants": applicants,
+                "status": ReservationStatus.CONFIRMED.value,
+            }
+            connection = await session.connection()
+            raw_connection = await connection.get_raw_connection()
+            driver_connection = raw_connection.driver_connection
+
+            async with driver_connection.pipeline():
+                count_cursor = driver_connection.cursor()
+                decrement_cursor = driver_connection.cursor()
+                await count_cursor.execute(count_sql, params)
+                await decrement_cursor.execute(decrement_sql, params)
+                await driver_connection.execute(link_sql, params)
+                await driver_connection.execute(confirm_sql, params)
+            (overlapping_slot_count,) = await count_cursor.fetchone()
+            updated_slot_ids = [row[0] for row in await decrement_cursor.fetchall()]
+            return overlapping_slot_count, updated_slot_ids
+        except Exception as e:
+            logger.error(
+                f"[repository/reservation_repository] confirm_reservation_pipelined_with_external_session error: {e}"
+            )
+            raise e
+
     async def delete_reservation_with_external_session(self, reservation_id: int, session: AsyncSession):
-        query = await session.execute(select(Reservation).where(Reservation.id == reservation_id))
+        query = await session.execute(
+            select(Reservation).where(Reservation.id == reservation_id).options(relationship_loader(Reservation.slots))
+        )
         reservation = query.scalar_one_or_none()
         if reservation:
             await session.delete(reservation)
@@ -1,18 +1,59 @@
 import logging
-from datetime import datetime
-from typing import List
+from datetime import date, datetime
+from functools import cache
+from typing import List, Optional
 
-from sqlalchemy import func, select, types
+from sqlalchemy import bindparam, func, select, types, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession, async_scoped_session
 
+from app.common.cache.single_flight import SingleFlight
 from app.common.database.models.slot import Slot
+from app.common.respository.loader_options import relationship_loader
 
 logger = logging.getLogger(__name__)
 
+# 한 INSERT 문에 담을 최대 row 수 (postgresql 바인드 파라미터 최대 개수 65535 이하로 유지)
+BULK_INSERT_CHUNK_SIZE = 1000
+
+
+# 자주 실행되는 쿼리는 한 번만 생성하여 재사용하고, 값은 bindparam 으로 전달한다
+# - 매 호출마다 select/update 구문을 새로 만들고 캐시 키를 계산하는 비용이 줄어든다
+# - SQL 문자열이 항상 같으므로 psycopg 의 server-side prepared statement(prepare_threshold)가 적용된다
+# - 모델 간 relationship 이 모두 로딩된 뒤(첫 호출 시점)에 생성해야 하므로 모듈 import 시점이 아닌 cache 로 생성한다
+def _overlapping_time_range():
+    return func.tstzrange(
+        func.cast(bindparam("start_time", type_=types.DateTime()), types.TIMESTAMP(timezone=True)),
+        func.cast(bindparam("end_time", type_=types.DateTime()), types.TIMESTAMP(timezone=True)),
+        bindparam("range_type", type_=types.String()),
+    )
+
+
+@cache
+def _overlapping_slots_stmt(with_reservations: bool):
+    return (
+        select(Slot)
+        .where(Slot.time_range.op("&&")(_overlapping_time_range()))
+        .options(relationship_loader(Slot.reservations, eager=with_reservations))
+    )
+
+
+@cache
+def _decrement_remaining_capacity_stmt():
+    applicants = bindparam("applicants", type_=types.Integer())
+    return (
+        update(Slot)
+        .where(Slot.time_range.op("&&")(_overlapping_time_range()), Slot.remaining_capacity >= applicants)
+        .values(remaining_capacity=Slot.remaining_capacity - applicants)
+        .returning(Slot.id)
+        .execution_options(synchronize_session="fetch")
+    )
+
 
 class SlotRepository:
-    def __init__(self, session_factory: async_scoped_session) -> None:
+    def __init__(self, session_factory: async_scoped_session, single_flight: Optional[SingleFlight] = None) -> None:
         self.session_factory = session_factory
+        self.single_flight = single_flight
 
     """
     해당 시간대에 겹치는 슬롯 조회
@@ -31,26 +72,172 @@ class SlotRepository:
         end_time: datetime,
         range_type: str,
         session: AsyncSession,
+        with_reservations: bool = False,
     ) -> List[Slot]:
         try:
-            time_range = func.tstzrange(
-                func.cast(start_time, types.TIMESTAMP(timezone=True)),
-                func.cast(end_time, types.TIMESTAMP(timezone=True)),
-                range_type,
+            result = await session.execute(
+                _overlapping_slots_stmt(with_reservations),
+                {"start_time": start_time, "end_time": end_time, "range_type": range_type},
             )
-            stmt = select(Slot).where(Slot.time_range.op("&&")(time_range))
-            result = await session.execute(stmt)
             overlapping_slots = result.scalars().all()
             return overlapping_slots
         except Exception as e:
             logger.error(f"[repository/slot_repository] get_overlapping_slots_with_external_session error: {e}")
             raise e
 
-    async def get_available_slots(self, exam_date: datetime.date) -> List[Slot]:
+    async def decrement_remaining_capacity_with_external_session(
+        self,
+        start_time: datetime,
+        end_time: datetime,
+        range_type: str,
+        applicants: int,
+        session: AsyncSession,
+    ) -> List[int]:
+        """
+        겹치는 슬롯 중 남은 인원이 충분한 슬롯의 remaining_capacity 를 단일 UPDATE 문으로 차감한다.
+        차감된 슬롯의 id 목록을 반환하며, 호출자는 겹치는 슬롯 수와 비교하여 부족하면 트랜잭션을 롤백해야 한다.
+        """
+        try:
+            result = await session.execute(
+                _decrement_remaining_capacity_stmt(),
+                {"start_time": start_time, "end_time": end_time, "range_type": range_type, "applicants": applicants},
+            )
+            return result.scalars().all()
+        except Exception as e:
+            logger.error(f"[repository/slot_repository] decrement_remaining_capacity_with_external_session error: {e}")
+            raise e
+
+    async def get_slots_by_dates_with_external_session(
+        self, dates: List[datetime.date], session: AsyncSession, for_update: bool = False
+    ) -> List:
+        """
+        여러 날짜의 슬롯을 한 번의 쿼리로 조회한다.
+        관계(reservations)는 불러오지 않도록 필요한 컬럼만 조회하며, for_update 이면 id 순서로 잠금을 건다.
+        """
+        try:
+            stmt = (
+                select(Slot.id, Slot.date, Slot.start_time, Slot.end_time, Slot.remaining_capacity)
+                .where(Slot.date.in_(dates))
+                .order_by(Slot.id)
+            )
+            if for_update:
+                stmt = stmt.with_for_update()
+            result = await session.execute(stmt)
+            return result.all()
+        except Exception as e:
+            logger.error(f"[repository/slot_repository] get_slots_by_dates_with_external_session error: {e}")
+            raise e
+
+    async def update_remaining_capacities_with_external_session(
+        self, remaining_capacities: dict[int, int], session: AsyncSession
+    ) -> None:
+        """슬롯별 remaining_capacity 를 executemany 로 한 번에 갱신한다 (호출 전에 슬롯 잠금을 잡아야 한다)"""
+        if not remaining_capacities:
+            return
+        try:
+            slots = Slot.__table__
+            stmt = (
+                update(slots)
+                .where(slots.c.id == bindparam("slot_id"))
+                .values(remaining_capacity=bindparam("new_remaining_capacity"))
+            )
+            await session.execute(
+                stmt,
+                [
+                    {"slot_id": slot_id, "new_remaining_capacity": remaining_capacity}
+                    for slot_id, remaining_capacity in sorted(remaining_capacities.items())
+                ],
+            )
+        except Exception as e:
+            logger.error(f"[repository/slot_repository] update_remaining_capacities_with_external_session error: {e}")
+            raise e
+
+    async def increment_remaining_capacities_with_external_session(
+        self, capacity_deltas: dict[int, int], session: AsyncSession
+    ) -> None:
+        """슬롯별 remaining_capacity 에 delta 를 더한다 (executemany, 잠금 순서를 맞추기 위해 슬롯 id 순서로 실행)"""
+        if not capacity_deltas:
+            return
+        try:
+            slots = Slot.__table__
+            stmt = (
+                update(slots)
+                .where(slots.c.id == bindparam("slot_id"))
+                .values(remaining_capacity=slots.c.remaining_capacity + bindparam("capacity_delta"))
+            )
+            await session.execute(
+                stmt,
+                [
+                    {"slot_id": slot_id, "capacity_delta": capacity_delta}
+                    for slot_id, capacity_delta in sorted(capacity_deltas.items())
+                ],
+            )
+        except Exception as e:
+            logger.error(
+                f"[repository/slot_repository] increment_remaining_capacities_with_external_session error: {e}"
+            )
+            raise e
+
+    async def get_available_slots(self, exam_date: datetime.date) -> List:
+        # 같은 날짜에 대한 동시 조회는 하나의 쿼리 결과를 공유한다
+        if self.single_flight is None:
+            return await self._get_available_slots(exam_date)
+        return await self.single_flight.do(("available_slots", exam_date), lambda: self._get_available_slots(exam_date))
+
+    async def _get_available_slots(self, exam_date: datetime.date) -> List:
+        """
+        응답에 필요한 컬럼만 조회한다 (ORM 객체 생성/identity map 등록 없이 Row 로 반환)
+        """
         try:
             async with self.session_factory() as session:
-                slots = await session.scalars(select(Slot).where(Slot.date == exam_date, Slot.remaining_capacity > 0))
-                return slots
+                result = await session.execute(
+                    select(Slot.id, Slot.date, Slot.start_time, Slot.end_time, Slot.remaining_capacity)
+                    .where(Slot.date == exam_date, Slot.remaining_capacity > 0)
+                    .order_by(Slot.start_time)
+                )
+                return result.all()
         except Exception as e:
             logger.error(f"[repository/slot_repository] get_available_slots error: {e}")
             raise e
+
+    async def get_daily_capacity_summary(self, start_date: date, end_date: date) -> List:
+        """
+        기간 내 날짜별 슬롯 집계를 단일 GROUP BY 쿼리로 조회한다
+        (최소/최대 남은 인원, 전체 슬롯 수, 예약 가능한(남은 인원 > 0) 슬롯 수)
+        """
+        try:
+            async with self.session_factory() as session:
+                stmt = (
+                    select(
+                        Slot.date,
+                        func.min(Slot.remaining_capacity).label("min_remaining_capacity"),
+                        func.max(Slot.remaining_capacity).label("max_remaining_capacity"),
+                        func.count().label("slot_count"),
+                        func.count().filter(Slot.remaining_capacity > 0).label("available_slot_count"),
+                    )
+                    .where(Slot.date.between(start_date, end_date))
+                    .group_by(Slot.date)
+                    .order_by(Slot.date)
+                )
+                result = await session.execute(stmt)
+                return result.all()
+        except Exception as e:
+            logger.error(f"[repository/slot_repository] get_daily_capacity_summary error: {e}")
+            raise e
+
+    async def bulk_create_slots_with_external_session(self, slots: List[dict], session: AsyncSession) -> int:
+        """
+        슬롯을 multi-row INSERT 로 일괄 생성한다.
+        unique_slot 제약조건에 걸리는 슬롯은 ON CONFLICT DO NOTHING 으로 건너뛰며, 실제 생성된 슬롯 수를 반환한다.
+        """
+        try:
+            created_count = 0
+            for offset in range(0, len(slots), BULK_INSERT_CHUNK_SIZE):
+                chunk = slots[offset : offset + BULK_INSERT_CHUNK_SIZE]
+                stmt = insert(Slot).values(chunk).on_conflict_do_nothing(constraint="unique_slot").returning(Slot.id)
+                result = await session.execute(stmt)
+                created_count += len(result.scalars().all())
+            return created_count
+        except Exception as e:
+            logger.error(f"[repository/slot_repository] bulk_create_slots_with_external_session error: {e}")
+            raise e
@@ -1,26 +1,50 @@
 import logging
+from typing import Optional
 
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import async_scoped_session
 
+from app.common.cache.ttl_cache import TTLCache
 from app.common.database.models.user import User
 
 logger = logging.getLogger(__name__)
 
+# 존재하지 않는 이메일을 캐시할 때 사용하는 값 (TTLCache.get 의 기본값 None 과 구분)
+_UNKNOWN_USER = object()
+
 
 class AuthRepository:
-    def __init__(self, session_factory: async_scoped_session) -> None:
+    def __init__(
+        self,
+        session_factory: async_scoped_session,
+        user_cache: Optional[TTLCache] = None,
+        negative_ttl_seconds: Optional[float] = None,
+    ) -> None:
         self.session_factory = session_factory
+        # 이메일별 사용자 캐시 (로그인 조회용, 존재하지 않는 이메일은 negative_ttl_seconds 동안 캐시)
+        self.user_cache = user_cache
+        self.negative_ttl_seconds = negative_ttl_seconds
 
     async def get_user_by_email(self, email: str) -> User | None:
+        if self.user_cache is not None:
+            cached_user = self.user_cache.get(email)
+            if cached_user is not None:
+                return None if cached_user is _UNKNOWN_USER else cached_user
+
         try:
             async with self.session_factory() as session:
                 user = await session.scalar(select(User).where(User.email == email))
-            return user
         except Exception as e:
             logger.error(f"[repository/user_repository] get_user_by_email error: {e}")
             raise e
 
+        if self.user_cache is not None:
+            if user is None:
+                self.user_cache.set(email, _UNKNOWN_USER, ttl_seconds=self.negative_ttl_seconds)
+            else:
+                self.user_cache.set(email, user)
+        return user
+
     async def create_user(self, user: User) -> User:
         async with self.session_factory() as session:
             try:
@@ -30,3 +54,26 @@ class AuthRepository:
             except Exception as e:
                 logger.error(f"[repository/user_repository] create_user error: {e}")
                 raise e
+            finally:
+                self._invalidate_user(user.email)
+
+    async def update_hashed_password(self, user_id: int, old_hashed_password: str, new_hashed_password: str) -> bool:
+        # 그 사이 비밀번호가 바뀐 경우 덮어쓰지 않도록 이전 해시가 같을 때만 변경한다
+        async with self.session_factory() as session:
+            try:
+                email = await session.scalar(
+                    update(User)
+                    .where(User.id == user_id, User.hashed_password == old_hashed_password)
+                    .values(hashed_password=new_hashed_password)
+                    .returning(User.email)
+                )
+                await session.commit()
+                self._invalidate_user(email)
+                return email is not None
+            except Exception as e:
+                logger.error(f"[repository/user_repository] update_hashed_password error: {e}")
+                raise e
+
+    def _invalidate_user(self, email: Optional[str]) -> None:
+        if self.user_cache is not None and email is not None:
+            self.user_cache.invalidate(email)
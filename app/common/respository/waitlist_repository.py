@@ -0,0 +1,57 @@
+import logging
+from datetime import date, time
+from typing import Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_scoped_session
+
+from app.common.constants import WaitlistStatus
+from app.common.database.models.waitlist import WaitlistEntry
+
+logger = logging.getLogger(__name__)
+
+
+class WaitlistRepository:
+    def __init__(self, session_factory: async_scoped_session) -> None:
+        self.session_factory = session_factory
+
+    async def create_entry_with_external_session(self, entry: WaitlistEntry, session: AsyncSession) -> WaitlistEntry:
+        try:
+            session.add(entry)
+            await session.flush()
+            return entry
+        except Exception as e:
+            logger.error(f"[repository/waitlist_repository] create_entry_with_external_session error: {e}")
+            raise e
+
+    async def get_entry_by_id(self, entry_id: int) -> Optional[WaitlistEntry]:
+        try:
+            async with self.session_factory() as session:
+                return await session.get(WaitlistEntry, entry_id)
+        except Exception as e:
+            logger.error(f"[repository/waitlist_repository] get_entry_by_id error: {e}")
+            raise e
+
+    async def get_waiting_entries_with_external_session(
+        self, exam_date: date, start_time: time, end_time: time, limit: int, session: AsyncSession
+    ) -> list[WaitlistEntry]:
+        # 반환된 시간대와 겹치는 대기 항목을 등록 순서대로 잠금 조회한다
+        # 다른 트랜잭션이 승격 중인 항목은 건너뛰어 동시 삭제끼리 서로 기다리지 않게 한다
+        # 겹침 조건은 슬롯 조회('[]' 범위)와 같이 경계를 포함한다
+        try:
+            result = await session.scalars(
+                select(WaitlistEntry)
+                .where(
+                    WaitlistEntry.status == WaitlistStatus.WAITING,
+                    WaitlistEntry.exam_date == exam_date,
+                    WaitlistEntry.exam_start_time <= end_time,
+                    WaitlistEntry.exam_end_time >= start_time,
+                )
+                .order_by(WaitlistEntry.id)
+                .limit(limit)
+                .with_for_update(skip_locked=True)
+            )
+            return list(result.all())
+        except Exception as e:
+            logger.error(f"[repository/waitlist_repository] get_waiting_entries_with_external_session error: {e}")
+            raise e
@@ -11,18 +11,85 @@ class Config(BaseSettings):
     DATABASE_HOST: str = Field(default="localhost", json_schema_extra={"env": "DATABASE_HOST"})
     DATABASE_PORT: str = Field(default="5432", json_schema_extra={"env": "DATABASE_PORT"})
     DATABASE_NAME: str = Field(default="grep_db", json_schema_extra={"env": "DATABASE_NAME"})
+    DATABASE_POOL_SIZE: int = Field(default=20, json_schema_extra={"env": "DATABASE_POOL_SIZE"})
+    DATABASE_MAX_OVERFLOW: int = Field(default=10, json_schema_extra={"env": "DATABASE_MAX_OVERFLOW"})
+    DATABASE_POOL_TIMEOUT: float = Field(default=30.0, json_schema_extra={"env": "DATABASE_POOL_TIMEOUT"})
+    DATABASE_POOL_RECYCLE: int = Field(default=1800, json_schema_extra={"env": "DATABASE_POOL_RECYCLE"})
+    DATABASE_POOL_PRE_PING: bool = Field(default=True, json_schema_extra={"env": "DATABASE_POOL_PRE_PING"})
+    DATABASE_ECHO: bool = Field(default=False, json_schema_extra={"env": "DATABASE_ECHO"})
+    DATABASE_USE_PSYCOPG_POOL: bool = Field(default=False, json_schema_extra={"env": "DATABASE_USE_PSYCOPG_POOL"})
+    # psycopg server-side prepared statement: 같은 쿼리가 커넥션에서 N 번 실행되면 prepare 한다 (음수이면 사용하지 않음)
+    DATABASE_PREPARE_THRESHOLD: int = Field(default=2, json_schema_extra={"env": "DATABASE_PREPARE_THRESHOLD"})
 
     # jwt
     JWT_SECRET_KEY: str = Field(default="secret", json_schema_extra={"env": "JWT_SECRET_KEY"})
     JWT_ALGORITHM: str = Field(default="HS256", json_schema_extra={"env": "JWT_ALGORITHM"})
     ACCESS_TOKEN_EXPIRE_MINUTES: int = Field(default=30, json_schema_extra={"env": "ACCESS_TOKEN_EXPIRE_MINUTES"})
     REFRESH_TOKEN_EXPIRE_MINUTES: int = Field(default=60, json_schema_extra={"env": "REFRESH_TOKEN_EXPIRE_MINUTES"})
+    JWT_CACHE_MAX_SIZE: int = Field(default=10000, json_schema_extra={"env": "JWT_CACHE_MAX_SIZE"})
+    JWT_CACHE_TTL_SECONDS: float = Field(default=300.0, json_schema_extra={"env": "JWT_CACHE_TTL_SECONDS"})
+
+    # password (scrypt)
+    PASSWORD_HASH_MAX_WORKERS: int = Field(default=2, json_schema_extra={"env": "PASSWORD_HASH_MAX_WORKERS"})
+    PASSWORD_SCRYPT_N: int = Field(default=16384, json_schema_extra={"env": "PASSWORD_SCRYPT_N"})
+    PASSWORD_SCRYPT_R: int = Field(default=8, json_schema_extra={"env": "PASSWORD_SCRYPT_R"})
+    PASSWORD_SCRYPT_P: int = Field(default=1, json_schema_extra={"env": "PASSWORD_SCRYPT_P"})
+
+    # rate limit (사용자별 토큰 버킷, 프로세스 단위)
+    RATE_LIMIT_ENABLED: bool = Field(default=True, json_schema_extra={"env": "RATE_LIMIT_ENABLED"})
+    RATE_LIMIT_PER_SECOND: float = Field(default=20.0, json_schema_extra={"env": "RATE_LIMIT_PER_SECOND"})
+    RATE_LIMIT_BURST: int = Field(default=40, json_schema_extra={"env": "RATE_LIMIT_BURST"})
+    # "METHOD /path": [초당 요청 수, burst] (경로는 정확히 일치해야 하며 끝의 "/" 는 구분하지 않는다)
+    RATE_LIMIT_ROUTES: dict[str, tuple[float, int]] = Field(
+        default={
+            "POST /api/v1/reservations/": (2.0, 10),
+            "POST /api/v1/reservations/bulk": (2.0, 10),
+            "POST /api/v1/reservations/waitlist": (2.0, 10),
+        },
+        json_schema_extra={"env": "RATE_LIMIT_ROUTES"},
+    )
+    RATE_LIMIT_MAX_BUCKETS: int = Field(default=100000, json_schema_extra={"env": "RATE_LIMIT_MAX_BUCKETS"})
 
     @property
     def DATABASE_URL(self) -> str:
         return f"{self.DATABASE_USER}:{self.DATABASE_PASSWORD}@{self.DATABASE_HOST}:{self.DATABASE_PORT}/{self.DATABASE_NAME}"
 
     MAX_APPLICANTS: int = Field(default=50000, json_schema_extra={"env": "MAX_APPLICANTS"})
+    BULK_REQUEST_MAX_ITEMS: int = Field(default=10000, json_schema_extra={"env": "BULK_REQUEST_MAX_ITEMS"})
+    RESERVATION_PAGE_DEFAULT_LIMIT: int = Field(default=50, json_schema_extra={"env": "RESERVATION_PAGE_DEFAULT_LIMIT"})
+    RESERVATION_PAGE_MAX_LIMIT: int = Field(default=500, json_schema_extra={"env": "RESERVATION_PAGE_MAX_LIMIT"})
+    RESERVATION_EXPORT_CHUNK_SIZE: int = Field(default=1000, json_schema_extra={"env": "RESERVATION_EXPORT_CHUNK_SIZE"})
+    RESERVATION_CONFIRM_PIPELINE_ENABLED: bool = Field(
+        default=False, json_schema_extra={"env": "RESERVATION_CONFIRM_PIPELINE_ENABLED"}
+    )
+    # PENDING 예약 생성 시 슬롯 인원을 홀드하고, 만료된 홀드는 백그라운드에서 배치로 반환한다
+    RESERVATION_HOLD_ENABLED: bool = Field(default=False, json_schema_extra={"env": "RESERVATION_HOLD_ENABLED"})
+    RESERVATION_HOLD_TTL_SECONDS: int = Field(default=900, json_schema_extra={"env": "RESERVATION_HOLD_TTL_SECONDS"})
+    RESERVATION_HOLD_SWEEP_INTERVAL_SECONDS: float = Field(
+        default=30.0, json_schema_extra={"env": "RESERVATION_HOLD_SWEEP_INTERVAL_SECONDS"}
+    )
+    RESERVATION_HOLD_SWEEP_BATCH_SIZE: int = Field(
+        default=500, json_schema_extra={"env": "RESERVATION_HOLD_SWEEP_BATCH_SIZE"}
+    )
+    # 확정 예약 삭제 시 한 번에 확인하는 최대 대기 항목 수
+    WAITLIST_PROMOTION_BATCH_SIZE: int = Field(default=100, json_schema_extra={"env": "WAITLIST_PROMOTION_BATCH_SIZE"})
+
+    # slot
+    SLOT_GENERATION_MAX_DAYS: int = Field(default=366, json_schema_extra={"env": "SLOT_GENERATION_MAX_DAYS"})
+    AVAILABILITY_CALENDAR_MAX_DAYS: int = Field(default=62, json_schema_extra={"env": "AVAILABILITY_CALENDAR_MAX_DAYS"})
+    SLOT_INDEX_ENABLED: bool = Field(default=False, json_schema_extra={"env": "SLOT_INDEX_ENABLED"})
+    SLOT_INDEX_TTL_SECONDS: float = Field(default=5.0, json_schema_extra={"env": "SLOT_INDEX_TTL_SECONDS"})
+
+    # cache
+    AVAILABILITY_CACHE_TTL_SECONDS: float = Field(
+        default=2.0, json_schema_extra={"env": "AVAILABILITY_CACHE_TTL_SECONDS"}
+    )
+    AVAILABILITY_CACHE_MAX_SIZE: int = Field(default=1024, json_schema_extra={"env": "AVAILABILITY_CACHE_MAX_SIZE"})
+    USER_CACHE_MAX_SIZE: int = Field(default=10000, json_schema_extra={"env": "USER_CACHE_MAX_SIZE"})
+    USER_CACHE_TTL_SECONDS: float = Field(default=60.0, json_schema_extra={"env": "USER_CACHE_TTL_SECONDS"})
+    USER_NEGATIVE_CACHE_TTL_SECONDS: float = Field(
+        default=5.0, json_schema_extra={"env": "USER_NEGATIVE_CACHE_TTL_SECONDS"}
+    )
 
 
 settings = Config(_env_file=".env", _env_file_encoding="utf-8")
@@ -6,14 +6,23 @@ from dependency_injector import containers, providers
 
 from app.common.auth.auth_guard import AuthGuard
 from app.common.auth.jwt_service import JWTService
+from app.common.auth.password_hasher import PasswordHasher
 from app.common.auth.strategies.jwt_strategy import JWTAuthStrategy
+from app.common.cache.single_flight import SingleFlight
+from app.common.cache.slot_index import SlotIndex
+from app.common.cache.ttl_cache import TTLCache
 from app.common.database.database import Database
+from app.common.middleware.rate_limiter import RateLimiter
 from app.common.respository.reservation_repository import ReservationRepository
 from app.common.respository.slot_repository import SlotRepository
 from app.common.respository.user_repository import AuthRepository
+from app.common.respository.waitlist_repository import WaitlistRepository
 from app.config import Config
 from app.services.auth_service import AuthService
+from app.services.metrics_service import MetricsService
+from app.services.reservation_hold_sweeper import ReservationHoldSweeper
 from app.services.reservation_service import ReservationService
+from app.services.slot_service import SlotService
 
 config_instance = Config()
 json_config = json.dumps(config_instance.model_dump(mode="json"))
@@ -26,22 +35,76 @@ class Container(containers.DeclarativeContainer):
 
     database_url = config_instance.DATABASE_URL
     # Gateways
-    db = providers.Singleton(Database, database_url=database_url)
+    db = providers.Singleton(Database, database_url=database_url, settings=config_instance)
 
     # JWT Service
     jwt_service = providers.Singleton(JWTService, settings=config_instance)
+    # Password Hasher
+    password_hasher = providers.Singleton(
+        PasswordHasher,
+        max_workers=config_instance.PASSWORD_HASH_MAX_WORKERS,
+        n=config_instance.PASSWORD_SCRYPT_N,
+        r=config_instance.PASSWORD_SCRYPT_R,
+        p=config_instance.PASSWORD_SCRYPT_P,
+    )
     # Authentication Strategy
-    jwt_auth_strategy = providers.Singleton(JWTAuthStrategy, jwt_service=jwt_service)
+    jwt_token_cache = providers.Singleton(
+        TTLCache,
+        max_size=config_instance.JWT_CACHE_MAX_SIZE,
+        ttl_seconds=config_instance.JWT_CACHE_TTL_SECONDS,
+    )
+    jwt_auth_strategy = providers.Singleton(JWTAuthStrategy, jwt_service=jwt_service, token_cache=jwt_token_cache)
     # Authentication Guard
     auth_guard = providers.Singleton(AuthGuard, strategy=jwt_auth_strategy)
+    # Rate Limiter
+    rate_limiter = (
+        providers.Singleton(
+            RateLimiter,
+            default_limit=(config_instance.RATE_LIMIT_PER_SECOND, config_instance.RATE_LIMIT_BURST),
+            route_limits=config_instance.RATE_LIMIT_ROUTES,
+            max_buckets=config_instance.RATE_LIMIT_MAX_BUCKETS,
+        )
+        if config_instance.RATE_LIMIT_ENABLED
+        else providers.Object(None)
+    )
+
+    # Caches
+    slot_index = (
+        providers.Singleton(SlotIndex, ttl_seconds=config_instance.SLOT_INDEX_TTL_SECONDS)
+        if config_instance.SLOT_INDEX_ENABLED
+        else providers.Object(None)
+    )
+    availability_cache = providers.Singleton(
+        TTLCache,
+        max_size=config_instance.AVAILABILITY_CACHE_MAX_SIZE,
+        ttl_seconds=config_instance.AVAILABILITY_CACHE_TTL_SECONDS,
+    )
+    slot_single_flight = providers.Singleton(SingleFlight)
+    user_cache = providers.Singleton(
+        TTLCache,
+        max_size=config_instance.USER_CACHE_MAX_SIZE,
+        ttl_seconds=config_instance.USER_CACHE_TTL_SECONDS,
+    )
 
     # Repositories
-    auth_repository = providers.Factory(AuthRepository, session_factory=db.provided.get_session)
+    auth_repository = providers.Factory(
+        AuthRepository,
+        session_factory=db.provided.get_session,
+        user_cache=user_cache,
+        negative_ttl_seconds=config_instance.USER_NEGATIVE_CACHE_TTL_SECONDS,
+    )
     reservation_repository = providers.Factory(ReservationRepository, session_factory=db.provided.get_session)
-    slot_repository = providers.Factory(SlotRepository, session_factory=db.provided.get_session)
+    slot_repository = providers.Factory(
+        SlotRepository, session_factory=db.provided.get_session, single_flight=slot_single_flight
+    )
+    waitlist_repository = providers.Factory(WaitlistRepository, session_factory=db.provided.get_session)
     # Services
     auth_service = providers.Factory(
-        AuthService, repository=auth_repository, settings=config_instance, jwt_service=jwt_service
+        AuthService,
+        repository=auth_repository,
+        settings=config_instance,
+        jwt_service=jwt_service,
+        password_hasher=password_hasher,
     )
     reservation_service = providers.Factory(
         ReservationService,
@@ -49,6 +112,27 @@ class Container(containers.DeclarativeContainer):
         slot_repository=slot_repository,
         settings=config_instance,
         session_factory=db.provided.get_session,
+        slot_index=slot_index,
+        availability_cache=availability_cache,
+        waitlist_repository=waitlist_repository,
+    )
+    reservation_hold_sweeper = (
+        providers.Singleton(
+            ReservationHoldSweeper,
+            reservation_service=reservation_service,
+            interval_seconds=config_instance.RESERVATION_HOLD_SWEEP_INTERVAL_SECONDS,
+            batch_size=config_instance.RESERVATION_HOLD_SWEEP_BATCH_SIZE,
+        )
+        if config_instance.RESERVATION_HOLD_ENABLED
+        else providers.Object(None)
+    )
+    metrics_service = providers.Factory(MetricsService, database=db)
+    slot_service = providers.Factory(
+        SlotService,
+        slot_repository=slot_repository,
+        settings=config_instance,
+        session_factory=db.provided.get_session,
+        availability_cache=availability_cache,
     )
 
 
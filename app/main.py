@@ -1,3 +1,5 @@
+from contextlib import asynccontextmanager
+
 from fastapi import Depends, FastAPI
 from fastapi.security import APIKeyHeader
 
@@ -15,16 +17,30 @@ app_container_modules = [
 def create_app() -> FastAPI:
     container = Container()
     container.wire(modules=app_container_modules)
+
+    @asynccontextmanager
+    async def lifespan(_app: FastAPI):
+        db = container.db()
+        await db.connect()
+        hold_sweeper = container.reservation_hold_sweeper()
+        if hold_sweeper is not None:
+            hold_sweeper.start()
+        yield
+        if hold_sweeper is not None:
+            await hold_sweeper.stop()
+        await db.disconnect()
+        container.password_hasher().close()
+
     # swagger에 헤더 추가
     auth_header = APIKeyHeader(name="Authorization", auto_error=False)
-    app = FastAPI(title="Test Schedule Resesrvation System", dependencies=[Depends(auth_header)])
+    app = FastAPI(title="Test Schedule Resesrvation System", dependencies=[Depends(auth_header)], lifespan=lifespan)
     app.container = container
     app.include_router(api.router)
 
     # middleware 등록
 
     auth_guard = container.auth_guard()
-    app.add_middleware(AuthMiddleware, guard=auth_guard)
+    app.add_middleware(AuthMiddleware, guard=auth_guard, rate_limiter=container.rate_limiter())
     return app
 
 
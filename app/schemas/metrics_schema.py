@@ -0,0 +1,25 @@
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class CacheStatsResponse(BaseModel):
+    hits: int
+    misses: int
+    size: int
+    hit_ratio: float
+
+
+class DatabasePoolStatsResponse(BaseModel):
+    backend: str
+    size: int
+    max_size: int
+    checked_out: int
+    idle: int
+    waiting: int
+    checkouts: int
+    timeouts: int
+    connect_errors: int = 0
+    total_wait_ms: float
+    avg_wait_ms: float
+    max_wait_ms: Optional[float] = None
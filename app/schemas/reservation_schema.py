@@ -1,9 +1,9 @@
 from datetime import date, time
 from typing import Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, TypeAdapter
 
-from app.common.constants import ReservationStatus
+from app.common.constants import ExportFormat, ReservationStatus, WaitlistStatus
 
 
 class ReservationCreateRequest(BaseModel):
@@ -25,6 +25,26 @@ class ReservationResponse(BaseModel):
     model_config = {"from_attributes": True}
 
 
+# 목록 응답은 행 단위 model_validate 대신 미리 생성해 둔 TypeAdapter 로 한 번에 검증한다
+ReservationResponseListAdapter = TypeAdapter(list[ReservationResponse])
+
+
+class ReservationBulkCreateRequest(BaseModel):
+    reservations: list[ReservationCreateRequest]
+
+
+class ReservationBulkCreateResult(BaseModel):
+    index: int
+    is_success: bool
+    reservation: Optional[ReservationResponse] = None
+    detail: Optional[str] = None
+
+
+class ReservationBulkCreateResponse(BaseModel):
+    created_count: int
+    results: list[ReservationBulkCreateResult]
+
+
 class AvailableSlot(BaseModel):
     id: int
     date: date
@@ -35,12 +55,45 @@ class AvailableSlot(BaseModel):
     model_config = {"from_attributes": True}
 
 
+AvailableSlotListAdapter = TypeAdapter(list[AvailableSlot])
+
+
 class AvailableReservationResponse(BaseModel):
     available_slots: list[AvailableSlot]
 
 
+class AvailabilityCalendarDay(BaseModel):
+    date: date
+    min_remaining_capacity: Optional[int] = None
+    max_remaining_capacity: Optional[int] = None
+    slot_count: int = 0
+    available_slot_count: int = 0
+
+    model_config = {"from_attributes": True}
+
+
+class AvailabilityCalendarResponse(BaseModel):
+    days: list[AvailabilityCalendarDay]
+
+
+class ReservationListQuery(BaseModel):
+    limit: Optional[int] = Field(default=None, ge=1)
+    cursor: Optional[str] = None
+    status: Optional[ReservationStatus] = None
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
+
+
+class ReservationExportQuery(BaseModel):
+    format: ExportFormat = ExportFormat.NDJSON
+    status: Optional[ReservationStatus] = None
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
+
+
 class ReservationListResponse(BaseModel):
     reservations: list[ReservationResponse]
+    next_cursor: Optional[str] = None
 
     model_config = {"from_attributes": True}
 
@@ -49,6 +102,21 @@ class ConfirmReservationResponse(BaseModel):
     is_success: bool
 
 
+class BatchConfirmReservationRequest(BaseModel):
+    reservation_ids: list[int]
+
+
+class BatchConfirmResult(BaseModel):
+    reservation_id: int
+    is_success: bool
+    detail: Optional[str] = None
+
+
+class BatchConfirmReservationResponse(BaseModel):
+    confirmed_count: int
+    results: list[BatchConfirmResult]
+
+
 class ReservationUpdateRequest(BaseModel):
     exam_date: Optional[date] = None
     exam_start_time: Optional[time] = None
@@ -62,3 +130,31 @@ class ReservationUpdateResponse(ConfirmReservationResponse):
 
 class DeleteReservationResponse(ConfirmReservationResponse):
     pass
+
+
+class FeasibilityCheckRequest(BaseModel):
+    items: list[ReservationCreateRequest]
+
+
+class FeasibilityResult(BaseModel):
+    index: int
+    is_feasible: bool
+    min_remaining_capacity: Optional[int] = None
+    detail: Optional[str] = None
+
+
+class FeasibilityCheckResponse(BaseModel):
+    results: list[FeasibilityResult]
+
+
+class WaitlistEntryResponse(BaseModel):
+    id: int
+    user_id: int
+    exam_date: date
+    exam_start_time: time
+    exam_end_time: time
+    applicants: int
+    status: WaitlistStatus
+    reservation_id: Optional[int] = None
+
+    model_config = {"from_attributes": True}
@@ -0,0 +1,19 @@
+from datetime import date, time
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class SlotGenerateRequest(BaseModel):
+    start_date: date
+    end_date: date
+    start_time: time = time(9, 0)
+    end_time: time = time(18, 0)
+    interval_minutes: int = 30
+    capacity: Optional[int] = None
+
+
+class SlotGenerateResponse(BaseModel):
+    requested_count: int
+    created_count: int
+    skipped_count: int
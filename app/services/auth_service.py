@@ -1,7 +1,7 @@
-import hashlib
 import logging
 
 from app.common.auth.jwt_service import JWTService
+from app.common.auth.password_hasher import PasswordHasher
 from app.common.database.models.user import User
 from app.common.exceptions import AuthenticationError, DuplicateError
 from app.common.respository.user_repository import AuthRepository
@@ -12,10 +12,17 @@ logger = logging.getLogger(__name__)
 
 
 class AuthService:
-    def __init__(self, repository: AuthRepository, settings: Config, jwt_service: JWTService) -> None:
+    def __init__(
+        self,
+        repository: AuthRepository,
+        settings: Config,
+        jwt_service: JWTService,
+        password_hasher: PasswordHasher,
+    ) -> None:
         self.repository = repository
         self.settings = settings
         self.jwt_service = jwt_service
+        self.password_hasher = password_hasher
 
     async def create_user(self, data: UserCreateRequest) -> UserCreateResponse:
         try:
@@ -23,7 +30,7 @@ class AuthService:
 
             user = User(
                 email=data.email,
-                hashed_password=self._hash_password(data.password),
+                hashed_password=await self.password_hasher.hash(data.password),
                 type=data.type,
             )
 
@@ -38,9 +45,6 @@ class AuthService:
         if existing_user:
             raise DuplicateError("이미 존재하는 이메일입니다.")
 
-    def _hash_password(self, password: str) -> str:
-        return hashlib.sha256(password.encode()).hexdigest()
-
     async def login(self, data: UserLoginRequest) -> UserLoginResponse:
         try:
             user = await self._validate_login(data)
@@ -61,6 +65,18 @@ class AuthService:
         if not user:
             raise AuthenticationError("인증되지 않은 사용자입니다.")
 
-        if user.hashed_password != self._hash_password(data.password):
+        if not await self.password_hasher.verify(data.password, user.hashed_password):
             raise AuthenticationError("인증되지 않은 사용자입니다.")
+
+        if self.password_hasher.needs_rehash(user.hashed_password):
+            await self._upgrade_password_hash(user, data.password)
         return user
+
+    async def _upgrade_password_hash(self, user: User, password: str):
+        # 이전 방식(sha256)이나 다른 파라미터로 저장된 해시는 로그인 성공 시 현재 설정으로 다시 저장한다
+        # 재해시에 실패해도 로그인은 진행한다 (다음 로그인에서 다시 시도)
+        try:
+            hashed_password = await self.password_hasher.hash(password)
+            await self.repository.update_hashed_password(user.id, user.hashed_password, hashed_password)
+        except Exception as e:
+            logger.warning(f"[user/auth_service] upgrade password hash error: {e}")
@@ -0,0 +1,31 @@
+import logging
+
+from app.common.constants import UserType
+from app.common.database.database import Database
+from app.common.exceptions import AuthorizationError
+from app.schemas.metrics_schema import DatabasePoolStatsResponse
+
+logger = logging.getLogger(__name__)
+
+
+class MetricsService:
+    def __init__(self, database: Database) -> None:
+        self.database = database
+
+    async def get_db_pool_stats(self, user_type: UserType) -> DatabasePoolStatsResponse:
+        try:
+            self._validate_admin(user_type)
+
+            stats = self.database.pool_stats()
+            checkouts = stats["checkouts"]
+            return DatabasePoolStatsResponse(
+                **stats,
+                avg_wait_ms=stats["total_wait_ms"] / checkouts if checkouts else 0.0,
+            )
+        except Exception as e:
+            logger.error(f"[service/metrics_service] get_db_pool_stats error: {e}")
+            raise e
+
+    def _validate_admin(self, user_type):
+        if user_type and user_type != UserType.ADMIN:
+            raise AuthorizationError("권한이 없습니다.")
@@ -0,0 +1,53 @@
+import asyncio
+import logging
+from typing import Optional
+
+from app.services.reservation_service import ReservationService
+
+logger = logging.getLogger(__name__)
+
+
+class ReservationHoldSweeper:
+    """
+    만료된 예약 홀드를 주기적으로 반환하는 백그라운드 작업 (RESERVATION_HOLD_ENABLED)
+    - interval_seconds 마다 만료된 홀드를 batch_size 건씩, 남은 건이 없을 때까지 반환한다.
+    - 만료 예약은 idx_reservations_hold_expires_at 부분 인덱스로 조회하며 FOR UPDATE SKIP LOCKED 로 잠그므로
+      여러 프로세스에서 동시에 실행해도 같은 홀드를 두 번 반환하지 않는다.
+    """
+
+    def __init__(self, reservation_service: ReservationService, interval_seconds: float, batch_size: int) -> None:
+        self.reservation_service = reservation_service
+        self.interval_seconds = interval_seconds
+        self.batch_size = batch_size
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def sweep(self) -> int:
+        released_count = 0
+        while True:
+            count = await self.reservation_service.release_expired_holds(self.batch_size)
+            released_count += count
+            if count < self.batch_size:
+                return released_count
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                released_count = await self.sweep()
+                if released_count:
+                    logger.info(f"[service/reservation_hold_sweeper] released {released_count} expired holds")
+            except Exception as e:
+                logger.error(f"[service/reservation_hold_sweeper] sweep error: {e}")
+            await asyncio.sleep(self.interval_seconds)
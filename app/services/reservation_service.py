@@ -1,28 +1,58 @@
+import csv
+import io
+import json
 import logging
-from datetime import datetime, timedelta
+from collections import defaultdict
+from datetime import date, datetime, time, timedelta, timezone
+from enum import Enum
+from typing import AsyncIterator, Optional
 
 from sqlalchemy.ext.asyncio import async_scoped_session
+from sqlalchemy.orm.attributes import set_committed_value
 
-from app.common.constants import ReservationStatus, UserType
+from app.common.cache.slot_index import SlotIndex
+from app.common.cache.ttl_cache import TTLCache
+from app.common.constants import ExportFormat, ReservationStatus, UserType, WaitlistStatus
 from app.common.database.models.reservation import Reservation
+from app.common.database.models.waitlist import WaitlistEntry
 from app.common.exceptions import AuthorizationError, BadRequestError, NotFoundError
+from app.common.pagination import decode_cursor, encode_cursor
 from app.common.respository.reservation_repository import ReservationRepository
 from app.common.respository.slot_repository import SlotRepository
+from app.common.respository.waitlist_repository import WaitlistRepository
 from app.config import Config
+from app.schemas.metrics_schema import CacheStatsResponse
 from app.schemas.reservation_schema import (
+    AvailabilityCalendarDay,
+    AvailabilityCalendarResponse,
     AvailableReservationResponse,
-    AvailableSlot,
+    AvailableSlotListAdapter,
+    BatchConfirmReservationResponse,
+    BatchConfirmResult,
     ConfirmReservationResponse,
     DeleteReservationResponse,
+    FeasibilityCheckRequest,
+    FeasibilityCheckResponse,
+    FeasibilityResult,
+    ReservationBulkCreateRequest,
+    ReservationBulkCreateResponse,
+    ReservationBulkCreateResult,
     ReservationCreateRequest,
+    ReservationExportQuery,
+    ReservationListQuery,
     ReservationListResponse,
     ReservationResponse,
+    ReservationResponseListAdapter,
     ReservationUpdateRequest,
     ReservationUpdateResponse,
+    WaitlistEntryResponse,
 )
 
 logger = logging.getLogger(__name__)
 
+# 내보내기 컬럼 순서 (ReservationRepository 조회 컬럼 순서와 동일)
+RESERVATION_EXPORT_COLUMNS = ("id", "user_id", "exam_date", "exam_start_time", "exam_end_time", "applicants", "status")
+
 
 class ReservationService:
     def __init__(
@@ -31,44 +61,122 @@ class ReservationService:
         slot_repository: SlotRepository,
         settings: Config,
         session_factory: async_scoped_session,
+        slot_index: Optional[SlotIndex] = None,
+        availability_cache: Optional[TTLCache] = None,
+        waitlist_repository: Optional[WaitlistRepository] = None,
     ) -> None:
         self.repository = repository
         self.slot_repository = slot_repository
         self.settings = settings
         self.session_factory = session_factory
+        self.slot_index = slot_index
+        self.availability_cache = availability_cache
+        self.waitlist_repository = waitlist_repository
 
     async def get_available_reservation(self, exam_date: datetime.date) -> AvailableReservationResponse:
         try:
             await self._validate_reservation_input(exam_date, None, None, None)
 
-            available_slots = await self.slot_repository.get_available_slots(exam_date)
+            if self.availability_cache is not None:
+                cached_response = self.availability_cache.get(exam_date)
+                if cached_response is not None:
+                    return cached_response
+
+            # 인덱스 적재와 응답 구성에서 두 번 순회하므로 한 번만 순회 가능한 결과도 목록으로 고정한다
+            available_slots = list(await self.slot_repository.get_available_slots(exam_date))
+            if self.slot_index is not None:
+                self.slot_index.put_slots(available_slots)
 
-            return AvailableReservationResponse(
-                available_slots=[AvailableSlot.model_validate(slot) for slot in available_slots] or []
+            # 이미 검증된 항목으로 응답을 구성하므로 model_construct 로 재검증을 생략한다
+            response = AvailableReservationResponse.model_construct(
+                available_slots=AvailableSlotListAdapter.validate_python(available_slots, from_attributes=True)
             )
+            if self.availability_cache is not None:
+                self.availability_cache.set(exam_date, response)
+            return response
         except Exception as e:
             logger.error(f"[service/reservation_service] get_available_reservation error: {e}")
             raise e
 
-    async def get_reservations_by_user(self, user_id: int) -> ReservationListResponse:
+    async def get_availability_calendar(self, start_date: date, end_date: date) -> AvailabilityCalendarResponse:
+        """
+        기간 내 날짜별 예약 가능 현황(최소/최대 남은 인원, 예약 가능한 슬롯 수)을 조회한다.
+        - 날짜별 집계는 가능한 예약 시간 조회와 같은 캐시에 저장되고 같은 시점에 무효화된다.
+        - 캐시에 없는 날짜만 하나의 GROUP BY 쿼리로 조회한다.
+        """
         try:
-            reservations = await self.repository.get_reservations_by_user_id(user_id)
-            return ReservationListResponse(
-                reservations=[ReservationResponse.model_validate(reservation) for reservation in reservations] or []
+            # 조회 전용이므로 예약 신청 기한(3일 전)은 적용하지 않고 기간만 검증한다
+            if start_date > end_date:
+                raise ValueError("시작 날짜는 종료 날짜보다 이후일 수 없습니다.")
+            if (end_date - start_date).days + 1 > self.settings.AVAILABILITY_CALENDAR_MAX_DAYS:
+                raise ValueError(f"최대 {self.settings.AVAILABILITY_CALENDAR_MAX_DAYS}일까지 조회할 수 있습니다.")
+
+            days: dict[date, AvailabilityCalendarDay] = {}
+            missing_dates = []
+            current_date = start_date
+            while current_date <= end_date:
+                cached_day = (
+                    self.availability_cache.get(("calendar", current_date))
+                    if self.availability_cache is not None
+                    else None
+                )
+                if cached_day is not None:
+                    days[current_date] = cached_day
+                else:
+                    missing_dates.append(current_date)
+                current_date += timedelta(days=1)
+
+            if missing_dates:
+                summaries = await self.slot_repository.get_daily_capacity_summary(missing_dates[0], missing_dates[-1])
+                summary_by_date = {
+                    summary.date: AvailabilityCalendarDay.model_validate(summary) for summary in summaries
+                }
+                for missing_date in missing_dates:
+                    day = summary_by_date.get(missing_date) or AvailabilityCalendarDay(date=missing_date)
+                    days[missing_date] = day
+                    if self.availability_cache is not None:
+                        self.availability_cache.set(("calendar", missing_date), day)
+
+            return AvailabilityCalendarResponse.model_construct(days=[days[day_date] for day_date in sorted(days)])
+        except Exception as e:
+            logger.error(f"[service/reservation_service] get_availability_calendar error: {e}")
+            raise e
+
+    async def get_reservations_by_user(
+        self, user_id: int, query: Optional[ReservationListQuery] = None
+    ) -> ReservationListResponse:
+        try:
+            query = query or ReservationListQuery()
+            limit = self._resolve_page_limit(query.limit)
+            reservations = await self.repository.get_reservations_by_user_id(
+                user_id,
+                limit=limit + 1,
+                after=decode_cursor(query.cursor),
+                status=query.status,
+                start_date=query.start_date,
+                end_date=query.end_date,
             )
+            return self._build_reservation_page(reservations, limit)
         except Exception as e:
             logger.error(f"[service/reservation_service] get_reservations_by_user error: {e}")
             raise e
 
-    async def get_reservations_by_admin(self, user_type: UserType) -> ReservationListResponse:
+    async def get_reservations_by_admin(
+        self, user_type: UserType, query: Optional[ReservationListQuery] = None
+    ) -> ReservationListResponse:
         try:
             self._validate_admin(user_type)
 
-            reservations = await self.repository.get_reservations()
-
-            return ReservationListResponse(
-                reservations=[ReservationResponse.model_validate(reservation) for reservation in reservations] or []
+            query = query or ReservationListQuery()
+            limit = self._resolve_page_limit(query.limit)
+            reservations = await self.repository.get_reservations(
+                limit=limit + 1,
+                after=decode_cursor(query.cursor),
+                status=query.status,
+                start_date=query.start_date,
+                end_date=query.end_date,
             )
+            return self._build_reservation_page(reservations, limit)
         except Exception as e:
             logger.error(f"[service/reservation_service] get_reservations_by_admin error: {e}")
             raise e
@@ -83,7 +191,7 @@ class ReservationService:
                         input_data.exam_end_time,
                         input_data.applicants,
                     )
-                    await self._fetch_and_validate_slots(
+                    overlapping_slots = await self._fetch_and_validate_slots(
                         input_data.exam_date,
                         input_data.exam_start_time,
                         input_data.exam_end_time,
@@ -98,36 +206,269 @@ class ReservationService:
                         exam_end_time=input_data.exam_end_time,
                         applicants=input_data.applicants,
                         status=ReservationStatus.PENDING,
+                        hold_expires_at=self._new_hold_expires_at(),
                     )
                     result = await self.repository.create_reservation_with_external_session(reservation_data, session)
-
-                    return ReservationResponse.model_validate(result)
+                    held_slot_ids = []
+                    if reservation_data.hold_expires_at is not None:
+                        held_slot_ids = await self._hold_capacity(session, result, len(overlapping_slots))
+                    response = ReservationResponse.model_validate(result)
+            if held_slot_ids:
+                if self.slot_index is not None:
+                    self.slot_index.apply_capacity_delta(input_data.exam_date, held_slot_ids, -input_data.applicants)
+                self._invalidate_availability(input_data.exam_date)
+            return response
         except Exception as e:
             logger.error(f"[service/reservation_service] create_reservation error: {e}")
             raise e
 
-    async def confirm_reservations(self, reservation_id: int, user_type: UserType) -> ConfirmReservationResponse:
+    async def create_reservations_bulk(
+        self, input_data: ReservationBulkCreateRequest, user_id: int
+    ) -> ReservationBulkCreateResponse:
+        """
+        여러 예약을 한 번에 생성한다.
+        - 모든 항목을 검증한 뒤, 요청된 날짜의 슬롯을 한 번의 쿼리로 조회하여 각 시간대의 남은 인원을 확인한다.
+        - 생성 가능한 항목은 한 번의 multi-row INSERT 로 생성하고, 항목별 성공/실패 결과를 반환한다.
+        """
         try:
-            self._validate_admin(user_type)
+            self._validate_bulk_size(input_data.reservations)
+
+            results: dict[int, ReservationBulkCreateResult] = {}
+            valid_items = []
+            for index, item in enumerate(input_data.reservations):
+                try:
+                    await self._validate_reservation_input(
+                        item.exam_date, item.exam_start_time, item.exam_end_time, item.applicants
+                    )
+                    valid_items.append((index, item))
+                except ValueError as e:
+                    results[index] = ReservationBulkCreateResult(index=index, is_success=False, detail=str(e))
 
+            hold_expires_at = self._new_hold_expires_at()
+            held_slot_ids: dict[int, list[int]] = {}
             async with self.session_factory() as session:
                 async with session.begin():
-                    reservation = await self._fetch_and_validate_reservation(session, reservation_id)
-                    overlapping_slots = await self._fetch_and_validate_slots(
-                        reservation.exam_date,
-                        reservation.exam_start_time,
-                        reservation.exam_end_time,
-                        reservation.applicants,
+                    # 홀드할 때는 인원을 차감하므로 슬롯을 id 순서로 잠근다
+                    slots = await self.slot_repository.get_slots_by_dates_with_external_session(
+                        list({item.exam_date for _, item in valid_items}),
                         session,
+                        for_update=hold_expires_at is not None,
+                    )
+                    request_slot_index = SlotIndex(ttl_seconds=float("inf"))
+                    request_slot_index.put_slots(slots)
+
+                    creatable_items = []
+                    for index, item in valid_items:
+                        min_remaining_capacity = request_slot_index.get_min_remaining_capacity(
+                            item.exam_date, item.exam_start_time, item.exam_end_time
+                        )
+                        if min_remaining_capacity is None:
+                            detail = "겹치는 슬롯이 없습니다."
+                        elif min_remaining_capacity < item.applicants:
+                            detail = "예약 불가능한 시간대입니다."
+                        else:
+                            if hold_expires_at is not None:
+                                # 뒤 항목은 앞 항목이 홀드한 인원을 제외하고 확인한다
+                                held_slot_ids[index] = self._reserve_slots_in_index(request_slot_index, item)
+                            creatable_items.append((index, item))
+                            continue
+                        results[index] = ReservationBulkCreateResult(index=index, is_success=False, detail=detail)
+
+                    rows = [
+                        {
+                            "user_id": user_id,
+                            "exam_date": item.exam_date,
+                            "exam_start_time": item.exam_start_time,
+                            "exam_end_time": item.exam_end_time,
+                            "applicants": item.applicants,
+                            "status": ReservationStatus.PENDING,
+                        }
+                        for _, item in creatable_items
+                    ]
+                    if hold_expires_at is not None:
+                        for row in rows:
+                            row["hold_expires_at"] = hold_expires_at
+                    created_reservations = await self.repository.bulk_create_reservations_with_external_session(
+                        rows, session
                     )
-                    await self._update_slots_and_confirm_reservation(session, reservation, overlapping_slots)
+                    if held_slot_ids:
+                        await self._hold_capacities_in_index(
+                            session, request_slot_index, creatable_items, created_reservations, held_slot_ids
+                        )
+            if self.slot_index is not None:
+                self.slot_index.put_slots(slots)
+                for index, item in creatable_items:
+                    if index in held_slot_ids:
+                        self.slot_index.apply_capacity_delta(item.exam_date, held_slot_ids[index], -item.applicants)
+            for exam_date in {item.exam_date for index, item in creatable_items if index in held_slot_ids}:
+                self._invalidate_availability(exam_date)
+
+            for (index, _), reservation in zip(creatable_items, created_reservations):
+                results[index] = ReservationBulkCreateResult(
+                    index=index, is_success=True, reservation=ReservationResponse.model_validate(reservation)
+                )
+            return ReservationBulkCreateResponse.model_construct(
+                created_count=len(created_reservations),
+                results=[results[index] for index in range(len(input_data.reservations))],
+            )
+        except Exception as e:
+            logger.error(f"[service/reservation_service] create_reservations_bulk error: {e}")
+            raise e
+
+    async def check_feasibility(self, input_data: FeasibilityCheckRequest) -> FeasibilityCheckResponse:
+        """
+        여러 시간대의 예약 가능 여부를 한 번에 확인한다.
+        요청된 날짜의 슬롯을 한 번의 쿼리로 조회하여 날짜별 구간 최소값 인덱스를 만든 뒤 각 시간대를 O(log n) 으로 확인한다.
+        """
+        try:
+            self._validate_bulk_size(input_data.items)
+
+            async with self.session_factory() as session:
+                slots = await self.slot_repository.get_slots_by_dates_with_external_session(
+                    list({item.exam_date for item in input_data.items}), session
+                )
+            if self.slot_index is not None:
+                self.slot_index.put_slots(slots)
+            request_slot_index = SlotIndex(ttl_seconds=float("inf"))
+            request_slot_index.put_slots(slots)
+
+            results = []
+            for index, item in enumerate(input_data.items):
+                try:
+                    await self._validate_reservation_input(
+                        item.exam_date, item.exam_start_time, item.exam_end_time, item.applicants
+                    )
+                    min_remaining_capacity = request_slot_index.get_min_remaining_capacity(
+                        item.exam_date, item.exam_start_time, item.exam_end_time
+                    )
+                    if min_remaining_capacity is None:
+                        raise ValueError("겹치는 슬롯이 없습니다.")
+                    results.append(
+                        FeasibilityResult(
+                            index=index,
+                            is_feasible=min_remaining_capacity >= item.applicants,
+                            min_remaining_capacity=min_remaining_capacity,
+                        )
+                    )
+                except ValueError as e:
+                    results.append(FeasibilityResult(index=index, is_feasible=False, detail=str(e)))
+            return FeasibilityCheckResponse.model_construct(results=results)
+        except Exception as e:
+            logger.error(f"[service/reservation_service] check_feasibility error: {e}")
+            raise e
+
+    async def confirm_reservations(self, reservation_id: int, user_type: UserType) -> ConfirmReservationResponse:
+        try:
+            self._validate_admin(user_type)
+
+            async with self.session_factory() as session:
+                async with session.begin():
+                    reservation = await self._fetch_and_validate_reservation(session, reservation_id, for_update=True)
+                    if reservation.hold_expires_at is not None:
+                        updated_slot_ids = await self._confirm_held_reservation(session, reservation)
+                    elif self.settings.RESERVATION_CONFIRM_PIPELINE_ENABLED:
+                        updated_slot_ids = await self._confirm_reservation_pipelined(session, reservation)
+                    else:
+                        overlapping_slots = await self._fetch_and_validate_slots(
+                            reservation.exam_date,
+                            reservation.exam_start_time,
+                            reservation.exam_end_time,
+                            reservation.applicants,
+                            session,
+                        )
+                        updated_slot_ids = await self._update_slots_and_confirm_reservation(
+                            session, reservation, overlapping_slots
+                        )
                     await session.commit()
+                if self.slot_index is not None:
+                    self.slot_index.apply_capacity_delta(
+                        reservation.exam_date, updated_slot_ids, -reservation.applicants
+                    )
+                self._invalidate_availability(reservation.exam_date)
                 return ConfirmReservationResponse(is_success=True)
 
         except Exception as e:
             logger.error(f"[service/reservation_service] confirm_reservations error: {e}")
             raise e
 
+    async def confirm_reservations_batch(
+        self, reservation_ids: list[int], user_type: UserType
+    ) -> BatchConfirmReservationResponse:
+        """
+        여러 예약을 하나의 트랜잭션에서 확정한다.
+        - 예약과 슬롯을 id 순서로 잠근 뒤, 예약 id 순서대로 남은 인원을 메모리에서 확인/차감한다.
+        - 슬롯 인원 갱신, 예약 상태 변경, reservation_slots 생성은 각각 한 번의 set-based 쿼리로 처리한다.
+        - 확정할 수 없는 예약은 건너뛰고 결과 목록에 사유를 담는다.
+        """
+        try:
+            self._validate_admin(user_type)
+            self._validate_bulk_size(reservation_ids)
+            reservation_ids = sorted(set(reservation_ids))
+
+            async with self.session_factory() as session:
+                async with session.begin():
+                    reservations = {
+                        reservation.id: reservation
+                        for reservation in await self.repository.get_reservations_by_ids_with_external_session(
+                            reservation_ids, session, for_update=True
+                        )
+                    }
+                    slots = await self.slot_repository.get_slots_by_dates_with_external_session(
+                        list({reservation.exam_date for reservation in reservations.values()}), session, for_update=True
+                    )
+                    batch_slot_index = SlotIndex(ttl_seconds=float("inf"))
+                    batch_slot_index.put_slots(slots)
+
+                    results = []
+                    confirmed = []
+                    for reservation_id in reservation_ids:
+                        reservation = reservations.get(reservation_id)
+                        try:
+                            self._validate_reservation_state(reservation)
+                            if reservation.hold_expires_at is not None:
+                                # 홀드 중인 예약은 생성 시 이미 인원을 차감하고 reservation_slots 를 만들었다
+                                slot_ids = []
+                            else:
+                                slot_ids = self._reserve_slots_in_index(batch_slot_index, reservation)
+                        except (NotFoundError, BadRequestError, ValueError) as e:
+                            results.append(
+                                BatchConfirmResult(reservation_id=reservation_id, is_success=False, detail=str(e))
+                            )
+                            continue
+                        confirmed.append((reservation, slot_ids))
+                        results.append(BatchConfirmResult(reservation_id=reservation_id, is_success=True))
+
+                    remaining_capacities = {
+                        slot_id: batch_slot_index.get_remaining_capacity(reservation.exam_date, slot_id)
+                        for reservation, slot_ids in confirmed
+                        for slot_id in slot_ids
+                    }
+                    await self.slot_repository.update_remaining_capacities_with_external_session(
+                        remaining_capacities, session
+                    )
+                    await self.repository.confirm_reservations_with_external_session(
+                        [reservation.id for reservation, _ in confirmed], session
+                    )
+                    await self.repository.bulk_create_reservation_slots_with_external_session(
+                        [
+                            {"reservation_id": reservation.id, "slot_id": slot_id}
+                            for reservation, slot_ids in confirmed
+                            for slot_id in slot_ids
+                        ],
+                        session,
+                    )
+
+            for reservation, slot_ids in confirmed:
+                if self.slot_index is not None:
+                    self.slot_index.apply_capacity_delta(reservation.exam_date, slot_ids, -reservation.applicants)
+            for exam_date in {reservation.exam_date for reservation, _ in confirmed}:
+                self._invalidate_availability(exam_date)
+
+            return BatchConfirmReservationResponse.model_construct(confirmed_count=len(confirmed), results=results)
+        except Exception as e:
+            logger.error(f"[service/reservation_service] confirm_reservations_batch error: {e}")
+            raise e
+
     async def update_reservation(
         self, input_data: ReservationUpdateRequest, reservation_id: int, user_id: int, user_type: UserType
     ) -> ReservationUpdateResponse:
@@ -135,7 +476,8 @@ class ReservationService:
         try:
             async with self.session_factory() as session:
                 async with session.begin():
-                    reservation = await self._fetch_and_validate_reservation(session, reservation_id)
+                    # 홀드를 반환/재홀드할 수 있으므로 sweeper 와 직렬화되도록 예약 행을 잠근다
+                    reservation = await self._fetch_and_validate_reservation(session, reservation_id, for_update=True)
                     if user_type != UserType.ADMIN:
                         self._validate_user_reservation(reservation.user_id, user_id)
 
@@ -146,13 +488,31 @@ class ReservationService:
                         input_data.applicants or None,
                     )
 
+                    # 홀드 중인 예약의 시간대나 인원이 바뀌면 기존 홀드를 반환하고 변경된 값으로 다시 홀드한다
+                    rehold = reservation.hold_expires_at is not None and any(
+                        (
+                            input_data.exam_date,
+                            input_data.exam_start_time,
+                            input_data.exam_end_time,
+                            input_data.applicants,
+                        )
+                    )
+                    if rehold:
+                        released_exam_date = reservation.exam_date
+                        released_start_time = reservation.exam_start_time
+                        released_end_time = reservation.exam_end_time
+                        released_applicants = reservation.applicants
+                        released_slot_ids = await self._release_hold(session, reservation)
+
+                    overlapping_slots = None
                     if input_data.exam_date or input_data.exam_start_time or input_data.exam_end_time:
-                        await self._fetch_and_validate_slots(
+                        overlapping_slots = await self._fetch_and_validate_slots(
                             input_data.exam_date or reservation.exam_date,
                             input_data.exam_start_time or reservation.exam_start_time,
                             input_data.exam_end_time or reservation.exam_end_time,
                             input_data.applicants or reservation.applicants,
                             session,
+                            use_slot_index=not rehold,
                         )
 
                     reservation.exam_date = input_data.exam_date or reservation.exam_date
@@ -160,8 +520,39 @@ class ReservationService:
                     reservation.exam_end_time = input_data.exam_end_time or reservation.exam_end_time
                     reservation.applicants = input_data.applicants or reservation.applicants
 
+                    if rehold:
+                        if overlapping_slots is None:
+                            overlapping_slots = await self._fetch_and_validate_slots(
+                                reservation.exam_date,
+                                reservation.exam_start_time,
+                                reservation.exam_end_time,
+                                reservation.applicants,
+                                session,
+                                use_slot_index=False,
+                            )
+                        reservation.hold_expires_at = self._new_hold_expires_at()
+                        held_slot_ids = await self._hold_capacity(session, reservation, len(overlapping_slots))
+
                     await self.repository.update_reservation_with_external_session(reservation, session)
+                    if rehold:
+                        # 기존 시간대에서 반환된 인원으로 대기 항목을 승격한다
+                        promoted_entries = []
+                        if released_slot_ids:
+                            promoted_entries = await self._promote_waitlist_entries(
+                                session, released_exam_date, released_start_time, released_end_time
+                            )
                     await session.commit()
+                if rehold:
+                    # 이 트랜잭션의 슬롯 조회 결과는 인덱스에 넣지 않았으므로, 트랜잭션 전 인덱스 값에 변경분만 반영한다
+                    self._apply_released_capacity_to_index(
+                        released_exam_date, released_slot_ids, released_applicants, promoted_entries
+                    )
+                    if self.slot_index is not None:
+                        self.slot_index.apply_capacity_delta(
+                            reservation.exam_date, held_slot_ids, -reservation.applicants
+                        )
+                    self._invalidate_availability(released_exam_date)
+                    self._invalidate_availability(reservation.exam_date)
                 return ReservationUpdateResponse(is_success=True)
         except Exception as e:
             logger.error(f"[service/reservation_service] update_reservation error: {e}")
@@ -171,42 +562,394 @@ class ReservationService:
         try:
             async with self.session_factory() as session:
                 async with session.begin():
-                    reservation = await self._fetch_and_validate_reservation(session, reservation_id, isDelete=True)
+                    # 예약 행을 잠가 sweeper 가 같은 홀드를 동시에 반환하지 않도록 한다
+                    reservation = await self._fetch_and_validate_reservation(
+                        session, reservation_id, isDelete=True, for_update=True
+                    )
                     if user_type != UserType.ADMIN:
                         self._validate_user_reservation(reservation.user_id, user_id)
 
-                    if reservation.status == ReservationStatus.CONFIRMED:
-                        exam_start_datetime = datetime.combine(reservation.exam_date, reservation.exam_start_time)
-                        exam_end_datetime = datetime.combine(reservation.exam_date, reservation.exam_end_time)
-                        overlapping_slots = await self.slot_repository.get_overlapping_slots_with_external_session(
-                            exam_start_datetime, exam_end_datetime, "[]", session
+                    # 확정된 예약과 홀드 중인 예약은 차감한 슬롯(reservation_slots)에 인원을 단일 UPDATE 문으로 반환한다
+                    released_slot_ids, promoted_entries = [], []
+                    if reservation.status == ReservationStatus.CONFIRMED or reservation.hold_expires_at is not None:
+                        released_slot_ids = await self._release_hold(session, reservation)
+                    if released_slot_ids:
+                        promoted_entries = await self._promote_waitlist_entries(
+                            session, reservation.exam_date, reservation.exam_start_time, reservation.exam_end_time
                         )
-                        for slot in overlapping_slots:
-                            slot.remaining_capacity += reservation.applicants
-                            session.add(slot)
                     await self.repository.delete_reservation_with_external_session(reservation.id, session)
                     await session.commit()
+                if released_slot_ids:
+                    self._apply_released_capacity_to_index(
+                        reservation.exam_date, released_slot_ids, reservation.applicants, promoted_entries
+                    )
+                    self._invalidate_availability(reservation.exam_date)
                 return DeleteReservationResponse(is_success=True)
         except Exception as e:
             logger.error(f"[service/reservation_service] delete_reservation error: {e}")
             raise e
 
+    async def join_waitlist(self, input_data: ReservationCreateRequest, user_id: int) -> WaitlistEntryResponse:
+        """
+        인원이 부족한 시간대의 예약 요청을 대기열에 등록한다.
+        - 등록 시점에 인원이 있으면 바로 PENDING 예약을 생성하고 승격된 항목을 반환한다.
+        - 클라이언트는 예약 생성을 반복하는 대신 반환된 항목의 상태(GET /waitlist/{id})를 조회한다.
+        """
+        try:
+            async with self.session_factory() as session:
+                async with session.begin():
+                    await self._validate_reservation_input(
+                        input_data.exam_date,
+                        input_data.exam_start_time,
+                        input_data.exam_end_time,
+                        input_data.applicants,
+                    )
+                    overlapping_slots = await self.slot_repository.get_overlapping_slots_with_external_session(
+                        datetime.combine(input_data.exam_date, input_data.exam_start_time),
+                        datetime.combine(input_data.exam_date, input_data.exam_end_time),
+                        "[]",
+                        session,
+                    )
+                    if not overlapping_slots:
+                        raise ValueError("겹치는 슬롯이 없습니다.")
+
+                    entry = WaitlistEntry(
+                        user_id=user_id,
+                        exam_date=input_data.exam_date,
+                        exam_start_time=input_data.exam_start_time,
+                        exam_end_time=input_data.exam_end_time,
+                        applicants=input_data.applicants,
+                        status=WaitlistStatus.WAITING,
+                    )
+                    if min(slot.remaining_capacity for slot in overlapping_slots) >= input_data.applicants:
+                        await self._promote_waitlist_entry(session, entry, len(overlapping_slots))
+                    entry = await self.waitlist_repository.create_entry_with_external_session(entry, session)
+                    response = WaitlistEntryResponse.model_validate(entry)
+            if response.status == WaitlistStatus.PROMOTED and self.settings.RESERVATION_HOLD_ENABLED:
+                self._invalidate_availability(input_data.exam_date)
+            return response
+        except Exception as e:
+            logger.error(f"[service/reservation_service] join_waitlist error: {e}")
+            raise e
+
+    async def get_waitlist_entry(self, entry_id: int, user_id: int, user_type: UserType) -> WaitlistEntryResponse:
+        try:
+            entry = await self.waitlist_repository.get_entry_by_id(entry_id)
+            if not entry:
+                raise NotFoundError("대기 항목을 찾을 수 없습니다.")
+            if user_type != UserType.ADMIN:
+                self._validate_user_reservation(entry.user_id, user_id)
+            return WaitlistEntryResponse.model_validate(entry)
+        except Exception as e:
+            logger.error(f"[service/reservation_service] get_waitlist_entry error: {e}")
+            raise e
+
+    async def export_reservations(self, user_type: UserType, query: ReservationExportQuery) -> AsyncIterator[str]:
+        """
+        예약 전체를 NDJSON 또는 CSV 로 내보낸다.
+        - 권한 확인은 스트리밍 시작 전에 수행하고, 이후에는 서버 사이드 커서에서 읽은 chunk 단위로 직렬화하여 반환한다.
+        """
+        try:
+            self._validate_admin(user_type)
+            return self._export_reservation_chunks(query)
+        except Exception as e:
+            logger.error(f"[service/reservation_service] export_reservations error: {e}")
+            raise e
+
+    async def _export_reservation_chunks(self, query: ReservationExportQuery) -> AsyncIterator[str]:
+        if query.format == ExportFormat.CSV:
+            yield ",".join(RESERVATION_EXPORT_COLUMNS) + "\r\n"
+
+        async for rows in self.repository.stream_reservations(
+            self.settings.RESERVATION_EXPORT_CHUNK_SIZE,
+            status=query.status,
+            start_date=query.start_date,
+            end_date=query.end_date,
+        ):
+            buffer = io.StringIO()
+            values = ([self._export_value(value) for value in row] for row in rows)
+            if query.format == ExportFormat.CSV:
+                csv.writer(buffer).writerows(values)
+            else:
+                for row in values:
+                    buffer.write(json.dumps(dict(zip(RESERVATION_EXPORT_COLUMNS, row)), ensure_ascii=False))
+                    buffer.write("\n")
+            yield buffer.getvalue()
+
+    def _export_value(self, value):
+        if isinstance(value, (date, time)):
+            return value.isoformat()
+        if isinstance(value, Enum):
+            return value.value
+        return value
+
+    async def get_availability_cache_stats(self, user_type: UserType) -> CacheStatsResponse:
+        self._validate_admin(user_type)
+        if self.availability_cache is None:
+            return CacheStatsResponse(hits=0, misses=0, size=0, hit_ratio=0.0)
+        return CacheStatsResponse(**self.availability_cache.stats())
+
+    def _invalidate_availability(self, exam_date):
+        if self.availability_cache is not None:
+            self.availability_cache.invalidate(exam_date)
+            self.availability_cache.invalidate(("calendar", exam_date))
+
+    async def _promote_waitlist_entries(self, session, exam_date, exam_start_time, exam_end_time):
+        """
+        예약 삭제/수정이나 홀드 만료로 인원이 반환된 시간대의 대기 항목을 같은 트랜잭션에서 승격한다.
+        - 등록 순서(FIFO)로 확인하되, 남은 인원에 맞지 않는 항목은 대기열에 남기고 다음 항목을 확인한다 (first-fit).
+        - PENDING 예약은 인원을 차감하지 않으므로, 이번에 승격한 인원을 조회한 슬롯 인원에서 따로 빼며 반환된 인원 이상 승격하지 않는다.
+        """
+        if self.waitlist_repository is None:
+            return []
+
+        entries = await self.waitlist_repository.get_waiting_entries_with_external_session(
+            exam_date,
+            exam_start_time,
+            exam_end_time,
+            self.settings.WAITLIST_PROMOTION_BATCH_SIZE,
+            session,
+        )
+        if not entries:
+            return []
+
+        window_start_time = min(entry.exam_start_time for entry in entries)
+        window_end_time = max(entry.exam_end_time for entry in entries)
+        slots = await self.slot_repository.get_overlapping_slots_with_external_session(
+            datetime.combine(exam_date, window_start_time),
+            datetime.combine(exam_date, window_end_time),
+            "[]",
+            session,
+        )
+        remaining_capacities = {slot.id: slot.remaining_capacity for slot in slots}
+
+        promoted_entries = []
+        for entry in entries:
+            slot_ids = [
+                slot.id
+                for slot in slots
+                if slot.start_time <= entry.exam_end_time and slot.end_time >= entry.exam_start_time
+            ]
+            if not slot_ids or min(remaining_capacities[slot_id] for slot_id in slot_ids) < entry.applicants:
+                continue
+            if not await self._promote_waitlist_entry(session, entry, len(slot_ids)):
+                continue
+            for slot_id in slot_ids:
+                remaining_capacities[slot_id] -= entry.applicants
+            promoted_entries.append(entry)
+        return promoted_entries
+
+    async def _promote_waitlist_entry(self, session, entry, overlapping_slot_count) -> bool:
+        reservation = Reservation(
+            user_id=entry.user_id,
+            exam_date=entry.exam_date,
+            exam_start_time=entry.exam_start_time,
+            exam_end_time=entry.exam_end_time,
+            applicants=entry.applicants,
+            status=ReservationStatus.PENDING,
+            hold_expires_at=self._new_hold_expires_at(),
+        )
+        if reservation.hold_expires_at is None:
+            reservation = await self.repository.create_reservation_with_external_session(reservation, session)
+        else:
+            # 그 사이 다른 요청이 인원을 가져가 홀드하지 못하면 savepoint 만 롤백하고 대기열에 남긴다
+            try:
+                async with session.begin_nested():
+                    reservation = await self.repository.create_reservation_with_external_session(reservation, session)
+                    await self._hold_capacity(session, reservation, overlapping_slot_count)
+            except ValueError:
+                return False
+        entry.status = WaitlistStatus.PROMOTED
+        entry.reservation_id = reservation.id
+        return True
+
+    async def release_expired_holds(self, batch_size: int) -> int:
+        """
+        홀드가 만료된 예약의 인원을 반환한다 (ReservationHoldSweeper 가 주기적으로 호출한다).
+        - 만료 시각 순서로 최대 batch_size 건을 잠금 조회하고, reservation_slots 삭제와 슬롯 인원 반환을 set-based 쿼리로 처리한다.
+        - 예약은 PENDING 으로 남으며, 이후 확정 시 일반 확정과 같이 남은 인원을 다시 확인한다.
+        - 반환된 시간대의 대기 항목은 같은 트랜잭션에서 승격한다.
+        """
+        try:
+            async with self.session_factory() as session:
+                async with session.begin():
+                    expired_reservations = await self.repository.get_expired_holds_with_external_session(
+                        datetime.now(timezone.utc), batch_size, session
+                    )
+                    if not expired_reservations:
+                        return 0
+                    reservations = {reservation.id: reservation for reservation in expired_reservations}
+                    released_slots = await self.repository.release_holds_with_external_session(
+                        list(reservations), session
+                    )
+                    capacity_deltas = defaultdict(int)
+                    released_slot_ids = defaultdict(list)
+                    for reservation_id, slot_id in released_slots:
+                        capacity_deltas[slot_id] += reservations[reservation_id].applicants
+                        released_slot_ids[reservation_id].append(slot_id)
+                    await self.slot_repository.increment_remaining_capacities_with_external_session(
+                        capacity_deltas, session
+                    )
+
+                    # 반환된 시간대별로 대기 항목을 승격한다
+                    promoted_dates = set()
+                    released_ranges = {
+                        (reservation.exam_date, reservation.exam_start_time, reservation.exam_end_time)
+                        for reservation_id, reservation in reservations.items()
+                        if released_slot_ids[reservation_id]
+                    }
+                    for exam_date, exam_start_time, exam_end_time in sorted(released_ranges):
+                        if await self._promote_waitlist_entries(session, exam_date, exam_start_time, exam_end_time):
+                            promoted_dates.add(exam_date)
+
+            for reservation_id, slot_ids in released_slot_ids.items():
+                reservation = reservations[reservation_id]
+                self._apply_released_capacity_to_index(
+                    reservation.exam_date,
+                    slot_ids,
+                    reservation.applicants,
+                    reservation.exam_date in promoted_dates,
+                )
+            for exam_date in {reservation.exam_date for reservation in expired_reservations}:
+                self._invalidate_availability(exam_date)
+            return len(expired_reservations)
+        except Exception as e:
+            logger.error(f"[service/reservation_service] release_expired_holds error: {e}")
+            raise e
+
+    def _new_hold_expires_at(self) -> Optional[datetime]:
+        if not self.settings.RESERVATION_HOLD_ENABLED:
+            return None
+        return datetime.now(timezone.utc) + timedelta(seconds=self.settings.RESERVATION_HOLD_TTL_SECONDS)
+
+    async def _hold_capacity(self, session, reservation, overlapping_slot_count):
+        # 확정과 같은 단일 UPDATE 문으로 인원을 차감하여 홀드하고, 반환할 슬롯을 reservation_slots 로 기록한다
+        updated_slot_ids = await self.slot_repository.decrement_remaining_capacity_with_external_session(
+            datetime.combine(reservation.exam_date, reservation.exam_start_time),
+            datetime.combine(reservation.exam_date, reservation.exam_end_time),
+            "[]",
+            reservation.applicants,
+            session,
+        )
+        if len(updated_slot_ids) < overlapping_slot_count:
+            raise ValueError("예약 불가능한 시간대입니다.")
+        await self.repository.create_reservation_slots_with_external_session(reservation.id, updated_slot_ids, session)
+        return updated_slot_ids
+
+    async def _hold_capacities_in_index(
+        self, session, request_slot_index, creatable_items, created_reservations, held_slot_ids
+    ):
+        # 일괄 생성: 요청 인덱스에서 차감한 남은 인원을 잠근 슬롯에 한 번에 반영한다
+        await self.slot_repository.update_remaining_capacities_with_external_session(
+            {
+                slot_id: request_slot_index.get_remaining_capacity(item.exam_date, slot_id)
+                for index, item in creatable_items
+                for slot_id in held_slot_ids[index]
+            },
+            session,
+        )
+        await self.repository.bulk_create_reservation_slots_with_external_session(
+            [
+                {"reservation_id": reservation.id, "slot_id": slot_id}
+                for (index, _), reservation in zip(creatable_items, created_reservations)
+                for slot_id in held_slot_ids[index]
+            ],
+            session,
+        )
+
+    async def _release_hold(self, session, reservation):
+        # 홀드/확정으로 차감한 슬롯(reservation_slots)에 인원을 단일 UPDATE 문으로 반환한다 (호출자가 예약 행을 잠근다)
+        released_slots = await self.repository.release_holds_with_external_session([reservation.id], session)
+        await self.slot_repository.increment_remaining_capacities_with_external_session(
+            {slot_id: reservation.applicants for _, slot_id in released_slots}, session
+        )
+        reservation.hold_expires_at = None
+        return [slot_id for _, slot_id in released_slots]
+
+    def _apply_released_capacity_to_index(self, exam_date, slot_ids, applicants, promoted):
+        if self.slot_index is None:
+            return
+        if promoted:
+            # 승격된 대기 항목이 다시 차감한 슬롯은 추적하지 않으므로 다음 조회 시 DB 값으로 채운다
+            self.slot_index.invalidate(exam_date)
+        else:
+            self.slot_index.apply_capacity_delta(exam_date, slot_ids, applicants)
+
+    async def _confirm_held_reservation(self, session, reservation):
+        # 홀드 중인 예약은 생성 시 인원을 차감하고 reservation_slots 를 만들었으므로 상태만 변경한다
+        # (만료되었더라도 sweeper 가 반환하기 전이면 인원은 아직 잡혀 있다. 예약 행 잠금으로 sweeper 와 직렬화된다)
+        reservation.status = ReservationStatus.CONFIRMED
+        reservation.hold_expires_at = None
+        await self.repository.update_reservation_with_external_session(reservation, session)
+        return []
+
     async def _update_slots_and_confirm_reservation(self, session, reservation, overlapping_slots):
-        for slot in overlapping_slots:
-            slot.remaining_capacity -= reservation.applicants
+        exam_start_datetime = datetime.combine(reservation.exam_date, reservation.exam_start_time)
+        exam_end_datetime = datetime.combine(reservation.exam_date, reservation.exam_end_time)
+
+        # 남은 인원 확인과 차감을 단일 UPDATE 문으로 처리한다
+        # 동시에 다른 확정이 먼저 차감하여 차감된 슬롯 수가 겹치는 슬롯 수보다 적으면 트랜잭션을 롤백한다
+        updated_slot_ids = await self.slot_repository.decrement_remaining_capacity_with_external_session(
+            exam_start_datetime, exam_end_datetime, "[]", reservation.applicants, session
+        )
+        if len(updated_slot_ids) < len(overlapping_slots):
+            raise ValueError("예약 불가능한 시간대입니다.")
 
         reservation.status = ReservationStatus.CONFIRMED
-        reservation.slots = overlapping_slots
+        await self.repository.create_reservation_slots_with_external_session(reservation.id, updated_slot_ids, session)
         await self.repository.update_reservation_with_external_session(reservation, session)
+        return updated_slot_ids
 
-    async def _fetch_and_validate_slots(self, exam_date, exam_start_time, exam_end_time, applicants, session):
+    async def _confirm_reservation_pipelined(self, session, reservation):
+        # 슬롯 차감, reservation_slots 생성, 예약 상태 변경을 하나의 pipeline 으로 전송한다 (예약 조회 1회 + pipeline 1회 + commit)
+        self._reject_by_slot_index(
+            reservation.exam_date, reservation.exam_start_time, reservation.exam_end_time, reservation.applicants
+        )
+        overlapping_slot_count, updated_slot_ids = (
+            await self.repository.confirm_reservation_pipelined_with_external_session(
+                reservation.id,
+                datetime.combine(reservation.exam_date, reservation.exam_start_time),
+                datetime.combine(reservation.exam_date, reservation.exam_end_time),
+                "[]",
+                reservation.applicants,
+                session,
+            )
+        )
+        if not overlapping_slot_count:
+            raise ValueError("겹치는 슬롯이 없습니다.")
+        if len(updated_slot_ids) < overlapping_slot_count:
+            raise ValueError("예약 불가능한 시간대입니다.")
+
+        # DB 에는 이미 반영되었으므로 세션이 다시 UPDATE 하지 않도록 커밋된 값으로 설정한다
+        set_committed_value(reservation, "status", ReservationStatus.CONFIRMED)
+        return updated_slot_ids
+
+    def _reject_by_slot_index(self, exam_date, exam_start_time, exam_end_time, applicants):
+        # 인메모리 인덱스로 알고 있는 슬롯만으로도 인원이 부족하면 DB 조회 없이 거절한다
+        if self.slot_index is not None:
+            min_remaining_capacity = self.slot_index.get_min_remaining_capacity(
+                exam_date, exam_start_time, exam_end_time
+            )
+            if min_remaining_capacity is not None and min_remaining_capacity < applicants:
+                raise ValueError("예약 불가능한 시간대입니다.")
+
+    async def _fetch_and_validate_slots(
+        self, exam_date, exam_start_time, exam_end_time, applicants, session, use_slot_index=True
+    ):
         exam_start_datetime = datetime.combine(exam_date, exam_start_time)
         exam_end_datetime = datetime.combine(exam_date, exam_end_time)
 
+        # 같은 트랜잭션에서 반환한 인원은 아직 인메모리 인덱스에 반영되지 않았으므로, 그 경우 인덱스로 거절하지 않고
+        # 커밋 전 값을 인덱스에 넣지도 않는다 (호출자가 커밋 후 변경분을 반영한다)
+        if use_slot_index:
+            self._reject_by_slot_index(exam_date, exam_start_time, exam_end_time, applicants)
+
         # 겹치는 슬롯중 최소 남은 인원수가 지원자 수보다 적으면 안된다
         overlapping_slots = await self.slot_repository.get_overlapping_slots_with_external_session(
             exam_start_datetime, exam_end_datetime, "[]", session
         )
+        if use_slot_index and self.slot_index is not None:
+            self.slot_index.put_slots(overlapping_slots)
         if overlapping_slots:
             min_remaining_capacity = min(overlapping_slot.remaining_capacity for overlapping_slot in overlapping_slots)
             if min_remaining_capacity < applicants:
@@ -215,15 +958,34 @@ class ReservationService:
             raise ValueError("겹치는 슬롯이 없습니다.")
         return overlapping_slots
 
-    async def _fetch_and_validate_reservation(self, session, reservation_id, isDelete=False):
-        reservation = await self.repository.get_reservation_by_id_with_external_session(reservation_id, session)
+    def _reserve_slots_in_index(self, slot_index, reservation):
+        slot_ids = slot_index.get_overlapping_slot_ids(
+            reservation.exam_date, reservation.exam_start_time, reservation.exam_end_time
+        )
+        if not slot_ids:
+            raise ValueError("겹치는 슬롯이 없습니다.")
+        min_remaining_capacity = slot_index.get_min_remaining_capacity(
+            reservation.exam_date, reservation.exam_start_time, reservation.exam_end_time
+        )
+        if min_remaining_capacity < reservation.applicants:
+            raise ValueError("예약 불가능한 시간대입니다.")
+        slot_index.apply_capacity_delta(reservation.exam_date, slot_ids, -reservation.applicants)
+        return slot_ids
+
+    async def _fetch_and_validate_reservation(self, session, reservation_id, isDelete=False, for_update=False):
+        reservation = await self.repository.get_reservation_by_id_with_external_session(
+            reservation_id, session, for_update=for_update
+        )
+        self._validate_reservation_state(reservation, isDelete)
+        return reservation
+
+    def _validate_reservation_state(self, reservation, isDelete=False):
         if not reservation:
             raise NotFoundError("예약을 찾을 수 없습니다.")
         if (not isDelete and (reservation.status != ReservationStatus.PENDING)) or (
             datetime.combine(reservation.exam_date, reservation.exam_start_time) < datetime.now()
         ):
             raise BadRequestError("수정 가능한 예약이 아닙니다.")
-        return reservation
 
     async def _validate_reservation_input(self, exam_date, exam_start_time, exam_end_time, applicants):
         today = datetime.now().date()
@@ -234,6 +996,23 @@ class ReservationService:
         if applicants and (applicants < 1 or applicants > self.settings.MAX_APPLICANTS):
             raise ValueError(f"응시자 수는 1 이상 {self.settings.MAX_APPLICANTS} 이하로 설정해야 합니다.")
 
+    def _resolve_page_limit(self, limit: Optional[int]) -> int:
+        if limit is None:
+            return self.settings.RESERVATION_PAGE_DEFAULT_LIMIT
+        return min(limit, self.settings.RESERVATION_PAGE_MAX_LIMIT)
+
+    def _build_reservation_page(self, reservations, limit: int) -> ReservationListResponse:
+        # limit + 1 개를 조회하여 다음 페이지 존재 여부를 판단한다
+        page = ReservationResponseListAdapter.validate_python(reservations[:limit], from_attributes=True)
+        next_cursor = None
+        if len(reservations) > limit and page:
+            next_cursor = encode_cursor(page[-1].exam_date, page[-1].id)
+        return ReservationListResponse.model_construct(reservations=page, next_cursor=next_cursor)
+
+    def _validate_bulk_size(self, items):
+        if not items or len(items) > self.settings.BULK_REQUEST_MAX_ITEMS:
+            raise ValueError(f"요청 항목 수는 1 이상 {self.settings.BULK_REQUEST_MAX_ITEMS} 이하로 설정해야 합니다.")
+
     def _validate_admin(self, user_type):
         if user_type and user_type != UserType.ADMIN:
             raise AuthorizationError("권한이 없습니다.")
@@ -0,0 +1,110 @@
+import logging
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Optional
+
+from sqlalchemy.dialects.postgresql import Range
+from sqlalchemy.ext.asyncio import async_scoped_session
+
+from app.common.cache.ttl_cache import TTLCache
+from app.common.constants import UserType
+from app.common.exceptions import AuthorizationError
+from app.common.respository.slot_repository import SlotRepository
+from app.config import Config
+from app.schemas.slot_schema import SlotGenerateRequest, SlotGenerateResponse
+
+logger = logging.getLogger(__name__)
+
+
+class SlotService:
+    def __init__(
+        self,
+        slot_repository: SlotRepository,
+        settings: Config,
+        session_factory: async_scoped_session,
+        availability_cache: Optional[TTLCache] = None,
+    ) -> None:
+        self.slot_repository = slot_repository
+        self.settings = settings
+        self.session_factory = session_factory
+        self.availability_cache = availability_cache
+
+    async def generate_slots(self, input_data: SlotGenerateRequest, user_type: UserType) -> SlotGenerateResponse:
+        try:
+            self._validate_admin(user_type)
+            self._validate_generate_input(input_data)
+
+            slots = self._build_slots(
+                input_data.start_date,
+                input_data.end_date,
+                input_data.start_time,
+                input_data.end_time,
+                input_data.interval_minutes,
+                input_data.capacity or self.settings.MAX_APPLICANTS,
+            )
+
+            async with self.session_factory() as session:
+                async with session.begin():
+                    created_count = await self.slot_repository.bulk_create_slots_with_external_session(slots, session)
+            if created_count and self.availability_cache is not None:
+                self.availability_cache.clear()
+
+            return SlotGenerateResponse(
+                requested_count=len(slots),
+                created_count=created_count,
+                skipped_count=len(slots) - created_count,
+            )
+        except Exception as e:
+            logger.error(f"[service/slot_service] generate_slots error: {e}")
+            raise e
+
+    def _build_slots(
+        self,
+        start_date: date,
+        end_date: date,
+        start_time: time,
+        end_time: time,
+        interval_minutes: int,
+        capacity: int,
+    ) -> list[dict]:
+        # 시간대는 서버에서 utc 기준으로 저장한다 (sql/.sql 과 동일한 '[]' 범위)
+        interval = timedelta(minutes=interval_minutes)
+        slots = []
+        current_date = start_date
+        while current_date <= end_date:
+            slot_start = datetime.combine(current_date, start_time, tzinfo=timezone.utc)
+            day_end = datetime.combine(current_date, end_time, tzinfo=timezone.utc)
+            while slot_start + interval <= day_end:
+                slot_end = slot_start + interval
+                slots.append(
+                    {
+                        "date": current_date,
+                        "start_time": slot_start.time(),
+                        "end_time": slot_end.time(),
+                        "time_range": Range(slot_start, slot_end, bounds="[]"),
+                        "remaining_capacity": capacity,
+                    }
+                )
+                slot_start = slot_end
+            current_date += timedelta(days=1)
+        return slots
+
+    def _validate_generate_input(self, input_data: SlotGenerateRequest):
+        if input_data.start_date > input_data.end_date:
+            raise ValueError("시작 날짜는 종료 날짜보다 이후일 수 없습니다.")
+        if (input_data.end_date - input_data.start_date).days + 1 > self.settings.SLOT_GENERATION_MAX_DAYS:
+            raise ValueError(f"슬롯은 한 번에 최대 {self.settings.SLOT_GENERATION_MAX_DAYS}일까지 생성할 수 있습니다.")
+        if input_data.start_time >= input_data.end_time:
+            raise ValueError("시작 시간은 종료 시간보다 이전이어야 합니다.")
+        day_minutes = (
+            datetime.combine(date.min, input_data.end_time) - datetime.combine(date.min, input_data.start_time)
+        ).total_seconds() // 60
+        if input_data.interval_minutes < 1 or input_data.interval_minutes > day_minutes:
+            raise ValueError("슬롯 간격은 1분 이상, 하루 운영 시간 이하로 설정해야 합니다.")
+        if input_data.capacity is not None and (
+            input_data.capacity < 1 or input_data.capacity > self.settings.MAX_APPLICANTS
+        ):
+            raise ValueError(f"슬롯 수용 인원은 1 이상 {self.settings.MAX_APPLICANTS} 이하로 설정해야 합니다.")
+
+    def _validate_admin(self, user_type):
+        if user_type and user_type != UserType.ADMIN:
+            raise AuthorizationError("권한이 없습니다.")
@@ -0,0 +1,154 @@
+# 부하 테스트용 비동기 HTTP 드라이버 (추가 의존성 없음)
+# - ASGIClient : 앱을 같은 프로세스에서 ASGI 로 직접 호출한다 (네트워크/서버 비용 제외)
+# - HTTPClient : 실행 중인 서버(uvicorn 등)에 keep-alive HTTP/1.1 커넥션 풀로 요청한다
+import asyncio
+import json
+from dataclasses import dataclass, field
+from typing import Any, Optional
+from urllib.parse import urlsplit
+
+
+@dataclass
+class Response:
+    status: int
+    headers: dict[str, str]
+    body: bytes
+    # 앱 내부에서 발생한 예외 (ASGIClient 에서만, 500 응답의 원인 분류용)
+    error: Optional[str] = field(default=None)
+
+    def json(self) -> Any:
+        return json.loads(self.body) if self.body else None
+
+    @property
+    def text(self) -> str:
+        return self.body.decode("utf-8", errors="replace")
+
+
+def _encode_body(json_body: Any) -> bytes:
+    return json.dumps(json_body, default=str).encode() if json_body is not None else b""
+
+
+def _request_headers(token: Optional[str], body: bytes) -> list[tuple[bytes, bytes]]:
+    headers = [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())]
+    if token is not None:
+        headers.append((b"authorization", f"Bearer {token}".encode()))
+    return headers
+
+
+class ASGIClient:
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def request(self, method: str, path: str, json_body: Any = None, token: Optional[str] = None) -> Response:
+        body = _encode_body(json_body)
+        path, _, query_string = path.partition("?")
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": method,
+            "scheme": "http",
+            "server": ("loadtest", 80),
+            "client": ("127.0.0.1", 0),
+            "root_path": "",
+            "path": path,
+            "raw_path": path.encode(),
+            "query_string": query_string.encode(),
+            "headers": _request_headers(token, body),
+        }
+        request_sent = False
+        status, headers, chunks = 0, {}, []
+
+        async def receive():
+            nonlocal request_sent
+            if request_sent:
+                # 응답을 보낸 뒤에는 연결 종료를 기다리는 것처럼 동작한다
+                await asyncio.Event().wait()
+            request_sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+
+        async def send(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                headers.update((key.decode().lower(), value.decode()) for key, value in message.get("headers", []))
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+
+        try:
+            await self.app(scope, receive, send)
+        except Exception as e:
+            # ServerErrorMiddleware 는 500 응답을 보낸 뒤 예외를 다시 발생시킨다
+            return Response(
+                status=status or 500, headers=headers, body=b"".join(chunks), error=f"{type(e).__name__}: {e}"
+            )
+        return Response(status=status, headers=headers, body=b"".join(chunks))
+
+    async def close(self) -> None:
+        pass
+
+
+class HTTPClient:
+    def __init__(self, base_url: str, max_connections: int = 100) -> None:
+        parsed = urlsplit(base_url)
+        if parsed.scheme != "http":
+            raise ValueError("HTTPClient 는 http:// 주소만 지원합니다.")
+        self.host = parsed.hostname or "localhost"
+        self.port = parsed.port or 80
+        self.base_path = parsed.path.rstrip("/")
+        self._semaphore = asyncio.Semaphore(max_connections)
+        self._idle: list[tuple[asyncio.StreamReader, asyncio.StreamWriter]] = []
+
+    async def request(self, method: str, path: str, json_body: Any = None, token: Optional[str] = None) -> Response:
+        body = _encode_body(json_body)
+        head = [f"{method} {self.base_path}{path} HTTP/1.1", f"host: {self.host}:{self.port}"]
+        head += [f"{key.decode()}: {value.decode()}" for key, value in _request_headers(token, body)]
+        payload = ("\r\n".join(head) + "\r\n\r\n").encode() + body
+
+        async with self._semaphore:
+            reused = bool(self._idle)
+            connection = self._idle.pop() if reused else await asyncio.open_connection(self.host, self.port)
+            try:
+                response = await self._send(connection, payload)
+            except (ConnectionError, asyncio.IncompleteReadError):
+                connection[1].close()
+                if not reused:
+                    raise
+                # 서버가 닫은 keep-alive 커넥션이면 새 커넥션으로 한 번 더 보낸다
+                connection = await asyncio.open_connection(self.host, self.port)
+                response = await self._send(connection, payload)
+
+            if response.headers.get("connection", "").lower() == "close":
+                connection[1].close()
+            else:
+                self._idle.append(connection)
+            return response
+
+    async def close(self) -> None:
+        while self._idle:
+            _, writer = self._idle.pop()
+            writer.close()
+
+    @staticmethod
+    async def _send(connection: tuple[asyncio.StreamReader, asyncio.StreamWriter], payload: bytes) -> Response:
+        reader, writer = connection
+        writer.write(payload)
+        await writer.drain()
+
+        status_line = await reader.readuntil(b"\r\n")
+        status = int(status_line.split()[1])
+        headers = {}
+        while (line := await reader.readuntil(b"\r\n")) != b"\r\n":
+            key, _, value = line.decode("latin-1").partition(":")
+            headers[key.strip().lower()] = value.strip()
+
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            chunks = []
+            while size := int((await reader.readuntil(b"\r\n")).split(b";")[0], 16):
+                chunks.append(await reader.readexactly(size))
+                await reader.readexactly(2)
+            await reader.readuntil(b"\r\n")
+            body = b"".join(chunks)
+        else:
+            body = await reader.readexactly(int(headers.get("content-length", 0)))
+        return Response(status=status, headers=headers, body=body)
@@ -0,0 +1,144 @@
+# 부하 테스트 데이터 준비 및 정합성 확인
+# - 부하 테스트 전용 DB (docker/docker-compose.yml 의 로컬 Postgres) 를 대상으로 한다.
+# - 준비 시 시험 날짜(exam_date)의 예약/대기 항목/슬롯을 모두 삭제하므로 운영 DB 에서 실행하지 않는다.
+from dataclasses import dataclass, field
+from datetime import date, time
+from typing import Any
+
+import psycopg
+
+from app.common.auth.jwt_service import JWTService
+from app.common.constants import UserType
+from app.config import Config
+
+SLOT_START_TIME = time(9, 0)
+SLOT_END_TIME = time(10, 0)
+
+_UPSERT_USERS_SQL = """
+INSERT INTO users (email, hashed_password, type)
+SELECT %(prefix)s || i || '@loadtest.local', '!', %(type)s::user_type
+FROM generate_series(1, %(count)s) AS i
+ON CONFLICT (email) DO UPDATE SET type = EXCLUDED.type
+RETURNING id
+"""
+
+_CAPACITY_SQL = """
+SELECT
+    s.id,
+    s.remaining_capacity,
+    COALESCE(SUM(r.applicants), 0) AS consumed,
+    COALESCE(SUM(r.applicants) FILTER (WHERE r.status = 'CONFIRMED'), 0) AS confirmed
+FROM slots s
+LEFT JOIN reservation_slots rs ON rs.slot_id = s.id
+LEFT JOIN reservations r ON r.id = rs.reservation_id
+WHERE s.date = %(exam_date)s
+GROUP BY s.id, s.remaining_capacity
+ORDER BY s.id
+"""
+
+_RESERVATION_COUNTS_SQL = """
+SELECT status::text, COUNT(*), COALESCE(SUM(applicants), 0)
+FROM reservations
+WHERE exam_date = %(exam_date)s
+GROUP BY status
+"""
+
+
+@dataclass
+class LoadTestEnvironment:
+    """
+    시험 날짜 하나에 09:00~10:00 (UTC) 슬롯 하나를 만들고, 모든 요청이 이 슬롯을 두고 경쟁하도록 한다.
+    사용자는 SQL 로 한 번에 만들고 토큰은 서버와 같은 JWT 설정으로 직접 발급한다 (비밀번호 해시/로그인 비용 제외).
+    """
+
+    settings: Config
+    exam_date: date
+    capacity: int
+    user_tokens: list[str] = field(default_factory=list)
+    admin_tokens: list[str] = field(default_factory=list)
+
+    @property
+    def reservation_body(self) -> dict[str, Any]:
+        return {
+            "exam_date": self.exam_date.isoformat(),
+            "exam_start_time": SLOT_START_TIME.isoformat(),
+            "exam_end_time": SLOT_END_TIME.isoformat(),
+        }
+
+    async def prepare(self, client, users: int, admins: int) -> None:
+        async with await self._connect() as connection:
+            async with connection.transaction():
+                # reservation_slots 는 ON DELETE CASCADE
+                await connection.execute("DELETE FROM waitlist_entries WHERE exam_date = %s", (self.exam_date,))
+                await connection.execute("DELETE FROM reservations WHERE exam_date = %s", (self.exam_date,))
+                await connection.execute("DELETE FROM slots WHERE date = %s", (self.exam_date,))
+                user_ids = await self._upsert_users(connection, "loadtest-user-", UserType.USER, users)
+                admin_ids = await self._upsert_users(connection, "loadtest-admin-", UserType.ADMIN, admins)
+
+        jwt_service = JWTService(self.settings)
+        self.user_tokens = [self._token(jwt_service, user_id, UserType.USER) for user_id in user_ids]
+        self.admin_tokens = [self._token(jwt_service, admin_id, UserType.ADMIN) for admin_id in admin_ids]
+
+        # 슬롯 생성은 관리자 API 로 요청한다 (가용 인원 캐시 무효화 포함)
+        response = await client.request(
+            "POST",
+            "/api/v1/admin/slots/generate",
+            json_body={
+                "start_date": self.exam_date.isoformat(),
+                "end_date": self.exam_date.isoformat(),
+                "start_time": SLOT_START_TIME.isoformat(),
+                "end_time": SLOT_END_TIME.isoformat(),
+                "interval_minutes": 60,
+                "capacity": self.capacity,
+            },
+            token=self.admin_tokens[0],
+        )
+        if response.status != 201 or response.json()["created_count"] != 1:
+            raise RuntimeError(f"슬롯 생성 실패: {response.status} {response.text} {response.error or ''}")
+
+    async def check_capacity(self) -> dict[str, Any]:
+        """
+        슬롯 인원 정합성을 확인한다.
+        - oversold : 확정된 인원이 슬롯 수용 인원을 넘었거나 남은 인원이 음수
+        - capacity_drift : (수용 인원 - 남은 인원) 과 reservation_slots 로 연결된 예약 인원 합계의 차이
+        """
+        async with await self._connect() as connection:
+            slot_rows = await (await connection.execute(_CAPACITY_SQL, {"exam_date": self.exam_date})).fetchall()
+            count_rows = await (
+                await connection.execute(_RESERVATION_COUNTS_SQL, {"exam_date": self.exam_date})
+            ).fetchall()
+
+        slots = []
+        for slot_id, remaining_capacity, consumed, confirmed in slot_rows:
+            slots.append(
+                {
+                    "slot_id": slot_id,
+                    "capacity": self.capacity,
+                    "remaining_capacity": remaining_capacity,
+                    "consumed": consumed,
+                    "confirmed": confirmed,
+                    "oversold_by": max(0, confirmed - self.capacity, -remaining_capacity),
+                    "capacity_drift": (self.capacity - remaining_capacity) - consumed,
+                }
+            )
+        return {
+            "oversold_slots": sum(1 for slot in slots if slot["oversold_by"]),
+            "drifted_slots": sum(1 for slot in slots if slot["capacity_drift"]),
+            "slots": slots,
+            "reservations": {status: {"count": count, "applicants": total} for status, count, total in count_rows},
+        }
+
+    async def _connect(self) -> psycopg.AsyncConnection:
+        return await psycopg.AsyncConnection.connect(f"postgresql://{self.settings.DATABASE_URL}")
+
+    @staticmethod
+    async def _upsert_users(connection, prefix: str, user_type: UserType, count: int) -> list[int]:
+        cursor = await connection.execute(
+            _UPSERT_USERS_SQL, {"prefix": prefix, "type": user_type.value, "count": count}
+        )
+        return sorted(row[0] for row in await cursor.fetchall())
+
+    @staticmethod
+    def _token(jwt_service: JWTService, user_id: int, user_type: UserType) -> str:
+        # AuthService.login 과 같은 claims
+        return jwt_service.create_access_token(data={"user_id": user_id, "type": str(user_type)})
@@ -0,0 +1,116 @@
+# 부하 테스트 결과 수집: 작업(operation)별 지연/상태 코드/오류 유형, 카운터, JSON 요약
+import time as timer
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from benchmarks.loadtest.client import Response
+
+
+def percentile(sorted_samples: list[float], q: float) -> Optional[float]:
+    """nearest-rank 백분위수 (q: 0~100)"""
+    if not sorted_samples:
+        return None
+    rank = max(1, round(q / 100 * len(sorted_samples)))
+    return round(sorted_samples[min(rank, len(sorted_samples)) - 1], 3)
+
+
+def classify_error(status: int, text: str) -> str:
+    """실패 응답을 유형별로 분류한다 (DB 동시성 오류는 메시지로 구분)"""
+    lowered = text.lower()
+    if "deadlock detected" in lowered:
+        return "deadlock"
+    if "could not serialize" in lowered:
+        return "serialization_failure"
+    if "lock timeout" in lowered or "canceling statement due to lock timeout" in lowered:
+        return "lock_timeout"
+    if status == 0:
+        return "transport"
+    if status == 429:
+        return "rate_limited"
+    if status >= 500:
+        return "server_error"
+    return "rejected"
+
+
+@dataclass
+class OperationStats:
+    latencies_ms: list[float] = field(default_factory=list)
+    statuses: Counter = field(default_factory=Counter)
+    errors: Counter = field(default_factory=Counter)
+
+    def summary(self, elapsed_seconds: float) -> dict[str, Any]:
+        samples = sorted(self.latencies_ms)
+        return {
+            "requests": len(samples),
+            "throughput_rps": round(len(samples) / elapsed_seconds, 2) if elapsed_seconds else None,
+            "latency_ms": {
+                "mean": round(sum(samples) / len(samples), 3) if samples else None,
+                "p50": percentile(samples, 50),
+                "p95": percentile(samples, 95),
+                "p99": percentile(samples, 99),
+                "max": round(samples[-1], 3) if samples else None,
+            },
+            "statuses": {str(status): count for status, count in sorted(self.statuses.items())},
+            "errors": dict(self.errors),
+        }
+
+
+class Recorder:
+    def __init__(self) -> None:
+        self.operations: defaultdict[str, OperationStats] = defaultdict(OperationStats)
+        # 응답 본문에서 확인한 항목 단위 결과 (예: 일괄 확정의 항목별 실패 사유)
+        self.counters: Counter = Counter()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+
+    def start(self) -> None:
+        self.started_at = timer.perf_counter()
+
+    def finish(self) -> None:
+        self.finished_at = timer.perf_counter()
+
+    async def call(
+        self, operation: str, client, method: str, path: str, json_body: Any = None, token: Optional[str] = None
+    ) -> Optional[Response]:
+        """요청 하나를 보내고 지연/상태를 기록한다. 전송 자체가 실패하면 None 을 반환한다."""
+        stats = self.operations[operation]
+        started = timer.perf_counter()
+        try:
+            response = await client.request(method, path, json_body=json_body, token=token)
+        except Exception as e:
+            stats.latencies_ms.append((timer.perf_counter() - started) * 1000)
+            stats.statuses[0] += 1
+            stats.errors[classify_error(0, str(e))] += 1
+            return None
+
+        stats.latencies_ms.append((timer.perf_counter() - started) * 1000)
+        stats.statuses[response.status] += 1
+        if response.status >= 400:
+            stats.errors[classify_error(response.status, f"{response.text} {response.error or ''}")] += 1
+        return response
+
+    def count(self, name: str, amount: int = 1) -> None:
+        self.counters[name] += amount
+
+    @property
+    def elapsed_seconds(self) -> float:
+        if self.started_at is None:
+            return 0.0
+        return (self.finished_at or timer.perf_counter()) - self.started_at
+
+    def summary(self) -> dict[str, Any]:
+        elapsed = self.elapsed_seconds
+        total_requests = sum(len(stats.latencies_ms) for stats in self.operations.values())
+        errors = Counter()
+        for stats in self.operations.values():
+            errors.update(stats.errors)
+        return {
+            "elapsed_seconds": round(elapsed, 3),
+            "requests": total_requests,
+            "throughput_rps": round(total_requests / elapsed, 2) if elapsed else None,
+            "deadlocks": errors["deadlock"] + self.counters["deadlock"],
+            "errors": dict(errors),
+            "counters": dict(self.counters),
+            "operations": {name: stats.summary(elapsed) for name, stats in sorted(self.operations.items())},
+        }
@@ -0,0 +1,150 @@
+# 예약 경쟁 부하 테스트
+# 사용법:
+#   docker compose -f docker/docker-compose.yml up -d && alembic upgrade head
+#   python -m benchmarks.loadtest.run opening_rush                        # 앱을 같은 프로세스에서 ASGI 로 호출
+#   python -m benchmarks.loadtest.run all --users 5000 --concurrency 500
+#   python -m benchmarks.loadtest.run cancellation_churn --base-url http://localhost:8000   # 실행 중인 서버
+#   python -m benchmarks.loadtest.run opening_rush --compare benchmarks/loadtest/results/opening_rush-<이전>.json
+# 결과는 --output-dir 에 <scenario>-<시각>.json 으로 저장된다.
+# 준비 단계에서 --exam-date 의 예약/대기 항목/슬롯을 삭제하므로 부하 테스트 전용 DB 에서만 실행한다.
+import argparse
+import asyncio
+import json
+import os
+from dataclasses import asdict, fields
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Optional
+
+from benchmarks.loadtest.client import ASGIClient, HTTPClient
+from benchmarks.loadtest.environment import LoadTestEnvironment
+from benchmarks.loadtest.metrics import Recorder
+from benchmarks.loadtest.scenarios import SCENARIOS, ScenarioOptions
+
+DEFAULT_OUTPUT_DIR = Path(__file__).parent / "results"
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="예약 생성/확정 경쟁 부하 테스트")
+    parser.add_argument("scenario", choices=[*SCENARIOS, "all"])
+    parser.add_argument("--base-url", default=None, help="실행 중인 서버 주소 (없으면 앱을 같은 프로세스에서 실행)")
+    parser.add_argument(
+        "--exam-date",
+        type=date.fromisoformat,
+        default=date.today() + timedelta(days=30),
+        help="경쟁 대상 슬롯의 날짜 (YYYY-MM-DD, 기본: 30일 후)",
+    )
+    for option in fields(ScenarioOptions):
+        parser.add_argument(f"--{option.name.replace('_', '-')}", type=int, default=option.default)
+    parser.add_argument(
+        "--disable-rate-limit",
+        action="store_true",
+        help="같은 프로세스 실행 시 요청 제한(RATE_LIMIT_ENABLED)을 끈다",
+    )
+    parser.add_argument("--output-dir", type=Path, default=DEFAULT_OUTPUT_DIR)
+    parser.add_argument("--compare", type=Path, default=None, help="비교할 이전 결과 JSON")
+    return parser.parse_args()
+
+
+async def run_scenario(name: str, client, args: argparse.Namespace, options: ScenarioOptions, settings) -> dict:
+    env = LoadTestEnvironment(settings=settings, exam_date=args.exam_date, capacity=options.capacity)
+    await env.prepare(client, users=options.users, admins=options.admins)
+
+    recorder = Recorder()
+    recorder.start()
+    await SCENARIOS[name](env, client, recorder, options)
+    recorder.finish()
+
+    return {
+        "scenario": name,
+        "started_at": datetime.now(timezone.utc).isoformat(),
+        "mode": "http" if args.base_url else "in-process",
+        "base_url": args.base_url,
+        "exam_date": args.exam_date.isoformat(),
+        "options": asdict(options),
+        # 같은 프로세스 실행일 때만 서버 설정과 일치한다
+        "settings": {
+            key: getattr(settings, key)
+            for key in (
+                "DATABASE_POOL_SIZE",
+                "DATABASE_MAX_OVERFLOW",
+                "DATABASE_USE_PSYCOPG_POOL",
+                "RESERVATION_CONFIRM_PIPELINE_ENABLED",
+                "RESERVATION_HOLD_ENABLED",
+                "SLOT_INDEX_ENABLED",
+                "RATE_LIMIT_ENABLED",
+            )
+        },
+        "metrics": recorder.summary(),
+        "capacity": await env.check_capacity(),
+    }
+
+
+def print_result(result: dict, baseline: Optional[dict]) -> None:
+    metrics, capacity = result["metrics"], result["capacity"]
+    print(
+        f"[{result['scenario']}] {metrics['requests']} requests in {metrics['elapsed_seconds']}s "
+        f"({metrics['throughput_rps']} rps), deadlocks {metrics['deadlocks']}, "
+        f"oversold slots {capacity['oversold_slots']}, drifted slots {capacity['drifted_slots']}"
+    )
+    baseline_operations = (baseline or {}).get("metrics", {}).get("operations", {})
+    for name, operation in metrics["operations"].items():
+        line = _format_operation(operation)
+        if name in baseline_operations:
+            line += f"   (before: {_format_operation(baseline_operations[name])})"
+        print(f"  {name:<26} {line}  statuses {operation['statuses']}")
+    if metrics["counters"]:
+        print(f"  counters {metrics['counters']}")
+
+
+def _format_operation(operation: dict[str, Any]) -> str:
+    latency = operation["latency_ms"]
+
+    def ms(value: Optional[float]) -> str:
+        return "-" if value is None else f"{value:.1f}"
+
+    return (
+        f"{operation['throughput_rps']} rps p50 {ms(latency['p50'])} p95 {ms(latency['p95'])} "
+        f"p99 {ms(latency['p99'])} ms"
+    )
+
+
+async def main() -> None:
+    args = parse_args()
+    options = ScenarioOptions(**{option.name: getattr(args, option.name) for option in fields(ScenarioOptions)})
+    baseline = json.loads(args.compare.read_text()) if args.compare else None
+    if args.disable_rate_limit:
+        # 컨테이너가 import 시점에 Config() 를 읽으므로 앱을 import 하기 전에 설정한다
+        os.environ["RATE_LIMIT_ENABLED"] = "false"
+
+    from app.config import Config
+
+    settings = Config()
+    names = list(SCENARIOS) if args.scenario == "all" else [args.scenario]
+    args.output_dir.mkdir(parents=True, exist_ok=True)
+
+    async def run_all(client) -> None:
+        for name in names:
+            result = await run_scenario(name, client, args, options, settings)
+            output = args.output_dir / f"{name}-{datetime.now().strftime('%Y%m%dT%H%M%S')}.json"
+            output.write_text(json.dumps(result, ensure_ascii=False, indent=2, default=str))
+            print_result(result, baseline if baseline and baseline.get("scenario") == name else None)
+            print(f"  -> {output}")
+
+    if args.base_url:
+        client = HTTPClient(args.base_url, max_connections=options.concurrency)
+        try:
+            await run_all(client)
+        finally:
+            await client.close()
+        return
+
+    from app.main import create_app
+
+    app = create_app()
+    async with app.router.lifespan_context(app):
+        await run_all(ASGIClient(app))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
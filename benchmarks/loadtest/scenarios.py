@@ -0,0 +1,165 @@
+# 예약 경쟁 시나리오: 모든 요청은 LoadTestEnvironment 가 만든 슬롯 하나를 두고 경쟁한다
+import asyncio
+import random
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Iterable, TypeVar
+
+from benchmarks.loadtest.environment import LoadTestEnvironment
+from benchmarks.loadtest.metrics import Recorder, classify_error
+
+T = TypeVar("T")
+
+
+@dataclass
+class ScenarioOptions:
+    users: int = 1000
+    admins: int = 4
+    concurrency: int = 200
+    capacity: int = 500
+    applicants: int = 1
+    batch_size: int = 100
+    rounds: int = 5
+    seed: int = 0
+
+
+async def _run_limited(concurrency: int, items: Iterable[T], fn: Callable[[T], Awaitable[None]]) -> None:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(item: T) -> None:
+        async with semaphore:
+            await fn(item)
+
+    await asyncio.gather(*(run(item) for item in items))
+
+
+def _chunks(ids: list[int], size: int) -> list[list[int]]:
+    return [ids[i : i + size] for i in range(0, len(ids), size)]
+
+
+async def _create_reservations(
+    env: LoadTestEnvironment, client, recorder: Recorder, options: ScenarioOptions, operation: str
+) -> list[int]:
+    reservation_ids = []
+
+    async def create(token: str) -> None:
+        response = await recorder.call(
+            operation,
+            client,
+            "POST",
+            "/api/v1/reservations/",
+            json_body={**env.reservation_body, "applicants": options.applicants},
+            token=token,
+        )
+        if response is not None and response.status == 201:
+            reservation_ids.append(response.json()["id"])
+
+    await _run_limited(options.concurrency, env.user_tokens, create)
+    return reservation_ids
+
+
+async def _confirm_batches(
+    env: LoadTestEnvironment, client, recorder: Recorder, batches: list[tuple[str, list[int]]], concurrency: int
+) -> None:
+    async def confirm(batch: tuple[str, list[int]]) -> None:
+        token, reservation_ids = batch
+        response = await recorder.call(
+            "confirm_batch",
+            client,
+            "POST",
+            "/api/v1/admin/reservations/confirm",
+            json_body={"reservation_ids": reservation_ids},
+            token=token,
+        )
+        if response is None or response.status != 200:
+            return
+        for result in response.json()["results"]:
+            if result["is_success"]:
+                recorder.count("confirmed_items")
+            else:
+                recorder.count(f"confirm_failed:{classify_error(400, result['detail'] or '')}")
+
+    await _run_limited(concurrency, batches, confirm)
+
+
+async def opening_rush(env: LoadTestEnvironment, client, recorder: Recorder, options: ScenarioOptions) -> None:
+    """
+    오픈 직후 모든 사용자가 같은 슬롯에 동시에 예약을 생성하고,
+    관리자들이 생성된 예약을 batch_size 단위로 나누어 동시에 일괄 확정한다.
+    """
+    reservation_ids = await _create_reservations(env, client, recorder, options, "create_reservation")
+    recorder.count("created_reservations", len(reservation_ids))
+
+    batches = [
+        (env.admin_tokens[i % len(env.admin_tokens)], batch)
+        for i, batch in enumerate(_chunks(sorted(reservation_ids), options.batch_size))
+    ]
+    await _confirm_batches(env, client, recorder, batches, len(env.admin_tokens))
+
+
+async def admin_batch_confirm(env: LoadTestEnvironment, client, recorder: Recorder, options: ScenarioOptions) -> None:
+    """
+    PENDING 예약을 만든 뒤, 모든 관리자가 같은 예약 전체를 서로 다른 순서의 배치로 동시에 확정한다.
+    같은 행을 다른 순서로 잠그므로 락 대기/교착 상태와 중복 확정 여부를 확인한다.
+    """
+    reservation_ids = await _create_reservations(env, client, recorder, options, "setup_create_reservation")
+    recorder.count("created_reservations", len(reservation_ids))
+
+    rng = random.Random(options.seed)
+    batches = []
+    for token in env.admin_tokens:
+        shuffled = list(reservation_ids)
+        rng.shuffle(shuffled)
+        batches += [(token, batch) for batch in _chunks(shuffled, options.batch_size)]
+    rng.shuffle(batches)
+    await _confirm_batches(env, client, recorder, batches, options.concurrency)
+
+
+async def cancellation_churn(env: LoadTestEnvironment, client, recorder: Recorder, options: ScenarioOptions) -> None:
+    """
+    사용자는 rounds 번 예약 생성 → 삭제를 반복하고, 관리자들은 생성된 예약을 하나씩 동시에 확정한다.
+    확정과 삭제가 같은 예약에서 경합하므로 인원 차감/반환 누락(capacity_drift)을 확인한다.
+    """
+    queue: asyncio.Queue = asyncio.Queue()
+
+    async def user_loop(token: str) -> None:
+        for _ in range(options.rounds):
+            response = await recorder.call(
+                "create_reservation",
+                client,
+                "POST",
+                "/api/v1/reservations/",
+                json_body={**env.reservation_body, "applicants": options.applicants},
+                token=token,
+            )
+            if response is None or response.status != 201:
+                continue
+            reservation_id = response.json()["id"]
+            await queue.put(reservation_id)
+            # 관리자 확정이 끼어들 수 있도록 양보한다
+            await asyncio.sleep(0)
+            await recorder.call(
+                "delete_reservation", client, "DELETE", f"/api/v1/reservations/{reservation_id}", token=token
+            )
+
+    async def admin_loop(token: str) -> None:
+        while (reservation_id := await queue.get()) is not None:
+            await recorder.call(
+                "confirm_reservation",
+                client,
+                "PATCH",
+                f"/api/v1/admin/reservations/{reservation_id}/confirm",
+                token=token,
+            )
+
+    admin_tasks = [asyncio.create_task(admin_loop(token)) for token in env.admin_tokens]
+    await _run_limited(options.concurrency, env.user_tokens, user_loop)
+    for _ in admin_tasks:
+        await queue.put(None)
+    await asyncio.gather(*admin_tasks)
+
+
+SCENARIOS = {
+    "opening_rush": opening_rush,
+    "admin_batch_confirm": admin_batch_confirm,
+    "cancellation_churn": cancellation_churn,
+}
@@ -0,0 +1,108 @@
+# 인증 미들웨어 요청당 오버헤드 벤치마크 (DB/네트워크 불필요)
+# 사용법: python -m benchmarks.middleware_benchmark [--requests 20000]
+# 인증(guard)은 즉시 반환하는 가짜 구현으로 대체하여 미들웨어 자체의 비용만 비교한다.
+import argparse
+import asyncio
+import re
+import statistics
+import time as timer
+
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.responses import JSONResponse
+
+from app.common.constants import UserType
+from app.common.exceptions import AuthorizationError
+from app.common.middleware.auth_middleware import AuthMiddleware
+
+
+class FakeGuard:
+    async def authenticate(self, request) -> dict:
+        return {"user_id": 1, "type": UserType.ADMIN.value}
+
+
+class BaseHTTPAuthMiddleware(BaseHTTPMiddleware):
+    # 변경 전 구현: BaseHTTPMiddleware, 요청마다 정규식 컴파일, 제외 경로 선형 탐색
+    def __init__(self, app, guard):
+        super().__init__(app)
+        self.guard = guard
+        self.excluded_paths = [
+            "/openapi.json",
+            "/docs",
+            "/docs/oauth2-redirect",
+            "/redoc",
+            "/api/v1/users/login",
+            "/api/v1/users/",
+        ]
+
+    async def dispatch(self, request, call_next):
+        admin_only_pattern = re.compile(r"/api/v1/.+/admin")
+        if any(route == request.url.path for route in self.excluded_paths):
+            return await call_next(request)
+
+        try:
+            auth_data = await self.guard.authenticate(request)
+            if admin_only_pattern.match(request.url.path):
+                if auth_data["type"] != UserType.ADMIN.value:
+                    raise AuthorizationError("권한이 없습니다.")
+
+            request.state.auth = auth_data
+        except Exception as e:
+            return JSONResponse(status_code=401, content={"detail": str(e)})
+
+        return await call_next(request)
+
+
+async def endpoint(scope, receive, send):
+    await send({"type": "http.response.start", "status": 200, "headers": [(b"content-length", b"2")]})
+    await send({"type": "http.response.body", "body": b"{}"})
+
+
+async def run(app, paths: list[str], count: int) -> list[float]:
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    samples = []
+    for i in range(count):
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "server": ("testserver", 80),
+            "root_path": "",
+            "path": paths[i % len(paths)],
+            "raw_path": paths[i % len(paths)].encode(),
+            "query_string": b"",
+            "headers": [(b"authorization", b"Bearer token")],
+        }
+        started = timer.perf_counter()
+        await app(scope, receive, send)
+        samples.append((timer.perf_counter() - started) * 1_000_000)
+    return samples
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=20000)
+    args = parser.parse_args()
+
+    paths = ["/api/v1/reservations/", "/api/v1/admin/reservations", "/api/v1/reservations/calendar"]
+    apps = {
+        "none (endpoint only)": endpoint,
+        "BaseHTTPMiddleware (before)": BaseHTTPAuthMiddleware(endpoint, guard=FakeGuard()),
+        "pure ASGI (after)": AuthMiddleware(endpoint, guard=FakeGuard()),
+    }
+    for name, app in apps.items():
+        await run(app, paths, 1000)  # warm up
+        samples = await run(app, paths, args.requests)
+        print(
+            f"{name:<30} median {statistics.median(samples):8.2f} us  p99 {sorted(samples)[int(len(samples) * 0.99)]:8.2f} us"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,91 @@
+# 예약 목록 응답(10k rows) 직렬화 벤치마크
+# 사용법: python -m benchmarks.serialization_benchmark [--rows 10000] [--repeat 20]
+import argparse
+import asyncio
+import json
+import statistics
+import time as timer
+from datetime import date, time, timedelta
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from app.common.constants import ReservationStatus
+from app.common.responses import FastJSONResponse
+from app.schemas.reservation_schema import (
+    ReservationListResponse,
+    ReservationResponse,
+    ReservationResponseListAdapter,
+)
+
+
+def build_rows(count: int) -> list[tuple]:
+    # repository 의 컬럼 projection 결과와 동일한 형태
+    return [
+        (
+            index,
+            index % 1000,
+            date(2024, 12, 1) + timedelta(days=index % 30),
+            time(9, 0),
+            time(10, 0),
+            1000,
+            ReservationStatus.PENDING if index % 2 else ReservationStatus.CONFIRMED,
+        )
+        for index in range(count)
+    ]
+
+
+def to_mappings(rows: list[tuple]) -> list[dict]:
+    columns = ("id", "user_id", "exam_date", "exam_start_time", "exam_end_time", "applicants", "status")
+    return [dict(zip(columns, row)) for row in rows]
+
+
+response_field = create_model_field(name="response", type_=ReservationListResponse, mode="serialization")
+
+
+async def before(rows: list[dict]) -> bytes:
+    # 행 단위 model_validate -> 응답 모델 생성(재검증) -> FastAPI response_model 검증 + jsonable_encoder -> json.dumps
+    response = ReservationListResponse(reservations=[ReservationResponse.model_validate(row) for row in rows])
+    content = await serialize_response(field=response_field, response_content=response)
+    return JSONResponse(content).body
+
+
+async def after(rows: list[dict]) -> bytes:
+    # TypeAdapter 로 한 번에 검증 -> model_construct -> FastJSONResponse 직접 반환(재검증 없음)
+    reservations = ReservationResponseListAdapter.validate_python(rows, from_attributes=True)
+    response = ReservationListResponse.model_construct(reservations=reservations, next_cursor=None)
+    return FastJSONResponse(response).body
+
+
+async def measure(fn, rows, repeat: int) -> list[float]:
+    await fn(rows)  # warm up
+    samples = []
+    for _ in range(repeat):
+        started = timer.perf_counter()
+        await fn(rows)
+        samples.append((timer.perf_counter() - started) * 1000)
+    return samples
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="예약 목록 응답 직렬화 벤치마크")
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    rows = to_mappings(build_rows(args.rows))
+    # 두 방식의 결과가 같은 JSON 인지 확인한다 (공백 등 포맷 차이는 무시)
+    assert json.loads(await before(rows)) == json.loads(await after(rows))
+
+    print(f"rows={args.rows} repeat={args.repeat}")
+    results = {}
+    for name, fn in (("before", before), ("after", after)):
+        samples = await measure(fn, rows, args.repeat)
+        results[name] = statistics.median(samples)
+        print(f"{name:>6}: median {results[name]:.2f} ms, min {min(samples):.2f} ms")
+    print(f"speedup: {results['before'] / results['after']:.2f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,100 @@
+# 핫 쿼리 구문 재사용 벤치마크
+# 사용법:
+#   python -m benchmarks.statement_benchmark                 # SQLAlchemy 측 구문 생성/캐시 키 계산 비용 (DB 불필요)
+#   python -m benchmarks.statement_benchmark --db            # .env 의 DB 에서 prepare_threshold 사용/미사용 쿼리 지연 비교
+import argparse
+import asyncio
+import statistics
+import time as timer
+from datetime import datetime, timedelta
+
+import psycopg
+from sqlalchemy import func, lambda_stmt, select, types
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import raiseload
+
+import app.main  # noqa: F401  모든 모델의 mapper 를 구성한다
+from app.common.database.models.reservation import Reservation
+from app.common.database.models.slot import Slot
+from app.common.respository.slot_repository import _overlapping_slots_stmt
+from app.config import Config
+
+
+def measure(fn, repeat: int) -> float:
+    fn()  # warm up
+    samples = []
+    for _ in range(repeat):
+        started = timer.perf_counter()
+        fn()
+        samples.append((timer.perf_counter() - started) * 1_000_000)
+    return statistics.median(samples)
+
+
+def build_overlapping_slots_stmt(start_time, end_time):
+    # 변경 전: 매 호출마다 구문을 새로 생성한다
+    time_range = func.tstzrange(
+        func.cast(start_time, types.TIMESTAMP(timezone=True)),
+        func.cast(end_time, types.TIMESTAMP(timezone=True)),
+        "[]",
+    )
+    return select(Slot).where(Slot.time_range.op("&&")(time_range)).options(raiseload(Slot.reservations))
+
+
+def build_reservation_stmt(reservation_id):
+    return select(Reservation).where(Reservation.id == reservation_id).options(raiseload(Reservation.slots))
+
+
+def lambda_reservation_stmt(reservation_id):
+    stmt = lambda_stmt(lambda: select(Reservation).where(Reservation.id == reservation_id))
+    stmt += lambda s: s.options(raiseload(Reservation.slots))
+    return stmt
+
+
+def run_offline(repeat: int) -> None:
+    # 실행 시 SQLAlchemy 가 매번 수행하는 작업(구문 생성 + 캐시 키 계산)만 측정한다
+    start_time = datetime(2024, 12, 1, 9, 0)
+    end_time = start_time + timedelta(hours=1)
+    cases = {
+        "overlap: build per call": lambda: build_overlapping_slots_stmt(start_time, end_time)._generate_cache_key(),
+        "overlap: prebuilt": lambda: _overlapping_slots_stmt(False)._generate_cache_key(),
+        "reservation by id: build per call": lambda: build_reservation_stmt(1)._generate_cache_key(),
+        "reservation by id: lambda_stmt": lambda: lambda_reservation_stmt(1)._generate_cache_key(),
+    }
+    print(f"SQLAlchemy statement overhead per query (median of {repeat}, us)")
+    for name, fn in cases.items():
+        print(f"  {name:<36} {measure(fn, repeat):8.1f}")
+
+
+async def run_db(repeat: int) -> None:
+    settings = Config()
+    compiled = _overlapping_slots_stmt(False).compile(dialect=postgresql.dialect())
+    sql = str(compiled).replace("%(start_time)s", "%s").replace("%(end_time)s", "%s").replace("%(range_type)s", "%s")
+    start_time = datetime(2024, 12, 1, 9, 0)
+    params = (start_time, start_time + timedelta(hours=1), "[]")
+
+    print(f"overlap query latency (median of {repeat}, us)")
+    for name, prepare_threshold in (("no prepare", None), ("prepared", 0)):
+        async with await psycopg.AsyncConnection.connect(
+            f"postgresql://{settings.DATABASE_URL}", prepare_threshold=prepare_threshold
+        ) as connection:
+            samples = []
+            for _ in range(repeat + 1):
+                started = timer.perf_counter()
+                await (await connection.execute(sql, params)).fetchall()
+                samples.append((timer.perf_counter() - started) * 1_000_000)
+            print(f"  {name:<12} {statistics.median(samples[1:]):8.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="핫 쿼리 구문 재사용 벤치마크")
+    parser.add_argument("--db", action="store_true", help="DB 에 실제 쿼리를 실행하여 prepared statement 효과를 측정")
+    parser.add_argument("--repeat", type=int, default=2000)
+    args = parser.parse_args()
+
+    run_offline(args.repeat)
+    if args.db:
+        asyncio.run(run_db(args.repeat))
+
+
+if __name__ == "__main__":
+    main()
@@ -13,6 +13,7 @@ async def test_create_user_success(
     auth_service,
     mock_auth_repository,
     mock_user,
+    password_hasher,
 ):
     """
     [User] 사용자는 이메일과 비밀번호로 회원가입 할 수 있다.
@@ -30,7 +31,9 @@ async def test_create_user_success(
     assert result == UserCreateResponse.model_validate(mock_auth_create_user_repository_result)
     assert mock_auth_create_user_repository_result.email == input_data.email
     assert mock_auth_create_user_repository_result.type == UserType.USER.value
-    assert mock_auth_create_user_repository_result.hashed_password == hashlib.sha256("password".encode()).hexdigest()
+    created_user = mock_auth_repository.create_user.call_args.kwargs["user"]
+    assert created_user.hashed_password.startswith("scrypt$")
+    assert await password_hasher.verify("password", created_user.hashed_password)
 
 
 @pytest.mark.asyncio
@@ -123,3 +126,31 @@ async def test_login_fail_when_password_is_incorrect(
 
     # then
     assert isinstance(e.value, AuthenticationError)
+
+
+@pytest.mark.asyncio
+async def test_login_upgrades_legacy_password_hash(
+    auth_service,
+    mock_auth_repository,
+    mock_jwt_service,
+    mock_user,
+    password_hasher,
+):
+    """
+    [User] 이전 방식(sha256)으로 저장된 비밀번호는 로그인 성공 시 scrypt 해시로 다시 저장한다.
+    """
+    # given
+    input_data = UserLoginRequest(email="grep@grep.com", password="password")
+    legacy_hashed_password = hashlib.sha256("password".encode()).hexdigest()
+    mock_auth_repository.get_user_by_email.return_value = mock_user(type=UserType.USER.value)
+    mock_jwt_service.create_access_token.return_value = "mocked_access_token"
+    mock_jwt_service.create_refresh_token.return_value = "mocked_refresh_token"
+
+    # when
+    await auth_service.login(data=input_data)
+
+    # then
+    user_id, old_hashed_password, new_hashed_password = mock_auth_repository.update_hashed_password.call_args.args
+    assert (user_id, old_hashed_password) == (1, legacy_hashed_password)
+    assert await password_hasher.verify("password", new_hashed_password)
+    assert not password_hasher.needs_rehash(new_hashed_password)
@@ -4,6 +4,7 @@ from unittest.mock import MagicMock
 import pytest
 
 from app.common.auth.jwt_service import JWTService
+from app.common.auth.password_hasher import PasswordHasher
 from app.common.database.models.reservation import Reservation
 from app.common.database.models.slot import Slot
 from app.common.database.models.user import User
@@ -60,5 +61,18 @@ def mock_jwt_service(mocker):
 
 
 @pytest.fixture
-def auth_service(mock_auth_repository, mock_settings, mock_jwt_service):
-    return AuthService(repository=mock_auth_repository, settings=mock_settings, jwt_service=mock_jwt_service)
+def password_hasher():
+    # 테스트 속도를 위해 작은 scrypt 파라미터를 사용한다
+    password_hasher = PasswordHasher(max_workers=2, n=2**4, r=8, p=1)
+    yield password_hasher
+    password_hasher.close()
+
+
+@pytest.fixture
+def auth_service(mock_auth_repository, mock_settings, mock_jwt_service, password_hasher):
+    return AuthService(
+        repository=mock_auth_repository,
+        settings=mock_settings,
+        jwt_service=mock_jwt_service,
+        password_hasher=password_hasher,
+    )
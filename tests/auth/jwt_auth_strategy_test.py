@@ -0,0 +1,86 @@
+import pytest
+
+from app.common.auth.strategies.jwt_strategy import JWTAuthStrategy
+from app.common.cache.ttl_cache import TTLCache
+from app.common.exceptions import AuthenticationError, JwtError
+
+
+class FakeClock:
+    def __init__(self, now: float = 1_000.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _request(mocker, token: str):
+    request = mocker.Mock()
+    request.headers = {"Authorization": f"Bearer {token}"}
+    return request
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def jwt_auth_strategy(mock_jwt_service, clock):
+    token_cache = TTLCache(max_size=10, ttl_seconds=300, clock=clock)
+    return JWTAuthStrategy(jwt_service=mock_jwt_service, token_cache=token_cache, clock=clock)
+
+
+@pytest.mark.asyncio
+async def test_authenticate_skips_verification_on_cache_hit(mocker, jwt_auth_strategy, mock_jwt_service, clock):
+    """
+    [Auth] 한 번 검증된 토큰은 캐시된 claims 를 사용하고 다시 검증하지 않는다.
+    """
+    # given
+    mock_jwt_service.verify_token.return_value = {"user_id": 1, "type": "USER", "exp": clock.now + 60}
+
+    # when
+    first = await jwt_auth_strategy.authenticate(_request(mocker, "token"))
+    second = await jwt_auth_strategy.authenticate(_request(mocker, "token"))
+
+    # then
+    assert first == second == {"user_id": 1, "type": "USER"}
+    mock_jwt_service.verify_token.assert_called_once_with("token")
+
+
+@pytest.mark.asyncio
+async def test_authenticate_reverifies_after_token_exp(mocker, jwt_auth_strategy, mock_jwt_service, clock):
+    """
+    [Auth] 캐시된 claims 는 토큰의 exp 이후에는 사용하지 않고 다시 검증한다.
+    """
+    # given
+    mock_jwt_service.verify_token.side_effect = [
+        {"user_id": 1, "type": "USER", "exp": clock.now + 60},
+        AuthenticationError("토큰이 만료되었습니다."),
+    ]
+    await jwt_auth_strategy.authenticate(_request(mocker, "token"))
+
+    # when
+    clock.now += 61
+
+    # then
+    with pytest.raises(JwtError):
+        await jwt_auth_strategy.authenticate(_request(mocker, "token"))
+    assert mock_jwt_service.verify_token.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_authenticate_does_not_cache_invalid_token(mocker, jwt_auth_strategy, mock_jwt_service):
+    """
+    [Auth] 검증에 실패한 토큰은 캐시하지 않는다.
+    """
+    # given
+    mock_jwt_service.verify_token.side_effect = AuthenticationError("인증되지 않은 사용자입니다.")
+
+    # when
+    for _ in range(2):
+        with pytest.raises(JwtError):
+            await jwt_auth_strategy.authenticate(_request(mocker, "invalid"))
+
+    # then
+    assert mock_jwt_service.verify_token.call_count == 2
+    assert jwt_auth_strategy.token_cache.stats()["size"] == 0
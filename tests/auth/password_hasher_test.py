@@ -0,0 +1,83 @@
+import asyncio
+import hashlib
+import threading
+
+import pytest
+
+from app.common.auth.password_hasher import PasswordHasher
+
+
+@pytest.mark.asyncio
+async def test_password_hasher_verifies_scrypt_hash(password_hasher):
+    """
+    [Auth] scrypt 로 해시한 비밀번호는 같은 비밀번호로만 검증된다.
+    """
+    # when
+    hashed_password = await password_hasher.hash("password")
+
+    # then
+    assert hashed_password.startswith("scrypt$16$8$1$")
+    assert await password_hasher.verify("password", hashed_password)
+    assert not await password_hasher.verify("password1", hashed_password)
+    assert not password_hasher.needs_rehash(hashed_password)
+
+
+@pytest.mark.asyncio
+async def test_password_hasher_verifies_legacy_sha256_hash(password_hasher):
+    """
+    [Auth] 이전 방식(sha256)의 해시도 검증하며 재해시 대상으로 판단한다.
+    """
+    # given
+    legacy_hashed_password = hashlib.sha256("password".encode()).hexdigest()
+
+    # then
+    assert await password_hasher.verify("password", legacy_hashed_password)
+    assert not await password_hasher.verify("password1", legacy_hashed_password)
+    assert password_hasher.needs_rehash(legacy_hashed_password)
+
+
+@pytest.mark.asyncio
+async def test_password_hasher_needs_rehash_when_parameters_change(password_hasher):
+    """
+    [Auth] 현재 설정과 다른 scrypt 파라미터로 저장된 해시는 재해시 대상이다.
+    """
+    # given
+    hashed_password = await password_hasher.hash("password")
+    stronger_hasher = PasswordHasher(max_workers=1, n=2**5, r=8, p=1)
+
+    # then
+    assert await stronger_hasher.verify("password", hashed_password)
+    assert stronger_hasher.needs_rehash(hashed_password)
+    stronger_hasher.close()
+
+
+@pytest.mark.asyncio
+async def test_password_hasher_runs_off_event_loop_with_bounded_concurrency(mocker):
+    """
+    [Auth] 해시는 이벤트 루프가 아닌 스레드에서 실행되며 동시 실행 수는 max_workers 를 넘지 않는다.
+    """
+    # given
+    password_hasher = PasswordHasher(max_workers=2, n=2**4, r=8, p=1)
+    lock = threading.Lock()
+    running = {"current": 0, "max": 0, "threads": set()}
+    scrypt = hashlib.scrypt
+
+    def slow_scrypt(*args, **kwargs):
+        with lock:
+            running["current"] += 1
+            running["max"] = max(running["max"], running["current"])
+            running["threads"].add(threading.current_thread().name)
+        threading.Event().wait(0.01)
+        with lock:
+            running["current"] -= 1
+        return scrypt(*args, **kwargs)
+
+    mocker.patch("app.common.auth.password_hasher.hashlib.scrypt", side_effect=slow_scrypt)
+
+    # when
+    await asyncio.gather(*(password_hasher.hash("password") for _ in range(8)))
+    password_hasher.close()
+
+    # then
+    assert running["max"] <= 2
+    assert all(name.startswith("password-hasher") for name in running["threads"])
@@ -0,0 +1,111 @@
+import pytest
+
+import app.main  # noqa: F401  모든 모델의 mapper 를 구성한다
+from app.common.cache.ttl_cache import TTLCache
+from app.common.database.models.user import User
+from app.common.respository.user_repository import AuthRepository
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def mock_session(mocker):
+    session = mocker.Mock()
+    session.scalar = mocker.AsyncMock()
+    session.commit = mocker.AsyncMock()
+    return session
+
+
+@pytest.fixture
+def auth_repository(mocker, mock_session, clock):
+    session_factory = mocker.MagicMock()
+    session_factory.return_value.__aenter__.return_value = mock_session
+    return AuthRepository(
+        session_factory=session_factory,
+        user_cache=TTLCache(max_size=10, ttl_seconds=60, clock=clock),
+        negative_ttl_seconds=5,
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_user_by_email_uses_cache(auth_repository, mock_session):
+    """
+    [User] 같은 이메일의 반복 조회는 캐시된 사용자를 반환하고 DB 를 다시 조회하지 않는다.
+    """
+    # given
+    user = User(id=1, email="grep@grep.com", hashed_password="hashed")
+    mock_session.scalar.return_value = user
+
+    # when
+    first = await auth_repository.get_user_by_email("grep@grep.com")
+    second = await auth_repository.get_user_by_email("grep@grep.com")
+
+    # then
+    assert first is second is user
+    mock_session.scalar.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_get_user_by_email_caches_unknown_email_briefly(auth_repository, mock_session, clock):
+    """
+    [User] 존재하지 않는 이메일은 negative cache 기간 동안만 DB 조회 없이 None 을 반환한다.
+    """
+    # given
+    mock_session.scalar.return_value = None
+
+    # when
+    assert await auth_repository.get_user_by_email("unknown@grep.com") is None
+    assert await auth_repository.get_user_by_email("unknown@grep.com") is None
+    clock.now += 6
+    assert await auth_repository.get_user_by_email("unknown@grep.com") is None
+
+    # then
+    assert mock_session.scalar.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_create_user_invalidates_negative_cache(auth_repository, mock_session):
+    """
+    [User] 회원가입하면 해당 이메일의 캐시를 무효화하여 바로 로그인할 수 있다.
+    """
+    # given
+    user = User(id=1, email="grep@grep.com", hashed_password="hashed")
+    mock_session.scalar.side_effect = [None, user]
+    assert await auth_repository.get_user_by_email("grep@grep.com") is None
+
+    # when
+    await auth_repository.create_user(user)
+
+    # then
+    assert await auth_repository.get_user_by_email("grep@grep.com") is user
+    assert mock_session.scalar.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_update_hashed_password_invalidates_cache(auth_repository, mock_session):
+    """
+    [User] 비밀번호 해시가 변경되면 해당 이메일의 캐시를 무효화한다.
+    """
+    # given
+    user = User(id=1, email="grep@grep.com", hashed_password="old")
+    updated_user = User(id=1, email="grep@grep.com", hashed_password="new")
+    mock_session.scalar.side_effect = [user, "grep@grep.com", updated_user]
+    await auth_repository.get_user_by_email("grep@grep.com")
+
+    # when
+    updated = await auth_repository.update_hashed_password(1, "old", "new")
+
+    # then
+    assert updated is True
+    assert await auth_repository.get_user_by_email("grep@grep.com") is updated_user
@@ -0,0 +1,151 @@
+import pytest
+
+from app.common.auth.auth_guard import AuthGuard
+from app.common.constants import UserType
+from app.common.exceptions import JwtError
+from app.common.middleware.auth_middleware import AuthMiddleware
+from app.common.middleware.rate_limiter import RateLimiter
+from app.common.middleware.route_matcher import PathPrefixTrie
+
+
+class RecordingApp:
+    def __init__(self) -> None:
+        self.scopes = []
+
+    async def __call__(self, scope, receive, send):
+        self.scopes.append(scope)
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"ok"})
+
+
+def _scope(path: str) -> dict:
+    return {
+        "type": "http",
+        "method": "GET",
+        "path": path,
+        "headers": [(b"authorization", b"Bearer token")],
+        "query_string": b"",
+    }
+
+
+async def _call(middleware, scope) -> list[dict]:
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    await middleware(scope, receive, send)
+    return messages
+
+
+@pytest.fixture
+def mock_guard(mocker):
+    return mocker.AsyncMock(spec=AuthGuard)
+
+
+@pytest.mark.asyncio
+async def test_auth_middleware_skips_excluded_paths(mock_guard):
+    """
+    [Auth] 제외 경로는 인증 없이 다음 앱으로 전달한다.
+    """
+    # given
+    app = RecordingApp()
+    middleware = AuthMiddleware(app, guard=mock_guard)
+
+    # when
+    messages = await _call(middleware, _scope("/api/v1/users/login"))
+
+    # then
+    assert messages[0]["status"] == 200
+    mock_guard.authenticate.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_auth_middleware_sets_auth_state(mock_guard):
+    """
+    [Auth] 인증에 성공하면 인증 정보를 request.state.auth 로 전달한다.
+    """
+    # given
+    app = RecordingApp()
+    middleware = AuthMiddleware(app, guard=mock_guard)
+    mock_guard.authenticate.return_value = {"user_id": 1, "type": UserType.USER.value}
+
+    # when
+    messages = await _call(middleware, _scope("/api/v1/reservations/"))
+
+    # then
+    assert messages[0]["status"] == 200
+    assert app.scopes[0]["state"]["auth"] == {"user_id": 1, "type": UserType.USER.value}
+
+
+@pytest.mark.asyncio
+async def test_auth_middleware_rejects_invalid_token(mock_guard):
+    """
+    [Auth] 인증에 실패하면 401 을 반환하고 다음 앱을 호출하지 않는다.
+    """
+    # given
+    app = RecordingApp()
+    middleware = AuthMiddleware(app, guard=mock_guard)
+    mock_guard.authenticate.side_effect = JwtError("인증되지 않은 사용자입니다.")
+
+    # when
+    messages = await _call(middleware, _scope("/api/v1/reservations/"))
+
+    # then
+    assert messages[0]["status"] == 401
+    assert app.scopes == []
+
+
+@pytest.mark.asyncio
+async def test_auth_middleware_rejects_non_admin_on_admin_paths(mock_guard):
+    """
+    [Auth] 관리자 경로는 관리자가 아니면 401 을 반환한다.
+    """
+    # given
+    app = RecordingApp()
+    middleware = AuthMiddleware(app, guard=mock_guard)
+    mock_guard.authenticate.return_value = {"user_id": 1, "type": UserType.USER.value}
+
+    # when
+    messages = await _call(middleware, _scope("/api/v1/admin/reservations"))
+
+    # then
+    assert messages[0]["status"] == 401
+    assert app.scopes == []
+
+
+@pytest.mark.asyncio
+async def test_auth_middleware_returns_429_when_rate_limited(mock_guard):
+    """
+    [Auth] 요청 제한을 넘으면 Retry-After 와 함께 429 를 반환하고 다음 앱을 호출하지 않는다.
+    """
+    # given
+    app = RecordingApp()
+    middleware = AuthMiddleware(app, guard=mock_guard, rate_limiter=RateLimiter(default_limit=(0.5, 1)))
+    mock_guard.authenticate.return_value = {"user_id": 1, "type": UserType.USER.value}
+
+    # when
+    await _call(middleware, _scope("/api/v1/reservations/"))
+    messages = await _call(middleware, _scope("/api/v1/reservations/"))
+
+    # then
+    assert messages[0]["status"] == 429
+    assert (b"retry-after", b"2") in messages[0]["headers"]
+    assert len(app.scopes) == 1
+
+
+def test_path_prefix_trie_matches_segment_boundaries():
+    """
+    [Auth] prefix trie 는 세그먼트 경계까지 일치하는 경로만 찾는다.
+    """
+    # given
+    trie = PathPrefixTrie(["/api/v1/admin"])
+
+    # then
+    assert trie.matches("/api/v1/admin")
+    assert trie.matches("/api/v1/admin/slots/generate")
+    assert not trie.matches("/api/v1/administrators")
+    assert not trie.matches("/api/v1/reservations/")
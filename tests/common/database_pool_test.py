@@ -0,0 +1,108 @@
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy.exc import TimeoutError
+from sqlalchemy.pool import NullPool
+from sqlalchemy.util import greenlet_spawn
+
+from app.common.database.database import Database
+from app.common.database.pool import InstrumentedAsyncQueuePool
+from app.config import Config
+
+
+def test_database_applies_pool_settings():
+    """
+    [Database] 커넥션 풀 크기/타임아웃/echo 설정을 Config 에서 읽어 적용한다.
+    """
+    # given
+    settings = Config(DATABASE_POOL_SIZE=7, DATABASE_MAX_OVERFLOW=3, DATABASE_POOL_TIMEOUT=5, DATABASE_ECHO=False)
+
+    # when
+    database = Database(settings.DATABASE_URL, settings)
+
+    # then
+    pool = database.async_engine.pool
+    assert isinstance(pool, InstrumentedAsyncQueuePool)
+    assert database.async_engine.echo is False
+    assert database.pool_stats()["size"] == 7
+    assert database.pool_stats()["max_size"] == 10
+    assert pool.timeout() == 5
+
+
+def test_database_uses_psycopg_pool_when_enabled():
+    """
+    [Database] psycopg 풀 사용 시 SQLAlchemy 는 풀링하지 않고 psycopg AsyncConnectionPool 에서 커넥션을 얻는다.
+    """
+    # given
+    settings = Config(DATABASE_USE_PSYCOPG_POOL=True, DATABASE_POOL_SIZE=4, DATABASE_MAX_OVERFLOW=2)
+
+    # when
+    database = Database(settings.DATABASE_URL, settings)
+
+    # then
+    assert isinstance(database.async_engine.pool, NullPool)
+    assert database.psycopg_pool.min_size == 4
+    assert database.psycopg_pool.max_size == 6
+    assert database.psycopg_pool.kwargs["prepare_threshold"] == 2
+    assert database.pool_stats()["backend"] == "psycopg"
+    assert database.pool_stats()["checked_out"] == 0
+
+
+@pytest.mark.asyncio
+async def test_instrumented_pool_collects_checkout_and_timeout_stats():
+    """
+    [Database] 커넥션 획득 횟수, 사용 중인 커넥션 수, 대기 시간 초과 횟수를 집계한다.
+    """
+    # given
+    pool = InstrumentedAsyncQueuePool(creator=lambda: MagicMock(), pool_size=1, max_overflow=0, timeout=0.01)
+
+    # when
+    connection = await greenlet_spawn(pool.connect)
+    with pytest.raises(TimeoutError):
+        await greenlet_spawn(pool.connect)
+    busy_stats = pool.stats()
+    await greenlet_spawn(connection.close)
+
+    # then
+    assert busy_stats["checked_out"] == 1
+    assert busy_stats["checkouts"] == 1
+    assert busy_stats["timeouts"] == 1
+    assert busy_stats["waiting"] == 0
+    assert pool.stats()["checked_out"] == 0
+    assert pool.stats()["idle"] == 1
+
+
+@pytest.mark.asyncio
+async def test_instrumented_pool_counts_connect_errors_separately_from_timeouts():
+    """
+    [Database] 커넥션 연결 실패는 대기 시간 초과가 아닌 연결 실패 횟수로 집계한다.
+    """
+
+    # given
+    def refuse_connection():
+        raise ConnectionRefusedError("connection refused")
+
+    pool = InstrumentedAsyncQueuePool(creator=refuse_connection, pool_size=1, max_overflow=0, timeout=0.01)
+
+    # when
+    with pytest.raises(ConnectionRefusedError):
+        await greenlet_spawn(pool.connect)
+
+    # then
+    assert pool.stats()["timeouts"] == 0
+    assert pool.stats()["connect_errors"] == 1
+    assert pool.stats()["waiting"] == 0
+
+
+def test_database_disables_prepared_statements_with_negative_threshold():
+    """
+    [Database] prepare_threshold 가 음수이면 server-side prepared statement 를 사용하지 않는다(pgbouncer 등).
+    """
+    # given
+    settings = Config(DATABASE_USE_PSYCOPG_POOL=True, DATABASE_PREPARE_THRESHOLD=-1)
+
+    # when
+    database = Database(settings.DATABASE_URL, settings)
+
+    # then
+    assert database.psycopg_pool.kwargs["prepare_threshold"] is None
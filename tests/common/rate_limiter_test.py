@@ -0,0 +1,117 @@
+from app.common.middleware.rate_limiter import RateLimiter, TokenBucketLimiter
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_token_bucket_allows_burst_then_returns_retry_after():
+    """
+    [RateLimit] burst 만큼 허용한 뒤에는 다음 토큰까지 남은 시간을 반환한다.
+    """
+    # given
+    clock = FakeClock()
+    limiter = TokenBucketLimiter(rate_per_second=2.0, burst=3, clock=clock)
+
+    # when
+    results = [limiter.acquire(1) for _ in range(4)]
+
+    # then
+    assert results[:3] == [0.0, 0.0, 0.0]
+    assert results[3] == 0.5
+
+
+def test_token_bucket_refills_over_time():
+    """
+    [RateLimit] 시간이 지나면 초당 rate 만큼 토큰이 다시 채워진다.
+    """
+    # given
+    clock = FakeClock()
+    limiter = TokenBucketLimiter(rate_per_second=1.0, burst=1, clock=clock)
+    limiter.acquire(1)
+
+    # when
+    clock.now = 1.0
+
+    # then
+    assert limiter.acquire(1) == 0.0
+    assert limiter.acquire(1) == 1.0
+    assert limiter.acquire(2) == 0.0
+
+
+def test_token_bucket_sweeps_idle_buckets_lazily():
+    """
+    [RateLimit] 다시 가득 찬 버킷은 다음 요청 시 제거되고, max_buckets 를 넘지 않는다.
+    """
+    # given
+    clock = FakeClock()
+    limiter = TokenBucketLimiter(rate_per_second=1.0, burst=2, max_buckets=3, clock=clock)
+    for user_id in range(3):
+        limiter.acquire(user_id)
+
+    # when
+    limiter.acquire(3)
+
+    # then
+    assert len(limiter) == 3
+
+    # when
+    clock.now = 10.0
+    limiter.acquire(4)
+
+    # then
+    assert len(limiter) == 1
+
+
+def test_rate_limiter_applies_route_limit_per_user():
+    """
+    [RateLimit] method 와 경로가 정확히 일치하는 요청만 사용자별 경로 버킷을 함께 사용한다.
+    """
+    # given
+    clock = FakeClock()
+    limiter = RateLimiter(
+        default_limit=(10.0, 10),
+        route_limits={"POST /api/v1/reservations/": (1.0, 1)},
+        clock=clock,
+    )
+
+    # when
+    first = limiter.acquire(1, "POST", "/api/v1/reservations/")
+    second = limiter.acquire(1, "POST", "/api/v1/reservations")
+
+    # then
+    assert first == 0.0
+    assert second == 1.0
+    assert limiter.acquire(1, "POST", "/api/v1/reservations/feasibility") == 0.0
+    assert limiter.acquire(1, "GET", "/api/v1/reservations/") == 0.0
+    assert limiter.acquire(2, "POST", "/api/v1/reservations/") == 0.0
+
+
+def test_rate_limiter_does_not_consume_tokens_when_rejected():
+    """
+    [RateLimit] 한 버킷이라도 토큰이 없으면 다른 버킷의 토큰도 사용하지 않는다.
+    """
+    # given
+    clock = FakeClock()
+    limiter = RateLimiter(
+        default_limit=(1.0, 1),
+        route_limits={"POST /api/v1/reservations/": (1.0, 2)},
+        clock=clock,
+    )
+    limiter.acquire(1, "GET", "/api/v1/reservations/")
+
+    # when
+    retry_after = limiter.acquire(1, "POST", "/api/v1/reservations/")
+
+    # then
+    assert retry_after == 1.0
+    route_limiter = limiter.route_limiters[("POST", "/api/v1/reservations")]
+    assert route_limiter.retry_after(1) == 0.0
+    clock.now = 1.0
+    assert limiter.acquire(1, "POST", "/api/v1/reservations/") == 0.0
+    assert limiter.acquire(1, "POST", "/api/v1/reservations/") == 1.0
+    assert route_limiter.retry_after(1) == 0.0
@@ -0,0 +1,48 @@
+import json
+from datetime import date, time
+
+from fastapi.encoders import jsonable_encoder
+
+from app.common.constants import ReservationStatus
+from app.common.responses import FastJSONResponse
+from app.schemas.reservation_schema import ReservationListResponse, ReservationResponseListAdapter
+
+
+def test_fast_json_response_renders_same_json_as_default_encoder():
+    """
+    [Response] 검증된 응답 모델을 FastAPI 기본 직렬화와 동일한 JSON 으로 렌더링한다.
+    """
+    # given
+    reservations = ReservationResponseListAdapter.validate_python(
+        [
+            {
+                "id": 1,
+                "user_id": 1,
+                "exam_date": date(2024, 12, 1),
+                "exam_start_time": time(9, 0),
+                "exam_end_time": time(10, 0),
+                "applicants": 1000,
+                "status": ReservationStatus.CONFIRMED,
+            }
+        ]
+    )
+    response_model = ReservationListResponse.model_construct(reservations=reservations, next_cursor=None)
+
+    # when
+    response = FastJSONResponse(response_model, status_code=201)
+
+    # then
+    assert response.status_code == 201
+    assert response.headers["content-type"] == "application/json"
+    assert json.loads(response.body) == jsonable_encoder(response_model)
+
+
+def test_fast_json_response_renders_plain_content():
+    """
+    [Response] 모델이 아닌 값도 JSON 으로 렌더링한다.
+    """
+    # when
+    response = FastJSONResponse({"detail": "권한이 없습니다.", "date": date(2024, 12, 1)})
+
+    # then
+    assert json.loads(response.body) == {"detail": "권한이 없습니다.", "date": "2024-12-01"}
@@ -0,0 +1,51 @@
+from app.common.cache.ttl_cache import TTLCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_ttl_cache_hit_miss_and_expire():
+    """
+    [Cache] ttl 이내에는 캐시된 값을 반환하고, ttl 이 지나면 만료되며 hit/miss 를 집계한다.
+    """
+    # given
+    clock = FakeClock()
+    cache = TTLCache(max_size=10, ttl_seconds=2, clock=clock)
+
+    # when
+    first = cache.get("key")
+    cache.set("key", "value")
+    second = cache.get("key")
+    clock.now = 2
+    third = cache.get("key")
+
+    # then
+    assert (first, second, third) == (None, "value", None)
+    assert cache.stats() == {"hits": 1, "misses": 2, "size": 0, "hit_ratio": 1 / 3}
+
+
+def test_ttl_cache_evicts_least_recently_used_and_custom_ttl():
+    """
+    [Cache] 최대 크기를 넘으면 가장 오래 사용되지 않은 항목을 제거하고, 항목별 ttl 을 지정할 수 있다.
+    """
+    # given
+    clock = FakeClock()
+    cache = TTLCache(max_size=2, ttl_seconds=10, clock=clock)
+    cache.set("a", 1)
+    cache.set("b", 2, ttl_seconds=1)
+    cache.get("a")
+
+    # when
+    cache.set("c", 3)
+
+    # then
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    cache.invalidate("a")
+    assert cache.get("a") is None
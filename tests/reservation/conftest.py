@@ -13,11 +13,20 @@ from app.services.reservation_service import ReservationService
 def mock_reservation_repository(mocker):
     repository = mocker.Mock()
     repository.create_reservation_with_external_session = mocker.AsyncMock()
+    repository.bulk_create_reservations_with_external_session = mocker.AsyncMock()
     repository.get_reservations_by_user_id = mocker.AsyncMock()
     repository.get_reservations = mocker.AsyncMock()
+    repository.stream_reservations = mocker.Mock()
     repository.get_reservation_by_id_with_external_session = mocker.AsyncMock()
     repository.update_reservation_with_external_session = mocker.AsyncMock()
     repository.delete_reservation_with_external_session = mocker.AsyncMock()
+    repository.create_reservation_slots_with_external_session = mocker.AsyncMock()
+    repository.get_reservations_by_ids_with_external_session = mocker.AsyncMock()
+    repository.confirm_reservations_with_external_session = mocker.AsyncMock()
+    repository.confirm_reservation_pipelined_with_external_session = mocker.AsyncMock()
+    repository.bulk_create_reservation_slots_with_external_session = mocker.AsyncMock()
+    repository.get_expired_holds_with_external_session = mocker.AsyncMock()
+    repository.release_holds_with_external_session = mocker.AsyncMock(return_value=[])
     return repository
 
 
@@ -26,6 +35,20 @@ def mock_slot_repository(mocker):
     repository = mocker.Mock()
     repository.get_overlapping_slots_with_external_session = mocker.AsyncMock()
     repository.get_available_slots = mocker.AsyncMock()
+    repository.get_daily_capacity_summary = mocker.AsyncMock()
+    repository.decrement_remaining_capacity_with_external_session = mocker.AsyncMock()
+    repository.get_slots_by_dates_with_external_session = mocker.AsyncMock()
+    repository.update_remaining_capacities_with_external_session = mocker.AsyncMock()
+    repository.increment_remaining_capacities_with_external_session = mocker.AsyncMock()
+    return repository
+
+
+@pytest.fixture
+def mock_waitlist_repository(mocker):
+    repository = mocker.Mock()
+    repository.create_entry_with_external_session = mocker.AsyncMock()
+    repository.get_entry_by_id = mocker.AsyncMock()
+    repository.get_waiting_entries_with_external_session = mocker.AsyncMock(return_value=[])
     return repository
 
 
@@ -40,6 +63,7 @@ def mock_reservation(mocker):
         mock_res.exam_end_time = end_time
         mock_res.applicants = applicants
         mock_res.status = status
+        mock_res.hold_expires_at = None
         mock_res.slots = []
         return mock_res
 
@@ -71,6 +95,15 @@ def mock_user(mocker):
 def mock_settings(mocker):
     mock_settings = mocker.Mock(spec=Config)
     mock_settings.MAX_APPLICANTS = 50000
+    mock_settings.BULK_REQUEST_MAX_ITEMS = 100
+    mock_settings.AVAILABILITY_CALENDAR_MAX_DAYS = 62
+    mock_settings.RESERVATION_PAGE_DEFAULT_LIMIT = 50
+    mock_settings.RESERVATION_PAGE_MAX_LIMIT = 500
+    mock_settings.RESERVATION_EXPORT_CHUNK_SIZE = 2
+    mock_settings.RESERVATION_CONFIRM_PIPELINE_ENABLED = False
+    mock_settings.RESERVATION_HOLD_ENABLED = False
+    mock_settings.RESERVATION_HOLD_TTL_SECONDS = 900
+    mock_settings.WAITLIST_PROMOTION_BATCH_SIZE = 100
     return mock_settings
 
 
@@ -109,10 +142,12 @@ def reservation_service(
     mock_slot_repository,
     mock_settings,
     mock_session_factory,
+    mock_waitlist_repository,
 ):
     return ReservationService(
         repository=mock_reservation_repository,
         slot_repository=mock_slot_repository,
         settings=mock_settings,
         session_factory=mock_session_factory,
+        waitlist_repository=mock_waitlist_repository,
     )
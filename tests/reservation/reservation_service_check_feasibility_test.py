@@ -0,0 +1,89 @@
+from datetime import date, time, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from app.schemas.reservation_schema import FeasibilityCheckRequest, ReservationCreateRequest
+
+
+@pytest.mark.asyncio
+async def test_check_feasibility_success(mock_slot_repository, reservation_service):
+    """
+    [Reservation] 여러 시간대의 예약 가능 여부와 최소 남은 인원을 한 번에 확인할 수 있다.
+    """
+    # given
+    exam_date = date.today() + timedelta(days=5)
+    mock_slot_repository.get_slots_by_dates_with_external_session.return_value = [
+        SimpleNamespace(id=1, date=exam_date, start_time=time(9, 0), end_time=time(9, 30), remaining_capacity=40000),
+        SimpleNamespace(id=2, date=exam_date, start_time=time(9, 30), end_time=time(10, 0), remaining_capacity=500),
+        SimpleNamespace(id=3, date=exam_date, start_time=time(10, 0), end_time=time(10, 30), remaining_capacity=3000),
+    ]
+    input_data = FeasibilityCheckRequest(
+        items=[
+            ReservationCreateRequest(
+                exam_date=exam_date, exam_start_time=time(9, 0), exam_end_time=time(9, 15), applicants=1000
+            ),
+            ReservationCreateRequest(
+                exam_date=exam_date, exam_start_time=time(9, 0), exam_end_time=time(10, 0), applicants=1000
+            ),
+            ReservationCreateRequest(
+                exam_date=exam_date, exam_start_time=time(12, 0), exam_end_time=time(13, 0), applicants=1000
+            ),
+        ]
+    )
+
+    # when
+    result = await reservation_service.check_feasibility(input_data)
+
+    # then
+    mock_slot_repository.get_slots_by_dates_with_external_session.assert_called_once()
+    assert [item.is_feasible for item in result.results] == [True, False, False]
+    assert result.results[0].min_remaining_capacity == 40000
+    assert result.results[1].min_remaining_capacity == 500
+    assert result.results[2].detail == "겹치는 슬롯이 없습니다."
+
+
+@pytest.mark.asyncio
+async def test_check_feasibility_invalid_item(mock_slot_repository, reservation_service):
+    """
+    [Reservation] 입력값이 올바르지 않은 항목은 예약 불가능으로 반환하고 사유를 포함한다.
+    """
+    # given
+    mock_slot_repository.get_slots_by_dates_with_external_session.return_value = []
+    input_data = FeasibilityCheckRequest(
+        items=[
+            ReservationCreateRequest(
+                exam_date=date.today() + timedelta(days=1),
+                exam_start_time=time(9, 0),
+                exam_end_time=time(10, 0),
+                applicants=1000,
+            )
+        ]
+    )
+
+    # when
+    result = await reservation_service.check_feasibility(input_data)
+
+    # then
+    assert result.results[0].is_feasible is False
+    assert result.results[0].detail == "시험 날짜는 예약 신청일 기준 최소 3일 전이어야 합니다."
+
+
+@pytest.mark.asyncio
+async def test_check_feasibility_fail_too_many_items(mock_slot_repository, reservation_service):
+    """
+    [Reservation] 요청 항목 수가 최대 개수를 초과하면 ValueError 예외가 발생한다.
+    """
+    # given
+    item = ReservationCreateRequest(
+        exam_date=date.today() + timedelta(days=5), exam_start_time=time(9, 0), exam_end_time=time(10, 0), applicants=1
+    )
+    input_data = FeasibilityCheckRequest(items=[item] * 101)
+
+    # when
+    with pytest.raises(ValueError) as e:
+        await reservation_service.check_feasibility(input_data)
+
+    # then
+    assert isinstance(e.value, ValueError)
+    mock_slot_repository.get_slots_by_dates_with_external_session.assert_not_called()
@@ -0,0 +1,90 @@
+from datetime import date, time, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from app.common.constants import ReservationStatus, UserType
+from app.common.exceptions import AuthorizationError
+
+
+def make_reservation(reservation_id, exam_date, start_time, end_time, applicants, status=ReservationStatus.PENDING):
+    return SimpleNamespace(
+        id=reservation_id,
+        user_id=1,
+        exam_date=exam_date,
+        exam_start_time=start_time,
+        exam_end_time=end_time,
+        applicants=applicants,
+        status=status,
+        hold_expires_at=None,
+    )
+
+
+@pytest.mark.asyncio
+async def test_confirm_reservations_batch_success(
+    mock_reservation_repository,
+    mock_slot_repository,
+    reservation_service,
+):
+    """
+    [Reservation] 관리자는 여러 예약을 한 번에 확정할 수 있으며, 예약 id 순서대로 처리하고 예약별 결과를 반환한다.
+    """
+    # given
+    exam_date = date.today() + timedelta(days=5)
+    mock_reservation_repository.get_reservations_by_ids_with_external_session.return_value = [
+        make_reservation(1, exam_date, time(9, 0), time(9, 30), 600),
+        make_reservation(2, exam_date, time(9, 30), time(10, 0), 500),
+        make_reservation(3, exam_date, time(9, 0), time(9, 30), 100, ReservationStatus.CONFIRMED),
+        make_reservation(5, date.today() - timedelta(days=1), time(9, 0), time(9, 30), 100),
+        make_reservation(6, exam_date, time(9, 45), time(10, 0), 400),
+    ]
+    mock_slot_repository.get_slots_by_dates_with_external_session.return_value = [
+        SimpleNamespace(id=11, date=exam_date, start_time=time(9, 0), end_time=time(9, 30), remaining_capacity=1000),
+        SimpleNamespace(id=12, date=exam_date, start_time=time(9, 30), end_time=time(10, 0), remaining_capacity=1000),
+    ]
+
+    # when
+    result = await reservation_service.confirm_reservations_batch([6, 3, 1, 2, 4, 5, 1], UserType.ADMIN)
+
+    # then
+    assert result.confirmed_count == 2
+    assert [(item.reservation_id, item.is_success) for item in result.results] == [
+        (1, True),
+        (2, False),
+        (3, False),
+        (4, False),
+        (5, False),
+        (6, True),
+    ]
+    assert result.results[1].detail == "예약 불가능한 시간대입니다."
+    assert result.results[3].detail == "예약을 찾을 수 없습니다."
+    mock_reservation_repository.get_reservations_by_ids_with_external_session.assert_called_once()
+    assert mock_reservation_repository.get_reservations_by_ids_with_external_session.call_args.args[0] == [
+        1,
+        2,
+        3,
+        4,
+        5,
+        6,
+    ]
+    assert mock_slot_repository.update_remaining_capacities_with_external_session.call_args.args[0] == {11: 400, 12: 0}
+    assert mock_reservation_repository.confirm_reservations_with_external_session.call_args.args[0] == [1, 6]
+    assert mock_reservation_repository.bulk_create_reservation_slots_with_external_session.call_args.args[0] == [
+        {"reservation_id": 1, "slot_id": 11},
+        {"reservation_id": 1, "slot_id": 12},
+        {"reservation_id": 6, "slot_id": 12},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_confirm_reservations_batch_fail_not_admin(mock_reservation_repository, reservation_service):
+    """
+    [Reservation] 관리자가 아니면 예약을 일괄 확정할 수 없다(AuthorizationError)
+    """
+    # when
+    with pytest.raises(AuthorizationError) as e:
+        await reservation_service.confirm_reservations_batch([1, 2], UserType.USER.value)
+
+    # then
+    assert isinstance(e.value, AuthorizationError)
+    mock_reservation_repository.get_reservations_by_ids_with_external_session.assert_not_called()
@@ -0,0 +1,124 @@
+from datetime import date, datetime, time, timedelta
+
+import pytest
+from sqlalchemy import inspect
+
+from app.common.constants import ReservationStatus, UserType
+from app.common.database.models.reservation import Reservation
+from app.common.respository.reservation_repository import ReservationRepository
+
+
+@pytest.fixture
+def pending_reservation():
+    exam_date = date.today() + timedelta(days=5)
+    reservation = Reservation(
+        id=1,
+        user_id=1,
+        exam_date=exam_date,
+        exam_start_time=time(14, 0),
+        exam_end_time=time(15, 0),
+        applicants=30000,
+        status=ReservationStatus.PENDING,
+    )
+    return reservation
+
+
+@pytest.mark.asyncio
+async def test_confirm_reservations_pipelined_success(
+    mock_reservation_repository, mock_slot_repository, mock_settings, reservation_service, pending_reservation
+):
+    """
+    [Reservation] pipeline 모드에서는 슬롯 차감, 슬롯 연결, 상태 변경을 한 번에 요청하여 예약을 확정한다.
+    """
+    # given
+    mock_settings.RESERVATION_CONFIRM_PIPELINE_ENABLED = True
+    mock_reservation_repository.get_reservation_by_id_with_external_session.return_value = pending_reservation
+    mock_reservation_repository.confirm_reservation_pipelined_with_external_session.return_value = (2, [1, 2])
+
+    # when
+    result = await reservation_service.confirm_reservations(reservation_id=1, user_type=UserType.ADMIN)
+
+    # then
+    assert result.is_success
+    args = mock_reservation_repository.confirm_reservation_pipelined_with_external_session.call_args.args
+    assert args[:5] == (
+        1,
+        datetime.combine(pending_reservation.exam_date, time(14, 0)),
+        datetime.combine(pending_reservation.exam_date, time(15, 0)),
+        "[]",
+        30000,
+    )
+    assert pending_reservation.status == ReservationStatus.CONFIRMED
+    assert not inspect(pending_reservation).attrs.status.history.has_changes()
+    mock_slot_repository.get_overlapping_slots_with_external_session.assert_not_called()
+    mock_slot_repository.decrement_remaining_capacity_with_external_session.assert_not_called()
+    mock_reservation_repository.update_reservation_with_external_session.assert_not_called()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "pipeline_result, message",
+    [((0, []), "겹치는 슬롯이 없습니다."), ((2, [1]), "예약 불가능한 시간대입니다.")],
+)
+async def test_confirm_reservations_pipelined_fail(
+    mock_reservation_repository, mock_settings, reservation_service, pending_reservation, pipeline_result, message
+):
+    """
+    [Reservation] pipeline 모드에서 겹치는 슬롯이 없거나 일부 슬롯의 인원이 부족하면 ValueError 예외가 발생한다.
+    """
+    # given
+    mock_settings.RESERVATION_CONFIRM_PIPELINE_ENABLED = True
+    mock_reservation_repository.get_reservation_by_id_with_external_session.return_value = pending_reservation
+    mock_reservation_repository.confirm_reservation_pipelined_with_external_session.return_value = pipeline_result
+
+    # when
+    with pytest.raises(ValueError) as e:
+        await reservation_service.confirm_reservations(reservation_id=1, user_type=UserType.ADMIN)
+
+    # then
+    assert str(e.value) == message
+    assert pending_reservation.status == ReservationStatus.PENDING
+
+
+@pytest.mark.asyncio
+async def test_confirm_reservation_pipelined_sends_statements_in_one_pipeline(mocker):
+    """
+    [Reservation] 확정 구문 4개는 세션과 같은 커넥션에서 하나의 pipeline 으로 전송된다.
+    """
+    # given
+    events = []
+    count_cursor = mocker.Mock()
+    count_cursor.execute = mocker.AsyncMock(side_effect=lambda sql, params: events.append("count"))
+    count_cursor.fetchone = mocker.AsyncMock(return_value=(2,))
+    decrement_cursor = mocker.Mock()
+    decrement_cursor.execute = mocker.AsyncMock(side_effect=lambda sql, params: events.append("decrement"))
+    decrement_cursor.fetchall = mocker.AsyncMock(return_value=[(1,), (2,)])
+
+    class MockPipeline:
+        async def __aenter__(self):
+            events.append("pipeline start")
+
+        async def __aexit__(self, exc_type, exc_val, exc_tb):
+            events.append("pipeline sync")
+
+    driver_connection = mocker.Mock()
+    driver_connection.pipeline.return_value = MockPipeline()
+    driver_connection.cursor.side_effect = [count_cursor, decrement_cursor]
+    driver_connection.execute = mocker.AsyncMock(side_effect=lambda sql, params: events.append(sql.split()[0]))
+    connection = mocker.Mock()
+    connection.get_raw_connection = mocker.AsyncMock(return_value=mocker.Mock(driver_connection=driver_connection))
+    session = mocker.Mock()
+    session.connection = mocker.AsyncMock(return_value=connection)
+
+    # when
+    result = await ReservationRepository(session_factory=None).confirm_reservation_pipelined_with_external_session(
+        1, datetime(2024, 12, 1, 14, 0), datetime(2024, 12, 1, 15, 0), "[]", 30000, session
+    )
+
+    # then
+    assert result == (2, [1, 2])
+    assert events == ["pipeline start", "count", "decrement", "INSERT", "UPDATE", "pipeline sync"]
+    params = count_cursor.execute.call_args.args[1]
+    assert params["reservation_id"] == 1
+    assert params["applicants"] == 30000
+    assert params["status"] == "CONFIRMED"
@@ -8,6 +8,7 @@ from app.common.exceptions import AuthorizationError, BadRequestError, NotFoundE
 
 @pytest.mark.asyncio
 async def test_confirm_reservations_success(
+    mocker,
     mock_reservation_repository,
     reservation_service,
     mock_slot_repository,
@@ -33,6 +34,7 @@ async def test_confirm_reservations_success(
 
     mock_reservation_repository.get_reservation_by_id_with_external_session.return_value = reservation
     mock_slot_repository.get_overlapping_slots_with_external_session.return_value = [slot1, slot2]
+    mock_slot_repository.decrement_remaining_capacity_with_external_session.return_value = [1, 2]
     mock_reservation_repository.update_reservation_status_with_external_session.return_value = None
     mock_reservation_repository.update_reservation_with_external_session.return_value = None
 
@@ -41,6 +43,12 @@ async def test_confirm_reservations_success(
 
     # then
     assert result.is_success
+    assert reservation.status == ReservationStatus.CONFIRMED
+    mock_slot_repository.decrement_remaining_capacity_with_external_session.assert_called_once()
+    assert mock_slot_repository.decrement_remaining_capacity_with_external_session.call_args.args[3] == applicants
+    mock_reservation_repository.create_reservation_slots_with_external_session.assert_called_once_with(
+        reservation_id, [1, 2], mocker.ANY
+    )
 
 
 @pytest.mark.asyncio
@@ -222,3 +230,40 @@ async def test_confirm_reservations_fail_slot_remaining_applicants_not_enough(
 
         # then
     assert isinstance(e.value, ValueError)
+
+
+@pytest.mark.asyncio
+async def test_confirm_reservations_fail_slot_capacity_taken_concurrently(
+    mock_reservation_repository,
+    mock_slot_repository,
+    reservation_service,
+    mock_slot,
+    mock_reservation,
+):
+    """
+    [Reservation] 동시에 다른 확정이 먼저 인원을 차감하여 차감된 슬롯 수가 겹치는 슬롯 수보다 적으면 에러를 반환한다(ValueError)
+    """
+    # given
+    reservation_id = 1
+    user_type = UserType.ADMIN
+    exam_date = datetime.now() + timedelta(days=5)
+
+    reservation = mock_reservation(
+        reservation_id, 1, exam_date, time(14, 0), time(15, 0), 30000, ReservationStatus.PENDING
+    )
+    mock_reservation_repository.get_reservation_by_id_with_external_session.return_value = reservation
+    mock_slot_repository.get_overlapping_slots_with_external_session.return_value = [
+        mock_slot(1, exam_date, time(14, 0), time(14, 30), 40000),
+        mock_slot(2, exam_date, time(14, 30), time(15, 0), 40000),
+    ]
+    mock_slot_repository.decrement_remaining_capacity_with_external_session.return_value = [1]
+
+    # when
+    with pytest.raises(ValueError) as e:
+        await reservation_service.confirm_reservations(reservation_id=reservation_id, user_type=user_type)
+
+    # then
+    assert isinstance(e.value, ValueError)
+    assert reservation.status == ReservationStatus.PENDING
+    mock_reservation_repository.create_reservation_slots_with_external_session.assert_not_called()
+    mock_reservation_repository.update_reservation_with_external_session.assert_not_called()
@@ -1,9 +1,12 @@
 from datetime import date, datetime, time, timedelta
+from types import SimpleNamespace
 
 import pytest
 
+from app.common.cache.slot_index import SlotIndex
 from app.common.constants import ReservationStatus
 from app.schemas.reservation_schema import ReservationCreateRequest
+from app.services.reservation_service import ReservationService
 
 
 @pytest.mark.asyncio
@@ -250,3 +253,45 @@ async def test_create_reservation_success_when_overlapping_within_limit(
     assert reservation.exam_end_time == end_time
     assert reservation.applicants == applicants
     assert reservation.status == ReservationStatus.PENDING
+
+
+@pytest.mark.asyncio
+async def test_create_reservation_fail_rejected_by_slot_index_without_db(
+    mock_reservation_repository,
+    mock_slot_repository,
+    mock_settings,
+    mock_session_factory,
+):
+    """
+    [Reservation] 인메모리 슬롯 인덱스로 인원이 부족함을 알 수 있으면 DB 조회 없이 ValueError 예외가 발생한다.
+    """
+    # given
+    exam_date = date.today() + timedelta(days=5)
+    slot_index = SlotIndex(ttl_seconds=60)
+    slot_index.put_slots(
+        [
+            SimpleNamespace(
+                id=1, date=exam_date, start_time=time(9, 0), end_time=time(9, 30), remaining_capacity=40000
+            ),
+            SimpleNamespace(id=2, date=exam_date, start_time=time(9, 30), end_time=time(10, 0), remaining_capacity=500),
+        ]
+    )
+    reservation_service = ReservationService(
+        repository=mock_reservation_repository,
+        slot_repository=mock_slot_repository,
+        settings=mock_settings,
+        session_factory=mock_session_factory,
+        slot_index=slot_index,
+    )
+    input_data = ReservationCreateRequest(
+        exam_date=exam_date, exam_start_time=time(9, 0), exam_end_time=time(10, 0), applicants=1000
+    )
+
+    # when
+    with pytest.raises(ValueError) as e:
+        await reservation_service.create_reservation(input_data, user_id=1)
+
+    # then
+    assert isinstance(e.value, ValueError)
+    mock_slot_repository.get_overlapping_slots_with_external_session.assert_not_called()
+    mock_reservation_repository.create_reservation_with_external_session.assert_not_called()
@@ -0,0 +1,92 @@
+from datetime import date, time, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from app.common.constants import ReservationStatus
+from app.schemas.reservation_schema import ReservationBulkCreateRequest, ReservationCreateRequest
+
+
+@pytest.mark.asyncio
+async def test_create_reservations_bulk_success(
+    mock_reservation_repository,
+    mock_slot_repository,
+    reservation_service,
+):
+    """
+    [Reservation] 여러 예약을 한 번에 생성할 수 있으며, 항목별 성공/실패 결과를 반환한다.
+    """
+    # given
+    exam_date = date.today() + timedelta(days=5)
+    input_data = ReservationBulkCreateRequest(
+        reservations=[
+            ReservationCreateRequest(
+                exam_date=exam_date, exam_start_time=time(9, 0), exam_end_time=time(9, 15), applicants=1000
+            ),
+            ReservationCreateRequest(
+                exam_date=date.today(), exam_start_time=time(9, 0), exam_end_time=time(10, 0), applicants=1000
+            ),
+            ReservationCreateRequest(
+                exam_date=exam_date, exam_start_time=time(9, 0), exam_end_time=time(10, 0), applicants=1000
+            ),
+            ReservationCreateRequest(
+                exam_date=exam_date, exam_start_time=time(12, 0), exam_end_time=time(13, 0), applicants=1000
+            ),
+            ReservationCreateRequest(
+                exam_date=exam_date, exam_start_time=time(9, 40), exam_end_time=time(10, 0), applicants=300
+            ),
+        ]
+    )
+    mock_slot_repository.get_slots_by_dates_with_external_session.return_value = [
+        SimpleNamespace(id=1, date=exam_date, start_time=time(9, 0), end_time=time(9, 30), remaining_capacity=40000),
+        SimpleNamespace(id=2, date=exam_date, start_time=time(9, 30), end_time=time(10, 0), remaining_capacity=500),
+    ]
+    mock_reservation_repository.bulk_create_reservations_with_external_session.return_value = [
+        {
+            "id": reservation_id,
+            "user_id": 1,
+            "exam_date": exam_date,
+            "exam_start_time": start_time,
+            "exam_end_time": end_time,
+            "applicants": applicants,
+            "status": ReservationStatus.PENDING,
+        }
+        for reservation_id, start_time, end_time, applicants in [
+            (10, time(9, 0), time(9, 15), 1000),
+            (11, time(9, 40), time(10, 0), 300),
+        ]
+    ]
+
+    # when
+    result = await reservation_service.create_reservations_bulk(input_data, user_id=1)
+
+    # then
+    mock_slot_repository.get_slots_by_dates_with_external_session.assert_called_once()
+    mock_reservation_repository.bulk_create_reservations_with_external_session.assert_called_once()
+    created_rows = mock_reservation_repository.bulk_create_reservations_with_external_session.call_args.args[0]
+    assert [(row["exam_start_time"], row["applicants"]) for row in created_rows] == [
+        (time(9, 0), 1000),
+        (time(9, 40), 300),
+    ]
+    assert all(row["user_id"] == 1 and row["status"] == ReservationStatus.PENDING for row in created_rows)
+    assert result.created_count == 2
+    assert [item.is_success for item in result.results] == [True, False, False, False, True]
+    assert result.results[0].reservation.id == 10
+    assert result.results[4].reservation.id == 11
+    assert result.results[1].detail == "시험 날짜는 예약 신청일 기준 최소 3일 전이어야 합니다."
+    assert result.results[2].detail == "예약 불가능한 시간대입니다."
+    assert result.results[3].detail == "겹치는 슬롯이 없습니다."
+
+
+@pytest.mark.asyncio
+async def test_create_reservations_bulk_fail_empty(mock_reservation_repository, reservation_service):
+    """
+    [Reservation] 생성할 예약이 없으면 ValueError 예외가 발생한다.
+    """
+    # when
+    with pytest.raises(ValueError) as e:
+        await reservation_service.create_reservations_bulk(ReservationBulkCreateRequest(reservations=[]), user_id=1)
+
+    # then
+    assert isinstance(e.value, ValueError)
+    mock_reservation_repository.bulk_create_reservations_with_external_session.assert_not_called()
@@ -0,0 +1,92 @@
+import json
+from datetime import date, time
+
+import pytest
+
+from app.common.constants import ExportFormat, ReservationStatus, UserType
+from app.common.exceptions import AuthorizationError
+from app.schemas.reservation_schema import ReservationExportQuery
+
+ROWS = [
+    (1, 1, date(2024, 12, 1), time(9, 0), time(10, 0), 1000, ReservationStatus.CONFIRMED),
+    (2, 2, date(2024, 12, 1), time(11, 0), time(12, 0), 2000, ReservationStatus.PENDING),
+    (3, 1, date(2024, 12, 2), time(9, 0), time(9, 30), 500, ReservationStatus.PENDING),
+]
+
+
+def mock_stream(rows, chunk_size):
+    async def _stream(*args, **kwargs):
+        for i in range(0, len(rows), chunk_size):
+            yield rows[i : i + chunk_size]
+
+    return _stream
+
+
+async def collect(chunks):
+    return [chunk async for chunk in chunks]
+
+
+@pytest.mark.asyncio
+async def test_export_reservations_success_ndjson(mock_reservation_repository, reservation_service):
+    """
+    [Reservation] 어드민은 예약을 NDJSON 으로 내보낼 수 있으며, 서버 사이드 커서의 chunk 단위로 스트리밍된다
+    """
+    # given
+    mock_reservation_repository.stream_reservations.side_effect = mock_stream(ROWS, 2)
+
+    # when
+    chunks = await reservation_service.export_reservations(
+        UserType.ADMIN, ReservationExportQuery(format=ExportFormat.NDJSON, status=ReservationStatus.PENDING)
+    )
+    result = await collect(chunks)
+
+    # then
+    mock_reservation_repository.stream_reservations.assert_called_once_with(
+        2, status=ReservationStatus.PENDING, start_date=None, end_date=None
+    )
+    assert len(result) == 2
+    lines = "".join(result).splitlines()
+    assert json.loads(lines[0]) == {
+        "id": 1,
+        "user_id": 1,
+        "exam_date": "2024-12-01",
+        "exam_start_time": "09:00:00",
+        "exam_end_time": "10:00:00",
+        "applicants": 1000,
+        "status": "CONFIRMED",
+    }
+    assert [json.loads(line)["id"] for line in lines] == [1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_export_reservations_success_csv(mock_reservation_repository, reservation_service):
+    """
+    [Reservation] 어드민은 예약을 헤더가 포함된 CSV 로 내보낼 수 있다
+    """
+    # given
+    mock_reservation_repository.stream_reservations.side_effect = mock_stream(ROWS, 2)
+
+    # when
+    chunks = await reservation_service.export_reservations(
+        UserType.ADMIN, ReservationExportQuery(format=ExportFormat.CSV)
+    )
+    result = "".join(await collect(chunks)).splitlines()
+
+    # then
+    assert result[0] == "id,user_id,exam_date,exam_start_time,exam_end_time,applicants,status"
+    assert result[1] == "1,1,2024-12-01,09:00:00,10:00:00,1000,CONFIRMED"
+    assert len(result) == 4
+
+
+@pytest.mark.asyncio
+async def test_export_reservations_fail_not_admin(mock_reservation_repository, reservation_service):
+    """
+    [Reservation] 어드민이 아닌 유저는 예약을 내보낼 수 없다(권한 없음 에러 발생)
+    """
+    # when
+    with pytest.raises(AuthorizationError) as e:
+        await reservation_service.export_reservations(UserType.USER, ReservationExportQuery())
+
+    # then
+    assert isinstance(e.value, AuthorizationError)
+    mock_reservation_repository.stream_reservations.assert_not_called()
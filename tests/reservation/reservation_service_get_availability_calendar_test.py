@@ -0,0 +1,126 @@
+from datetime import date, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from app.common.cache.ttl_cache import TTLCache
+from app.services.reservation_service import ReservationService
+
+
+@pytest.mark.asyncio
+async def test_get_availability_calendar_success(mock_slot_repository, reservation_service):
+    """
+    [Reservation] 기간을 입력하면 날짜별 최소/최대 남은 인원과 예약 가능한 슬롯 수를 한 번의 조회로 확인할 수 있다.
+    """
+    # given
+    start_date = date.today() + timedelta(days=5)
+    end_date = start_date + timedelta(days=2)
+    mock_slot_repository.get_daily_capacity_summary.return_value = [
+        SimpleNamespace(
+            date=start_date,
+            min_remaining_capacity=0,
+            max_remaining_capacity=50000,
+            slot_count=18,
+            available_slot_count=17,
+        ),
+        SimpleNamespace(
+            date=end_date,
+            min_remaining_capacity=30000,
+            max_remaining_capacity=50000,
+            slot_count=18,
+            available_slot_count=18,
+        ),
+    ]
+
+    # when
+    result = await reservation_service.get_availability_calendar(start_date, end_date)
+
+    # then
+    mock_slot_repository.get_daily_capacity_summary.assert_called_once_with(start_date, end_date)
+    assert [day.date for day in result.days] == [start_date, start_date + timedelta(days=1), end_date]
+    assert result.days[0].min_remaining_capacity == 0
+    assert result.days[0].available_slot_count == 17
+    assert result.days[1].slot_count == 0
+    assert result.days[1].min_remaining_capacity is None
+    assert result.days[2].max_remaining_capacity == 50000
+
+
+@pytest.mark.asyncio
+async def test_get_availability_calendar_fail_by_range(mock_slot_repository, reservation_service):
+    """
+    [Reservation] 조회 기간이 최대 조회 일수를 넘으면 ValueError 예외가 발생한다.
+    """
+    # given
+    start_date = date.today() + timedelta(days=5)
+
+    # when
+    with pytest.raises(ValueError) as e:
+        await reservation_service.get_availability_calendar(start_date, start_date + timedelta(days=62))
+
+    # then
+    assert str(e.value) == "최대 62일까지 조회할 수 있습니다."
+    mock_slot_repository.get_daily_capacity_summary.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_availability_calendar_from_today(mock_slot_repository, reservation_service):
+    """
+    [Reservation] 조회 전용이므로 예약 신청 기한과 관계없이 오늘부터 조회할 수 있다.
+    """
+    # given
+    mock_slot_repository.get_daily_capacity_summary.return_value = []
+
+    # when
+    result = await reservation_service.get_availability_calendar(date.today(), date.today() + timedelta(days=1))
+
+    # then
+    assert [day.date for day in result.days] == [date.today(), date.today() + timedelta(days=1)]
+
+
+@pytest.mark.asyncio
+async def test_get_availability_calendar_fail_by_order(mock_slot_repository, reservation_service):
+    """
+    [Reservation] 시작 날짜가 종료 날짜보다 이후이면 ValueError 예외가 발생한다.
+    """
+    # given
+    start_date = date.today() + timedelta(days=5)
+
+    # when
+    with pytest.raises(ValueError, match="시작 날짜는 종료 날짜보다 이후일 수 없습니다."):
+        await reservation_service.get_availability_calendar(start_date, start_date - timedelta(days=1))
+
+    # then
+    mock_slot_repository.get_daily_capacity_summary.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_availability_calendar_cached_per_day(
+    mock_reservation_repository, mock_slot_repository, mock_settings, mock_session_factory
+):
+    """
+    [Reservation] 날짜별 집계는 캐시되며, 무효화된 날짜만 다시 조회한다.
+    """
+    # given
+    start_date = date.today() + timedelta(days=5)
+    end_date = start_date + timedelta(days=2)
+    reservation_service = ReservationService(
+        repository=mock_reservation_repository,
+        slot_repository=mock_slot_repository,
+        settings=mock_settings,
+        session_factory=mock_session_factory,
+        availability_cache=TTLCache(max_size=10, ttl_seconds=60),
+    )
+    mock_slot_repository.get_daily_capacity_summary.return_value = []
+    await reservation_service.get_availability_calendar(start_date, end_date)
+
+    # when
+    await reservation_service.get_availability_calendar(start_date, end_date)
+    reservation_service._invalidate_availability(start_date + timedelta(days=1))
+    result = await reservation_service.get_availability_calendar(start_date, end_date)
+
+    # then
+    assert mock_slot_repository.get_daily_capacity_summary.call_count == 2
+    mock_slot_repository.get_daily_capacity_summary.assert_called_with(
+        start_date + timedelta(days=1), start_date + timedelta(days=1)
+    )
+    assert len(result.days) == 3
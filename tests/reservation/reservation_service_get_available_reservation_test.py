@@ -1,7 +1,13 @@
 from datetime import date, time, timedelta
+from types import SimpleNamespace
 
 import pytest
 
+from app.common.cache.slot_index import SlotIndex
+from app.common.cache.ttl_cache import TTLCache
+from app.common.constants import ReservationStatus, UserType
+from app.services.reservation_service import ReservationService
+
 
 @pytest.mark.asyncio
 async def test_get_available_reservation_success(mock_slot_repository, reservation_service):
@@ -68,3 +74,90 @@ async def test_get_available_reservation_fail_by_no_available_slot(mock_slot_rep
     result = await reservation_service.get_available_reservation(exam_date)
     # then
     assert len(result.available_slots) == 0
+
+
+@pytest.mark.asyncio
+async def test_get_available_reservation_cached_until_capacity_changes(
+    mock_reservation_repository,
+    mock_slot_repository,
+    mock_settings,
+    mock_session_factory,
+    mock_reservation,
+):
+    """
+    [Reservation] 예약 가능 시간 조회 결과는 캐시되며, 해당 날짜의 예약이 확정되면 캐시가 무효화된다.
+    """
+    # given
+    exam_date = date.today() + timedelta(days=5)
+    availability_cache = TTLCache(max_size=10, ttl_seconds=60)
+    reservation_service = ReservationService(
+        repository=mock_reservation_repository,
+        slot_repository=mock_slot_repository,
+        settings=mock_settings,
+        session_factory=mock_session_factory,
+        availability_cache=availability_cache,
+    )
+    mock_slot_repository.get_available_slots.return_value = [
+        {
+            "id": 1,
+            "date": exam_date,
+            "start_time": time(hour=9, minute=0),
+            "end_time": time(hour=10, minute=0),
+            "remaining_capacity": 50000,
+        }
+    ]
+    mock_reservation_repository.get_reservation_by_id_with_external_session.return_value = mock_reservation(
+        1, 1, exam_date, time(9, 0), time(10, 0), 1000, ReservationStatus.PENDING
+    )
+    mock_slot_repository.get_overlapping_slots_with_external_session.return_value = [
+        SimpleNamespace(id=1, date=exam_date, start_time=time(9, 0), end_time=time(10, 0), remaining_capacity=50000)
+    ]
+    mock_slot_repository.decrement_remaining_capacity_with_external_session.return_value = [1]
+
+    # when
+    await reservation_service.get_available_reservation(exam_date)
+    await reservation_service.get_available_reservation(exam_date)
+    await reservation_service.confirm_reservations(1, UserType.ADMIN)
+    await reservation_service.get_available_reservation(exam_date)
+
+    # then
+    assert mock_slot_repository.get_available_slots.call_count == 2
+    stats = await reservation_service.get_availability_cache_stats(UserType.ADMIN)
+    assert stats.hits == 1
+    assert stats.misses == 2
+
+
+@pytest.mark.asyncio
+async def test_get_available_reservation_with_slot_index_and_one_shot_result(
+    mock_reservation_repository, mock_slot_repository, mock_settings, mock_session_factory
+):
+    """
+    [Reservation] 슬롯 인덱스를 사용할 때 조회 결과가 한 번만 순회 가능하더라도 인덱스와 응답 모두에 슬롯이 반영된다.
+    """
+    # given
+    exam_date = date.today() + timedelta(days=5)
+    slot_index = SlotIndex(ttl_seconds=60)
+    reservation_service = ReservationService(
+        repository=mock_reservation_repository,
+        slot_repository=mock_slot_repository,
+        settings=mock_settings,
+        session_factory=mock_session_factory,
+        slot_index=slot_index,
+    )
+    mock_slot_repository.get_available_slots.return_value = iter(
+        [
+            SimpleNamespace(
+                id=1, date=exam_date, start_time=time(9, 0), end_time=time(10, 0), remaining_capacity=50000
+            ),
+            SimpleNamespace(
+                id=2, date=exam_date, start_time=time(10, 0), end_time=time(11, 0), remaining_capacity=3000
+            ),
+        ]
+    )
+
+    # when
+    result = await reservation_service.get_available_reservation(exam_date)
+
+    # then
+    assert [slot.id for slot in result.available_slots] == [1, 2]
+    assert slot_index.get_min_remaining_capacity(exam_date, time(9, 0), time(11, 0)) == 3000
@@ -1,9 +1,13 @@
 from datetime import date, datetime, time, timedelta
 
 import pytest
+from sqlalchemy.dialects import postgresql
 
 from app.common.constants import ReservationStatus, UserType
 from app.common.exceptions import AuthorizationError
+from app.common.pagination import decode_cursor, encode_cursor
+from app.common.respository.reservation_repository import ReservationRepository
+from app.schemas.reservation_schema import ReservationListQuery
 
 
 @pytest.mark.asyncio
@@ -143,3 +147,86 @@ async def test_get_reservations_by_admin_success_empty(mock_reservation_reposito
 
     # then
     assert result.reservations == []
+
+
+@pytest.mark.asyncio
+async def test_get_reservations_by_admin_success_paginated(mock_reservation_repository, reservation_service):
+    """
+    [Reservation] 예약 목록은 (exam_date, id) 기준 keyset 페이지네이션으로 조회하며, 다음 페이지가 있으면 커서를 반환한다
+    """
+    # given
+    exam_date = date.today() + timedelta(days=5)
+    mock_reservation_repository.get_reservations.return_value = [
+        {
+            "id": reservation_id,
+            "user_id": 1,
+            "exam_date": exam_date,
+            "exam_start_time": time(10, 0),
+            "exam_end_time": time(11, 0),
+            "applicants": 1000,
+            "status": ReservationStatus.PENDING.value,
+        }
+        for reservation_id in (3, 4, 5)
+    ]
+    query = ReservationListQuery(limit=2, cursor=encode_cursor(exam_date, 2), status=ReservationStatus.PENDING)
+
+    # when
+    result = await reservation_service.get_reservations_by_admin(user_type=UserType.ADMIN, query=query)
+
+    # then
+    mock_reservation_repository.get_reservations.assert_called_once_with(
+        limit=3, after=(exam_date, 2), status=ReservationStatus.PENDING, start_date=None, end_date=None
+    )
+    assert [reservation.id for reservation in result.reservations] == [3, 4]
+    assert decode_cursor(result.next_cursor) == (exam_date, 4)
+
+
+@pytest.mark.asyncio
+async def test_get_reservations_by_user_success_last_page(mock_reservation_repository, reservation_service):
+    """
+    [Reservation] 마지막 페이지에서는 다음 커서를 반환하지 않으며, 요청 limit 은 최대값으로 제한된다
+    """
+    # given
+    mock_reservation_repository.get_reservations_by_user_id.return_value = []
+
+    # when
+    result = await reservation_service.get_reservations_by_user(user_id=1, query=ReservationListQuery(limit=100000))
+
+    # then
+    assert mock_reservation_repository.get_reservations_by_user_id.call_args.kwargs["limit"] == 501
+    assert result.reservations == []
+    assert result.next_cursor is None
+
+
+@pytest.mark.asyncio
+async def test_get_reservations_by_user_fail_invalid_cursor(mock_reservation_repository, reservation_service):
+    """
+    [Reservation] 유효하지 않은 커서로 조회하면 ValueError 예외가 발생한다
+    """
+    # when
+    with pytest.raises(ValueError) as e:
+        await reservation_service.get_reservations_by_user(user_id=1, query=ReservationListQuery(cursor="invalid"))
+
+    # then
+    assert str(e.value) == "유효하지 않은 커서입니다."
+    mock_reservation_repository.get_reservations_by_user_id.assert_not_called()
+
+
+def test_reservation_page_query_uses_keyset():
+    """
+    [Reservation] 예약 목록 쿼리는 OFFSET 없이 (exam_date, id) 비교와 LIMIT 으로 페이지를 조회한다
+    """
+    # given
+    repository = ReservationRepository(session_factory=None)
+
+    # when
+    query = repository._build_reservation_page_query(
+        limit=51, after=(date(2024, 12, 1), 10), status=None, start_date=None, end_date=None
+    )
+    sql = str(query.compile(dialect=postgresql.dialect()))
+
+    # then
+    assert "(reservations.exam_date, reservations.id) > (" in sql
+    assert "ORDER BY reservations.exam_date, reservations.id" in sql
+    assert "LIMIT" in sql
+    assert "OFFSET" not in sql
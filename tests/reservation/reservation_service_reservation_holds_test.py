@@ -0,0 +1,311 @@
+from datetime import date, datetime, time, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from app.common.cache.slot_index import SlotIndex
+from app.common.constants import ReservationStatus, UserType
+from app.schemas.reservation_schema import (
+    ReservationBulkCreateRequest,
+    ReservationCreateRequest,
+    ReservationUpdateRequest,
+)
+from app.services.reservation_hold_sweeper import ReservationHoldSweeper
+
+
+def slot(slot_id, start_time, end_time, remaining_capacity):
+    return SimpleNamespace(id=slot_id, start_time=start_time, end_time=end_time, remaining_capacity=remaining_capacity)
+
+
+@pytest.fixture
+def hold_enabled(mock_settings):
+    mock_settings.RESERVATION_HOLD_ENABLED = True
+
+
+@pytest.fixture
+def assign_reservation_id(mock_reservation_repository):
+    async def _create_reservation(reservation, session):
+        reservation.id = 1
+        return reservation
+
+    mock_reservation_repository.create_reservation_with_external_session.side_effect = _create_reservation
+
+
+@pytest.mark.asyncio
+async def test_create_reservation_holds_capacity(
+    hold_enabled,
+    assign_reservation_id,
+    reservation_service,
+    mock_reservation_repository,
+    mock_slot_repository,
+):
+    """
+    [Hold] 홀드를 사용하면 예약 생성 시 겹치는 슬롯의 인원을 차감하고 만료 시각을 기록한다.
+    """
+    # given
+    exam_date = date.today() + timedelta(days=5)
+    input_data = ReservationCreateRequest(
+        exam_date=exam_date, exam_start_time=time(9, 0), exam_end_time=time(10, 0), applicants=1000
+    )
+    mock_slot_repository.get_overlapping_slots_with_external_session.return_value = [
+        slot(1, time(9, 0), time(9, 30), 40000),
+        slot(2, time(9, 30), time(10, 0), 40000),
+    ]
+    mock_slot_repository.decrement_remaining_capacity_with_external_session.return_value = [1, 2]
+
+    # when
+    result = await reservation_service.create_reservation(input_data, user_id=1)
+
+    # then
+    assert result.status == ReservationStatus.PENDING
+    created = mock_reservation_repository.create_reservation_with_external_session.call_args.args[0]
+    assert created.hold_expires_at > datetime.now(timezone.utc) + timedelta(seconds=890)
+    mock_slot_repository.decrement_remaining_capacity_with_external_session.assert_awaited_once()
+    assert mock_slot_repository.decrement_remaining_capacity_with_external_session.call_args.args[3] == 1000
+    mock_reservation_repository.create_reservation_slots_with_external_session.assert_awaited_once()
+    assert mock_reservation_repository.create_reservation_slots_with_external_session.call_args.args[:2] == (1, [1, 2])
+
+
+@pytest.mark.asyncio
+async def test_create_reservation_fail_when_hold_capacity_taken_concurrently(
+    hold_enabled,
+    assign_reservation_id,
+    reservation_service,
+    mock_reservation_repository,
+    mock_slot_repository,
+):
+    """
+    [Hold] 동시에 다른 요청이 인원을 먼저 홀드하여 일부 슬롯만 차감되면 예약을 생성하지 않는다.
+    """
+    # given
+    exam_date = date.today() + timedelta(days=5)
+    input_data = ReservationCreateRequest(
+        exam_date=exam_date, exam_start_time=time(9, 0), exam_end_time=time(10, 0), applicants=1000
+    )
+    mock_slot_repository.get_overlapping_slots_with_external_session.return_value = [
+        slot(1, time(9, 0), time(9, 30), 40000),
+        slot(2, time(9, 30), time(10, 0), 40000),
+    ]
+    mock_slot_repository.decrement_remaining_capacity_with_external_session.return_value = [1]
+
+    # when
+    with pytest.raises(ValueError, match="예약 불가능한 시간대입니다."):
+        await reservation_service.create_reservation(input_data, user_id=1)
+
+    # then
+    mock_reservation_repository.create_reservation_slots_with_external_session.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_create_reservations_bulk_holds_capacity_in_request_order(
+    hold_enabled,
+    reservation_service,
+    mock_reservation_repository,
+    mock_slot_repository,
+):
+    """
+    [Hold] 홀드를 사용하면 일괄 생성은 슬롯을 잠그고, 뒤 항목은 앞 항목이 홀드한 인원을 제외하고 확인한다.
+    """
+    # given
+    exam_date = date.today() + timedelta(days=5)
+    item = ReservationCreateRequest(
+        exam_date=exam_date, exam_start_time=time(9, 0), exam_end_time=time(9, 15), applicants=1000
+    )
+    input_data = ReservationBulkCreateRequest(reservations=[item, item])
+    mock_slot_repository.get_slots_by_dates_with_external_session.return_value = [
+        SimpleNamespace(id=1, date=exam_date, start_time=time(9, 0), end_time=time(9, 30), remaining_capacity=1500),
+    ]
+    mock_reservation_repository.bulk_create_reservations_with_external_session.return_value = [
+        SimpleNamespace(
+            id=10,
+            user_id=1,
+            exam_date=exam_date,
+            exam_start_time=time(9, 0),
+            exam_end_time=time(9, 15),
+            applicants=1000,
+            status=ReservationStatus.PENDING,
+        )
+    ]
+
+    # when
+    result = await reservation_service.create_reservations_bulk(input_data, user_id=1)
+
+    # then
+    assert mock_slot_repository.get_slots_by_dates_with_external_session.call_args.kwargs["for_update"] is True
+    assert [item.is_success for item in result.results] == [True, False]
+    created_rows = mock_reservation_repository.bulk_create_reservations_with_external_session.call_args.args[0]
+    assert len(created_rows) == 1 and created_rows[0]["hold_expires_at"] is not None
+    mock_slot_repository.update_remaining_capacities_with_external_session.assert_awaited_once()
+    assert mock_slot_repository.update_remaining_capacities_with_external_session.call_args.args[0] == {1: 500}
+    reservation_slot_rows = mock_reservation_repository.bulk_create_reservation_slots_with_external_session.call_args
+    assert reservation_slot_rows.args[0] == [{"reservation_id": 10, "slot_id": 1}]
+
+
+@pytest.mark.asyncio
+async def test_confirm_held_reservation_does_not_decrement_again(
+    reservation_service,
+    mock_reservation_repository,
+    mock_slot_repository,
+    mock_reservation,
+):
+    """
+    [Hold] 홀드 중인 예약을 확정하면 인원을 다시 차감하지 않고 상태만 변경한다.
+    """
+    # given
+    reservation = mock_reservation(
+        1, 1, date.today() + timedelta(days=5), time(9, 0), time(10, 0), 1000, ReservationStatus.PENDING
+    )
+    reservation.hold_expires_at = datetime.now(timezone.utc) + timedelta(minutes=5)
+    mock_reservation_repository.get_reservation_by_id_with_external_session.return_value = reservation
+
+    # when
+    result = await reservation_service.confirm_reservations(1, UserType.ADMIN.value)
+
+    # then
+    assert result.is_success
+    assert reservation.status == ReservationStatus.CONFIRMED
+    assert reservation.hold_expires_at is None
+    mock_slot_repository.decrement_remaining_capacity_with_external_session.assert_not_called()
+    mock_reservation_repository.create_reservation_slots_with_external_session.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_delete_held_reservation_returns_capacity(
+    reservation_service,
+    mock_reservation_repository,
+    mock_slot_repository,
+    mock_reservation,
+    mocker,
+):
+    """
+    [Hold] 홀드 중인 PENDING 예약을 삭제하면 홀드한 인원을 반환한다.
+    """
+    # given
+    reservation = mock_reservation(
+        1, 1, date.today() + timedelta(days=5), time(9, 0), time(10, 0), 1000, ReservationStatus.PENDING
+    )
+    reservation.hold_expires_at = datetime.now(timezone.utc) + timedelta(minutes=5)
+    mock_reservation_repository.get_reservation_by_id_with_external_session.return_value = reservation
+    mock_reservation_repository.release_holds_with_external_session.return_value = [(1, 1), (1, 2)]
+
+    # when
+    await reservation_service.delete_reservation(1, 1, UserType.ADMIN.value)
+
+    # then
+    assert mock_reservation_repository.get_reservation_by_id_with_external_session.call_args.kwargs["for_update"]
+    mock_reservation_repository.release_holds_with_external_session.assert_awaited_once_with([1], mocker.ANY)
+    capacity_deltas = mock_slot_repository.increment_remaining_capacities_with_external_session.call_args.args[0]
+    assert capacity_deltas == {1: 1000, 2: 1000}
+    mock_slot_repository.get_overlapping_slots_with_external_session.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_release_expired_holds_returns_capacity_per_slot(
+    reservation_service,
+    mock_reservation_repository,
+    mock_slot_repository,
+):
+    """
+    [Hold] 만료된 홀드를 반환하면 슬롯별로 홀드된 인원의 합을 한 번에 되돌린다.
+    """
+    # given
+    exam_date = date.today() + timedelta(days=5)
+    mock_reservation_repository.get_expired_holds_with_external_session.return_value = [
+        SimpleNamespace(
+            id=1, exam_date=exam_date, exam_start_time=time(9, 0), exam_end_time=time(10, 0), applicants=100
+        ),
+        SimpleNamespace(
+            id=2, exam_date=exam_date, exam_start_time=time(9, 0), exam_end_time=time(10, 0), applicants=30
+        ),
+    ]
+    mock_reservation_repository.release_holds_with_external_session.return_value = [(1, 11), (1, 12), (2, 12)]
+
+    # when
+    released_count = await reservation_service.release_expired_holds(batch_size=10)
+
+    # then
+    assert released_count == 2
+    mock_reservation_repository.release_holds_with_external_session.assert_awaited_once()
+    assert mock_reservation_repository.release_holds_with_external_session.call_args.args[0] == [1, 2]
+    capacity_deltas = mock_slot_repository.increment_remaining_capacities_with_external_session.call_args.args[0]
+    assert dict(capacity_deltas) == {11: 100, 12: 130}
+
+
+@pytest.mark.asyncio
+async def test_release_expired_holds_promotes_waitlist_per_released_range(
+    reservation_service,
+    mock_reservation_repository,
+    mock_waitlist_repository,
+    mock_settings,
+    mocker,
+):
+    """
+    [Hold] 만료된 홀드를 반환하면 반환된 시간대별로 한 번씩 대기 항목 승격을 확인한다.
+    """
+    # given
+    exam_date = date.today() + timedelta(days=5)
+    mock_reservation_repository.get_expired_holds_with_external_session.return_value = [
+        SimpleNamespace(id=1, exam_date=exam_date, exam_start_time=time(9, 0), exam_end_time=time(10, 0), applicants=1),
+        SimpleNamespace(id=2, exam_date=exam_date, exam_start_time=time(9, 0), exam_end_time=time(10, 0), applicants=2),
+    ]
+    mock_reservation_repository.release_holds_with_external_session.return_value = [(1, 11), (2, 11)]
+
+    # when
+    await reservation_service.release_expired_holds(batch_size=10)
+
+    # then
+    mock_waitlist_repository.get_waiting_entries_with_external_session.assert_awaited_once_with(
+        exam_date, time(9, 0), time(10, 0), mock_settings.WAITLIST_PROMOTION_BATCH_SIZE, mocker.ANY
+    )
+
+
+@pytest.mark.asyncio
+async def test_update_held_reservation_applies_capacity_delta_to_slot_index_once(
+    hold_enabled,
+    reservation_service,
+    mock_reservation_repository,
+    mock_slot_repository,
+    mock_reservation,
+):
+    """
+    [Hold] 홀드 중인 예약의 인원을 수정하면 인메모리 인덱스에 반환/재홀드 변경분을 한 번씩만 반영한다.
+    """
+    # given
+    exam_date = date.today() + timedelta(days=5)
+    reservation = mock_reservation(1, 1, exam_date, time(9, 0), time(10, 0), 1000, ReservationStatus.PENDING)
+    reservation.hold_expires_at = datetime.now(timezone.utc) + timedelta(minutes=5)
+    mock_reservation_repository.get_reservation_by_id_with_external_session.return_value = reservation
+    mock_reservation_repository.release_holds_with_external_session.return_value = [(1, 1)]
+    # 트랜잭션 안에서는 반환된 인원이 반영된 값이 조회된다
+    mock_slot_repository.get_overlapping_slots_with_external_session.return_value = [
+        SimpleNamespace(id=1, date=exam_date, start_time=time(9, 0), end_time=time(10, 0), remaining_capacity=5000)
+    ]
+    mock_slot_repository.decrement_remaining_capacity_with_external_session.return_value = [1]
+    reservation_service.slot_index = SlotIndex(ttl_seconds=60)
+    reservation_service.slot_index.put_slots(
+        [SimpleNamespace(id=1, date=exam_date, start_time=time(9, 0), end_time=time(10, 0), remaining_capacity=4000)]
+    )
+
+    # when
+    await reservation_service.update_reservation(ReservationUpdateRequest(applicants=2000), 1, 1, UserType.USER)
+
+    # then
+    assert reservation_service.slot_index.get_remaining_capacity(exam_date, 1) == 3000
+
+
+@pytest.mark.asyncio
+async def test_hold_sweeper_releases_in_batches_until_drained(mocker):
+    """
+    [Hold] sweeper 는 만료된 홀드를 batch_size 건씩, 남은 건이 없을 때까지 반환한다.
+    """
+    # given
+    reservation_service = mocker.Mock()
+    reservation_service.release_expired_holds = mocker.AsyncMock(side_effect=[2, 2, 1])
+    sweeper = ReservationHoldSweeper(reservation_service, interval_seconds=30, batch_size=2)
+
+    # when
+    released_count = await sweeper.sweep()
+
+    # then
+    assert released_count == 5
+    assert reservation_service.release_expired_holds.await_count == 3
@@ -0,0 +1,225 @@
+from datetime import date, datetime, time, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+import app.main  # noqa: F401  모든 모델의 mapper 를 구성한다
+from app.common.constants import ReservationStatus, UserType, WaitlistStatus
+from app.common.database.models.waitlist import WaitlistEntry
+from app.common.exceptions import AuthorizationError, NotFoundError
+from app.schemas.reservation_schema import ReservationCreateRequest
+
+
+def slot(slot_id, start_time, end_time, remaining_capacity):
+    return SimpleNamespace(id=slot_id, start_time=start_time, end_time=end_time, remaining_capacity=remaining_capacity)
+
+
+def waitlist_entry(entry_id, exam_date, start_time, end_time, applicants):
+    return WaitlistEntry(
+        id=entry_id,
+        user_id=entry_id,
+        exam_date=exam_date,
+        exam_start_time=start_time,
+        exam_end_time=end_time,
+        applicants=applicants,
+        status=WaitlistStatus.WAITING,
+    )
+
+
+@pytest.fixture
+def assign_reservation_ids(mock_reservation_repository):
+    reservation_ids = iter(range(100, 200))
+
+    async def _create_reservation(reservation, session):
+        reservation.id = next(reservation_ids)
+        return reservation
+
+    mock_reservation_repository.create_reservation_with_external_session.side_effect = _create_reservation
+
+
+@pytest.fixture
+def assign_waitlist_ids(mock_waitlist_repository):
+    async def _create_entry(entry, session):
+        entry.id = 1
+        return entry
+
+    mock_waitlist_repository.create_entry_with_external_session.side_effect = _create_entry
+
+
+@pytest.mark.asyncio
+async def test_join_waitlist_enqueues_when_capacity_is_insufficient(
+    reservation_service,
+    mock_slot_repository,
+    mock_reservation_repository,
+    mock_waitlist_repository,
+    assign_waitlist_ids,
+):
+    """
+    [Waitlist] 인원이 부족한 시간대의 예약 요청은 대기열에 등록된다.
+    """
+    # given
+    exam_date = date.today() + timedelta(days=5)
+    input_data = ReservationCreateRequest(
+        exam_date=exam_date, exam_start_time=time(9, 0), exam_end_time=time(10, 0), applicants=1000
+    )
+    mock_slot_repository.get_overlapping_slots_with_external_session.return_value = [
+        slot(1, time(9, 0), time(9, 30), 500),
+        slot(2, time(9, 30), time(10, 0), 40000),
+    ]
+
+    # when
+    result = await reservation_service.join_waitlist(input_data, user_id=1)
+
+    # then
+    assert result.status == WaitlistStatus.WAITING
+    assert result.reservation_id is None
+    mock_waitlist_repository.create_entry_with_external_session.assert_awaited_once()
+    mock_reservation_repository.create_reservation_with_external_session.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_join_waitlist_promotes_immediately_when_capacity_is_available(
+    reservation_service,
+    mock_slot_repository,
+    assign_reservation_ids,
+    assign_waitlist_ids,
+):
+    """
+    [Waitlist] 등록 시점에 인원이 있으면 바로 PENDING 예약을 생성하고 승격된 항목을 반환한다.
+    """
+    # given
+    exam_date = date.today() + timedelta(days=5)
+    input_data = ReservationCreateRequest(
+        exam_date=exam_date, exam_start_time=time(9, 0), exam_end_time=time(10, 0), applicants=1000
+    )
+    mock_slot_repository.get_overlapping_slots_with_external_session.return_value = [
+        slot(1, time(9, 0), time(9, 30), 40000),
+    ]
+
+    # when
+    result = await reservation_service.join_waitlist(input_data, user_id=1)
+
+    # then
+    assert result.status == WaitlistStatus.PROMOTED
+    assert result.reservation_id == 100
+
+
+@pytest.mark.asyncio
+async def test_join_waitlist_fail_when_no_overlapping_slots(
+    reservation_service,
+    mock_slot_repository,
+    mock_waitlist_repository,
+):
+    """
+    [Waitlist] 슬롯이 없는 시간대는 대기열에 등록할 수 없다.
+    """
+    # given
+    exam_date = date.today() + timedelta(days=5)
+    input_data = ReservationCreateRequest(
+        exam_date=exam_date, exam_start_time=time(9, 0), exam_end_time=time(10, 0), applicants=1000
+    )
+    mock_slot_repository.get_overlapping_slots_with_external_session.return_value = []
+
+    # when
+    with pytest.raises(ValueError, match="겹치는 슬롯이 없습니다."):
+        await reservation_service.join_waitlist(input_data, user_id=1)
+
+    # then
+    mock_waitlist_repository.create_entry_with_external_session.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_delete_confirmed_reservation_promotes_waitlist_in_fifo_order(
+    reservation_service,
+    mock_reservation_repository,
+    mock_slot_repository,
+    mock_waitlist_repository,
+    mock_reservation,
+    assign_reservation_ids,
+):
+    """
+    [Waitlist] 확정 예약이 삭제되면 반환된 인원 안에서 대기 항목을 등록 순서대로 승격하고, 맞지 않는 항목은 남겨둔다.
+    """
+    # given
+    exam_date = (datetime.now() + timedelta(days=5)).date()
+    reservation = mock_reservation(
+        1, 1, exam_date, time(14, 0), time(15, 0), applicants=10, status=ReservationStatus.CONFIRMED
+    )
+    mock_reservation_repository.get_reservation_by_id_with_external_session.return_value = reservation
+    mock_reservation_repository.release_holds_with_external_session.return_value = [(1, 1), (1, 2)]
+    # 반환 UPDATE 이후 조회되는 남은 인원
+    slots = [slot(1, time(14, 0), time(14, 30), 15), slot(2, time(14, 30), time(15, 0), 30)]
+    mock_slot_repository.get_overlapping_slots_with_external_session.return_value = slots
+    entries = [
+        waitlist_entry(1, exam_date, time(14, 0), time(15, 0), applicants=20),
+        waitlist_entry(2, exam_date, time(14, 0), time(14, 30), applicants=10),
+        waitlist_entry(3, exam_date, time(14, 30), time(15, 0), applicants=5),
+        waitlist_entry(4, exam_date, time(14, 0), time(15, 0), applicants=6),
+    ]
+    mock_waitlist_repository.get_waiting_entries_with_external_session.return_value = entries
+
+    # when
+    await reservation_service.delete_reservation(1, 1, UserType.ADMIN.value)
+
+    # then
+    # 반환 후 남은 인원은 (15, 30) 이며 '[]' 범위이므로 경계가 맞닿은 슬롯도 겹치는 슬롯이다
+    assert [entry.status for entry in entries] == [
+        WaitlistStatus.WAITING,
+        WaitlistStatus.PROMOTED,
+        WaitlistStatus.PROMOTED,
+        WaitlistStatus.WAITING,
+    ]
+    assert [entry.reservation_id for entry in entries] == [None, 100, 101, None]
+    capacity_deltas = mock_slot_repository.increment_remaining_capacities_with_external_session.call_args.args[0]
+    assert capacity_deltas == {1: 10, 2: 10}
+    promoted = [
+        call.args[0] for call in mock_reservation_repository.create_reservation_with_external_session.call_args_list
+    ]
+    assert [(r.user_id, r.applicants, r.status) for r in promoted] == [
+        (2, 10, ReservationStatus.PENDING),
+        (3, 5, ReservationStatus.PENDING),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_delete_pending_reservation_does_not_promote_waitlist(
+    reservation_service,
+    mock_reservation_repository,
+    mock_waitlist_repository,
+    mock_reservation,
+):
+    """
+    [Waitlist] 확정되지 않은 예약은 인원을 반환하지 않으므로 대기열을 확인하지 않는다.
+    """
+    # given
+    exam_date = (datetime.now() + timedelta(days=5)).date()
+    reservation = mock_reservation(
+        1, 1, exam_date, time(14, 0), time(15, 0), applicants=10, status=ReservationStatus.PENDING
+    )
+    mock_reservation_repository.get_reservation_by_id_with_external_session.return_value = reservation
+
+    # when
+    await reservation_service.delete_reservation(1, 1, UserType.ADMIN.value)
+
+    # then
+    mock_waitlist_repository.get_waiting_entries_with_external_session.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_waitlist_entry_validates_owner(reservation_service, mock_waitlist_repository):
+    """
+    [Waitlist] 대기 항목은 본인 또는 관리자만 조회할 수 있다.
+    """
+    # given
+    entry = waitlist_entry(1, date.today(), time(9, 0), time(10, 0), applicants=10)
+    mock_waitlist_repository.get_entry_by_id.return_value = entry
+
+    # then
+    assert (await reservation_service.get_waitlist_entry(1, 1, UserType.USER.value)).id == 1
+    assert (await reservation_service.get_waitlist_entry(1, 2, UserType.ADMIN.value)).id == 1
+    with pytest.raises(AuthorizationError):
+        await reservation_service.get_waitlist_entry(1, 2, UserType.USER.value)
+
+    mock_waitlist_repository.get_entry_by_id.return_value = None
+    with pytest.raises(NotFoundError):
+        await reservation_service.get_waitlist_entry(1, 1, UserType.USER.value)
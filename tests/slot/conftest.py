@@ -0,0 +1,55 @@
+# https://docs.pytest.org/en/stable/how-to/fixtures.html
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import Config
+from app.services.slot_service import SlotService
+
+
+@pytest.fixture
+def mock_slot_repository(mocker):
+    repository = mocker.Mock()
+    repository.bulk_create_slots_with_external_session = mocker.AsyncMock()
+    return repository
+
+
+@pytest.fixture
+def mock_settings(mocker):
+    mock_settings = mocker.Mock(spec=Config)
+    mock_settings.MAX_APPLICANTS = 50000
+    mock_settings.SLOT_GENERATION_MAX_DAYS = 366
+    return mock_settings
+
+
+@pytest.fixture
+def mock_session_factory(mocker):
+    mock_session = mocker.AsyncMock(spec=AsyncSession)
+
+    class MockTransaction:
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, exc_type, exc_val, exc_tb):
+            pass
+
+    class MockSessionContextManager:
+        async def __aenter__(self):
+            return mock_session
+
+        async def __aexit__(self, exc_type, exc_val, exc_tb):
+            pass
+
+    mock_session.begin = mocker.Mock(return_value=MockTransaction())
+    mock_session_factory = mocker.Mock()
+    mock_session_factory.return_value = MockSessionContextManager()
+
+    return mock_session_factory
+
+
+@pytest.fixture
+def slot_service(mock_slot_repository, mock_settings, mock_session_factory):
+    return SlotService(
+        slot_repository=mock_slot_repository,
+        settings=mock_settings,
+        session_factory=mock_session_factory,
+    )
@@ -0,0 +1,135 @@
+from datetime import date, time
+from random import Random
+from types import SimpleNamespace
+
+from app.common.cache.slot_index import SlotIndex
+
+EXAM_DATE = date(2024, 12, 1)
+
+
+def make_slot(slot_id, start_time, end_time, remaining_capacity, slot_date=EXAM_DATE):
+    return SimpleNamespace(
+        id=slot_id, date=slot_date, start_time=start_time, end_time=end_time, remaining_capacity=remaining_capacity
+    )
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_get_min_remaining_capacity_overlapping_slots():
+    """
+    [Slot] 인덱스는 겹치는 슬롯('[]' 범위) 중 최소 남은 인원을 반환한다.
+    """
+    # given
+    slot_index = SlotIndex(ttl_seconds=5)
+    slot_index.put_slots(
+        [
+            make_slot(3, time(10, 0), time(10, 30), 100),
+            make_slot(1, time(9, 0), time(9, 30), 500),
+            make_slot(2, time(9, 30), time(10, 0), 300),
+        ]
+    )
+
+    # when / then
+    assert slot_index.get_min_remaining_capacity(EXAM_DATE, time(9, 0), time(9, 15)) == 500
+    assert slot_index.get_min_remaining_capacity(EXAM_DATE, time(9, 0), time(9, 30)) == 300
+    assert slot_index.get_min_remaining_capacity(EXAM_DATE, time(9, 40), time(10, 0)) == 100
+    assert slot_index.get_min_remaining_capacity(EXAM_DATE, time(11, 0), time(12, 0)) is None
+    assert slot_index.get_min_remaining_capacity(date(2024, 12, 2), time(9, 0), time(10, 0)) is None
+
+
+def test_get_min_remaining_capacity_not_disjoint_slots():
+    """
+    [Slot] 슬롯끼리 겹치더라도 겹치는 슬롯을 모두 찾아 최소 남은 인원을 반환한다.
+    """
+    # given
+    slot_index = SlotIndex(ttl_seconds=5)
+    slot_index.put_slots([make_slot(1, time(9, 0), time(12, 0), 50), make_slot(2, time(10, 0), time(10, 30), 500)])
+
+    # when / then
+    assert slot_index.get_min_remaining_capacity(EXAM_DATE, time(11, 0), time(11, 30)) == 50
+    assert slot_index.get_min_remaining_capacity(EXAM_DATE, time(12, 30), time(13, 0)) is None
+
+
+def test_apply_capacity_delta_and_expire():
+    """
+    [Slot] 차감/복구 결과가 반영되며, ttl 이 지나면 DB 에서 다시 조회하도록 None 을 반환한다.
+    """
+    # given
+    clock = FakeClock()
+    slot_index = SlotIndex(ttl_seconds=5, clock=clock)
+    slot_index.put_slots([make_slot(1, time(9, 0), time(9, 30), 500), make_slot(2, time(9, 30), time(10, 0), 300)])
+
+    # when
+    slot_index.apply_capacity_delta(EXAM_DATE, [1, 2], -200)
+
+    # then
+    assert slot_index.get_min_remaining_capacity(EXAM_DATE, time(9, 0), time(10, 0)) == 100
+    clock.now = 5
+    assert slot_index.get_min_remaining_capacity(EXAM_DATE, time(9, 0), time(10, 0)) is None
+
+
+def test_get_min_remaining_capacity_matches_brute_force_after_updates():
+    """
+    [Slot] 세그먼트 트리로 조회한 구간 최소값은 갱신 이후에도 전체 탐색 결과와 같다.
+    """
+    # given
+    random = Random(0)
+    slots = [
+        make_slot(
+            slot_id, time(slot_id // 2, (slot_id % 2) * 30), time((slot_id + 1) // 2, ((slot_id + 1) % 2) * 30), 0
+        )
+        for slot_id in range(47)
+    ]
+    capacities = {slot.id: random.randint(0, 50000) for slot in slots}
+    slot_index = SlotIndex(ttl_seconds=60)
+    slot_index.put_slots(
+        [make_slot(slot.id, slot.start_time, slot.end_time, capacities[slot.id]) for slot in reversed(slots)]
+    )
+
+    for _ in range(200):
+        # when
+        slot_id = random.randrange(len(slots))
+        delta = random.randint(-1000, 1000)
+        capacities[slot_id] += delta
+        slot_index.apply_capacity_delta(EXAM_DATE, [slot_id], delta)
+        start, end = sorted(random.sample(range(len(slots)), 2))
+
+        # then
+        expected = min(
+            capacities[slot.id]
+            for slot in slots
+            if slot.start_time <= slots[end].start_time and slot.end_time >= slots[start].start_time
+        )
+        assert (
+            slot_index.get_min_remaining_capacity(EXAM_DATE, slots[start].start_time, slots[end].start_time) == expected
+        )
+
+
+def test_put_slots_merges_new_slots_with_existing():
+    """
+    [Slot] 이미 있는 슬롯은 남은 인원만 갱신하고, 새 슬롯은 기존 슬롯과 시작 시간 순서로 합쳐진다.
+    """
+    # given
+    slot_index = SlotIndex(ttl_seconds=5)
+    slot_index.put_slots([make_slot(2, time(9, 30), time(10, 0), 300), make_slot(4, time(10, 30), time(11, 0), 400)])
+    slot_index.apply_capacity_delta(EXAM_DATE, [4], -100)
+
+    # when
+    slot_index.put_slots(
+        [
+            make_slot(3, time(10, 0), time(10, 30), 200),
+            make_slot(2, time(9, 30), time(10, 0), 250),
+            make_slot(1, time(9, 0), time(9, 30), 100),
+        ]
+    )
+
+    # then
+    assert slot_index.get_overlapping_slot_ids(EXAM_DATE, time(9, 0), time(11, 0)) == [1, 2, 3, 4]
+    assert [slot_index.get_remaining_capacity(EXAM_DATE, slot_id) for slot_id in (1, 2, 3, 4)] == [100, 250, 200, 300]
+    assert slot_index.get_min_remaining_capacity(EXAM_DATE, time(9, 40), time(11, 0)) == 200
@@ -0,0 +1,111 @@
+import asyncio
+from datetime import date
+
+import pytest
+
+from app.common.cache.single_flight import SingleFlight
+from app.common.respository.slot_repository import SlotRepository
+
+
+@pytest.fixture
+def mock_query_session_factory(mocker):
+    release = asyncio.Event()
+    mock_session = mocker.Mock()
+
+    async def execute(_stmt):
+        await release.wait()
+        result = mocker.Mock()
+        result.all.return_value = ["slot"]
+        return result
+
+    mock_session.execute = mocker.AsyncMock(side_effect=execute)
+
+    class MockSessionContextManager:
+        async def __aenter__(self):
+            return mock_session
+
+        async def __aexit__(self, exc_type, exc_val, exc_tb):
+            pass
+
+    mock_session_factory = mocker.Mock(side_effect=lambda: MockSessionContextManager())
+    mock_session_factory.release = release
+    mock_session_factory.session = mock_session
+    return mock_session_factory
+
+
+@pytest.mark.asyncio
+async def test_get_available_slots_coalesces_concurrent_queries(mock_query_session_factory):
+    """
+    [Slot] 같은 날짜에 대한 동시 조회는 하나의 쿼리 결과를 공유한다.
+    """
+    # given
+    single_flight = SingleFlight()
+    repository = SlotRepository(session_factory=mock_query_session_factory, single_flight=single_flight)
+
+    # when
+    tasks = [asyncio.ensure_future(repository.get_available_slots(date(2024, 12, 1))) for _ in range(50)]
+    other_date_task = asyncio.ensure_future(repository.get_available_slots(date(2024, 12, 2)))
+    await asyncio.sleep(0)
+    mock_query_session_factory.release.set()
+    results = await asyncio.gather(*tasks, other_date_task)
+
+    # then
+    assert all(result == ["slot"] for result in results)
+    assert mock_query_session_factory.session.execute.call_count == 2
+    assert single_flight.calls == 2
+    assert single_flight.coalesced == 49
+
+    # 진행 중인 쿼리가 끝나면 다음 조회는 새로 쿼리한다
+    await repository.get_available_slots(date(2024, 12, 1))
+    assert mock_query_session_factory.session.execute.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_get_available_slots_shares_error_and_survives_cancel(mock_query_session_factory):
+    """
+    [Slot] 먼저 요청한 조회가 취소되어도 나머지 조회는 결과를 받고, 쿼리 실패는 모든 조회에 전달된다.
+    """
+    # given
+    repository = SlotRepository(session_factory=mock_query_session_factory, single_flight=SingleFlight())
+    leader = asyncio.ensure_future(repository.get_available_slots(date(2024, 12, 1)))
+    await asyncio.sleep(0)
+    follower = asyncio.ensure_future(repository.get_available_slots(date(2024, 12, 1)))
+    await asyncio.sleep(0)
+
+    # when
+    leader.cancel()
+    mock_query_session_factory.release.set()
+
+    # then
+    assert await follower == ["slot"]
+
+    mock_query_session_factory.session.execute.side_effect = RuntimeError("db error")
+    results = await asyncio.gather(
+        repository.get_available_slots(date(2024, 12, 1)),
+        repository.get_available_slots(date(2024, 12, 1)),
+        return_exceptions=True,
+    )
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_get_available_slots_selects_only_response_columns(mock_query_session_factory):
+    """
+    [Slot] 예약 가능 슬롯 조회는 ORM 엔티티 대신 응답에 필요한 컬럼만 조회한다.
+    """
+    # given
+    repository = SlotRepository(session_factory=mock_query_session_factory)
+    mock_query_session_factory.release.set()
+
+    # when
+    await repository.get_available_slots(date(2024, 12, 1))
+    stmt = mock_query_session_factory.session.execute.call_args.args[0]
+
+    # then
+    assert [column.name for column in stmt.selected_columns] == [
+        "id",
+        "date",
+        "start_time",
+        "end_time",
+        "remaining_capacity",
+    ]
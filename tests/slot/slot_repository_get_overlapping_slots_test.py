@@ -0,0 +1,113 @@
+from datetime import datetime
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import Session, make_transient_to_detached, raiseload, selectinload
+
+import app.main  # noqa: F401  모든 모델의 mapper 를 구성한다
+from app.common.database.models.reservation import Reservation
+from app.common.database.models.slot import Slot
+from app.common.respository.slot_repository import SlotRepository
+
+
+def same_query_with_loader(stmt, loader_option):
+    return select(Slot).where(stmt.whereclause).options(loader_option)
+
+
+def persistent_without_bind(instance):
+    """DB 연결 없이 세션에 속한(persistent) 인스턴스를 만든다. 지연 로딩 시 SQL 이 필요해진다"""
+    make_transient_to_detached(instance)
+    Session().add(instance)
+    return instance
+
+
+@pytest.fixture
+def mock_execute_session(mocker):
+    session = mocker.Mock()
+    result = mocker.Mock()
+    result.scalars.return_value.all.return_value = []
+    session.execute = mocker.AsyncMock(return_value=result)
+    return session
+
+
+@pytest.mark.asyncio
+async def test_get_overlapping_slots_loads_only_slot_rows(mock_execute_session):
+    """
+    [Slot] 인원 확인용 겹치는 슬롯 조회는 slots 테이블만 조회하며, 연관 예약을 로딩하지 않는다.
+    """
+    # given
+    repository = SlotRepository(session_factory=None)
+
+    # when
+    await repository.get_overlapping_slots_with_external_session(
+        datetime(2024, 12, 1, 9, 0), datetime(2024, 12, 1, 10, 0), "[]", mock_execute_session
+    )
+    stmt = mock_execute_session.execute.call_args.args[0]
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+
+    # then
+    assert "FROM slots" in sql
+    assert "JOIN" not in sql
+    assert "reservation" not in sql
+    assert stmt.compare(same_query_with_loader(stmt, raiseload(Slot.reservations)))
+    assert not stmt.compare(same_query_with_loader(stmt, selectinload(Slot.reservations)))
+
+
+def test_slot_reservation_relationships_raise_on_lazy_load():
+    """
+    [Slot] 슬롯과 예약 간 relationship 은 지연 로딩 SQL 을 발생시키지 않고 예외를 던진다.
+    """
+    # given
+    slot = persistent_without_bind(Slot(id=1))
+    reservation = persistent_without_bind(Reservation(id=1))
+
+    # when / then
+    with pytest.raises(InvalidRequestError, match="raise_on_sql"):
+        slot.reservations
+    with pytest.raises(InvalidRequestError, match="raise_on_sql"):
+        reservation.slots
+
+
+@pytest.mark.asyncio
+async def test_get_overlapping_slots_eager_loads_reservations_when_requested(mock_execute_session):
+    """
+    [Slot] 연관 예약이 필요한 경우에만 selectinload 로 로딩한다.
+    """
+    # given
+    repository = SlotRepository(session_factory=None)
+
+    # when
+    await repository.get_overlapping_slots_with_external_session(
+        datetime(2024, 12, 1, 9, 0), datetime(2024, 12, 1, 10, 0), "[]", mock_execute_session, with_reservations=True
+    )
+    stmt = mock_execute_session.execute.call_args.args[0]
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+
+    # then
+    assert "JOIN" not in sql
+    assert stmt.compare(same_query_with_loader(stmt, selectinload(Slot.reservations)))
+    assert not stmt.compare(same_query_with_loader(stmt, raiseload(Slot.reservations)))
+
+
+@pytest.mark.asyncio
+async def test_get_overlapping_slots_reuses_prebuilt_statement(mock_execute_session):
+    """
+    [Slot] 겹치는 슬롯 조회 구문은 한 번만 생성하여 재사용하고, 시간대는 바인드 파라미터로 전달한다.
+    """
+    # given
+    repository = SlotRepository(session_factory=None)
+    start_time = datetime(2024, 12, 1, 9, 0)
+    end_time = datetime(2024, 12, 1, 10, 0)
+
+    # when
+    await repository.get_overlapping_slots_with_external_session(start_time, end_time, "[]", mock_execute_session)
+    await repository.get_overlapping_slots_with_external_session(
+        datetime(2024, 12, 2, 9, 0), datetime(2024, 12, 2, 10, 0), "[)", mock_execute_session
+    )
+    first_call, second_call = mock_execute_session.execute.call_args_list
+
+    # then
+    assert first_call.args[0] is second_call.args[0]
+    assert first_call.args[1] == {"start_time": start_time, "end_time": end_time, "range_type": "[]"}
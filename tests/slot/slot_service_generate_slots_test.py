@@ -0,0 +1,112 @@
+from datetime import date, datetime, time, timezone
+
+import pytest
+
+from app.common.constants import UserType
+from app.common.exceptions import AuthorizationError
+from app.schemas.slot_schema import SlotGenerateRequest
+
+
+@pytest.mark.asyncio
+async def test_generate_slots_success(slot_service, mock_slot_repository):
+    """
+    [Slot] 관리자는 기간과 간격을 입력하여 슬롯을 일괄 생성할 수 있다.
+    """
+    # given
+    input_data = SlotGenerateRequest(
+        start_date=date(2024, 12, 1),
+        end_date=date(2024, 12, 2),
+        start_time=time(9, 0),
+        end_time=time(18, 0),
+        interval_minutes=30,
+    )
+    mock_slot_repository.bulk_create_slots_with_external_session.return_value = 36
+
+    # when
+    result = await slot_service.generate_slots(input_data, UserType.ADMIN.value)
+
+    # then
+    slots = mock_slot_repository.bulk_create_slots_with_external_session.call_args.args[0]
+    assert len(slots) == 36
+    assert slots[0]["date"] == date(2024, 12, 1)
+    assert slots[0]["start_time"] == time(9, 0)
+    assert slots[0]["end_time"] == time(9, 30)
+    assert slots[0]["time_range"].lower == datetime(2024, 12, 1, 9, 0, tzinfo=timezone.utc)
+    assert slots[0]["time_range"].upper == datetime(2024, 12, 1, 9, 30, tzinfo=timezone.utc)
+    assert slots[0]["time_range"].bounds == "[]"
+    assert slots[0]["remaining_capacity"] == 50000
+    assert slots[-1]["date"] == date(2024, 12, 2)
+    assert slots[-1]["end_time"] == time(18, 0)
+    assert result.requested_count == 36
+    assert result.created_count == 36
+    assert result.skipped_count == 0
+
+
+@pytest.mark.asyncio
+async def test_generate_slots_success_skip_existing_slots(slot_service, mock_slot_repository):
+    """
+    [Slot] 이미 존재하는 슬롯은 건너뛰고 건너뛴 개수를 반환한다.
+    """
+    # given
+    input_data = SlotGenerateRequest(
+        start_date=date(2024, 12, 1),
+        end_date=date(2024, 12, 1),
+        start_time=time(9, 0),
+        end_time=time(10, 0),
+        interval_minutes=20,
+        capacity=1000,
+    )
+    mock_slot_repository.bulk_create_slots_with_external_session.return_value = 1
+
+    # when
+    result = await slot_service.generate_slots(input_data, UserType.ADMIN)
+
+    # then
+    slots = mock_slot_repository.bulk_create_slots_with_external_session.call_args.args[0]
+    assert [slot["start_time"] for slot in slots] == [time(9, 0), time(9, 20), time(9, 40)]
+    assert all(slot["remaining_capacity"] == 1000 for slot in slots)
+    assert result.created_count == 1
+    assert result.skipped_count == 2
+
+
+@pytest.mark.asyncio
+async def test_generate_slots_fail_not_admin(slot_service, mock_slot_repository):
+    """
+    [Slot] 관리자가 아니면 슬롯을 생성할 수 없다(AuthorizationError)
+    """
+    # given
+    input_data = SlotGenerateRequest(start_date=date(2024, 12, 1), end_date=date(2024, 12, 1))
+
+    # when
+    with pytest.raises(AuthorizationError) as e:
+        await slot_service.generate_slots(input_data, UserType.USER.value)
+
+    # then
+    assert isinstance(e.value, AuthorizationError)
+    mock_slot_repository.bulk_create_slots_with_external_session.assert_not_called()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "input_data",
+    [
+        SlotGenerateRequest(start_date=date(2024, 12, 2), end_date=date(2024, 12, 1)),
+        SlotGenerateRequest(start_date=date(2024, 1, 1), end_date=date(2025, 1, 1)),
+        SlotGenerateRequest(
+            start_date=date(2024, 12, 1), end_date=date(2024, 12, 1), start_time=time(18, 0), end_time=time(9, 0)
+        ),
+        SlotGenerateRequest(start_date=date(2024, 12, 1), end_date=date(2024, 12, 1), interval_minutes=0),
+        SlotGenerateRequest(start_date=date(2024, 12, 1), end_date=date(2024, 12, 1), capacity=60000),
+    ],
+)
+async def test_generate_slots_fail_invalid_input(slot_service, mock_slot_repository, input_data):
+    """
+    [Slot] 기간, 시간, 간격, 수용 인원이 올바르지 않으면 ValueError 예외가 발생한다.
+    """
+    # when
+    with pytest.raises(ValueError) as e:
+        await slot_service.generate_slots(input_data, UserType.ADMIN)
+
+    # then
+    assert isinstance(e.value, ValueError)
+    mock_slot_repository.bulk_create_slots_with_external_session.assert_not_called()